@@ -0,0 +1,181 @@
+# algorithms/alt.py
+"""
+ALT: A* with landmarks and the triangle inequality (Goldberg & Harrelson, 2005).
+
+Preprocessing picks k landmarks and stores exact distances from every landmark L (and, on
+directed graphs, to L) for all vertices: 8 bytes per vertex, landmark and direction. For
+any v and target t
+    d(v, t) >= d(L, t) - d(L, v)        d(v, t) >= d(v, L) - d(t, L)
+and the largest of these bounds is a consistent heuristic for astar(). A query only uses
+the `active` landmarks with the best bound for its (source, target) pair.
+
+Blocking nodes or removing edges only lengthens paths, but new edges, lower weights and
+unblocking shorten them and make the bounds inadmissible. graph.version does not tell
+these apart, so any edit after preprocessing makes the landmarks stale: valid_for() then
+tells Robot to fall back to a regular search until they are rebuilt.
+
+Landmark selection "farthest": start from a random vertex and repeatedly add the vertex
+farthest from every landmark chosen so far (among those reached), which puts landmarks
+on the periphery, behind most queries. "random" is the cheap baseline.
+
+    alt = Landmarks.build(graph, k=8)
+    distance, path = alt.query(source, target)
+    alt.save("map.alt"); alt = Landmarks.load("map.alt", graph)
+
+File format (little-endian): 32-byte header magic b"BMSSPALT", u32 format version,
+u32 flags (bit 0 = directed), u64 num_nodes, u64 k; then landmarks int64[k],
+dist-from float64[k * num_nodes] and, for directed graphs, dist-to float64[k * num_nodes].
+"""
+
+import random
+import struct
+from array import array
+from typing import List, Tuple
+
+from core.graph_io import read_array, write_array
+from .astar import astar
+from .dijkstra import dijkstra
+
+INF = float('inf')
+MAGIC = b"BMSSPALT"
+FORMAT_VERSION = 1
+FLAG_DIRECTED = 1
+_HEADER = struct.Struct("<8sIIQQ")
+
+
+def _distances(graph, source: int) -> array:
+    dist, _ = dijkstra(graph, source)
+    out = array('d', [INF]) * graph.num_nodes
+    for v, d in dist.items():
+        out[v] = d
+    return out
+
+
+class Landmarks:
+    engine = "alt"
+
+    def __init__(self, graph, landmarks: List[int], dist_from: List[array], dist_to: List[array] = None):
+        self.graph = graph
+        self.num_nodes = graph.num_nodes
+        self.landmarks = list(landmarks)
+        self.dist_from = dist_from
+        self.dist_to = dist_to if dist_to is not None else dist_from    # undirected: the same arrays
+        self.directed = dist_to is not None
+        self.graph_version = getattr(graph, "version", 0)
+        self.last_stats = {}
+
+    @classmethod
+    def build(cls, graph, k: int = 8, strategy: str = "farthest", rng=random):
+        """Select k landmarks and run one Dijkstra per landmark and direction."""
+        n = graph.num_nodes
+        if n == 0:
+            raise ValueError("empty graph")
+        k = min(k, n)
+        directed = getattr(graph, "directed", False)
+        backward = graph.reversed() if directed else None
+        landmarks, dist_from = [], []
+        if strategy == "random":
+            for L in rng.sample(range(n), k):
+                landmarks.append(L)
+                dist_from.append(_distances(graph, L))
+        elif strategy == "farthest":
+            start = _distances(graph, rng.randrange(n))
+            nearest = array('d', [INF]) * n     # min over chosen landmarks of d(L, v)
+            cand = start
+            while len(landmarks) < k:
+                best, L = -1.0, None
+                for v in range(n):
+                    d = cand[v] if not landmarks else nearest[v]
+                    if best < d < INF and v not in landmarks:
+                        best, L = d, v
+                if L is None:
+                    # everything reached is a landmark already: seed another component
+                    L = next(v for v in range(n) if nearest[v] == INF and v not in landmarks)
+                landmarks.append(L)
+                df = _distances(graph, L)
+                dist_from.append(df)
+                for v in range(n):
+                    if df[v] < nearest[v]:
+                        nearest[v] = df[v]
+        else:
+            raise ValueError(f"unknown landmark strategy {strategy!r} (expected 'farthest' or 'random')")
+        dist_to = [_distances(backward, L) for L in landmarks] if directed else None
+        return cls(graph, landmarks, dist_from, dist_to)
+
+    def valid_for(self, graph) -> bool:
+        """Bounds hold for the graph they were built (or loaded) on, until it is edited."""
+        return graph is self.graph and getattr(graph, "version", 0) == self.graph_version
+
+    def heuristic(self, source: int, target: int, active: int = 4):
+        """h(v, target) for astar(), using the `active` landmarks with the best source bound."""
+        pairs = []
+        for df, dt in zip(self.dist_from, self.dist_to):
+            b1 = df[target] - df[source]
+            b2 = dt[source] - dt[target]
+            bound = b1 if b1 >= b2 or b2 != b2 else b2
+            if bound == bound:          # NaN (inf - inf) when L reaches neither
+                pairs.append((bound, df, df[target], dt, dt[target]))
+        pairs.sort(key=lambda p: p[0], reverse=True)
+        pairs = [p[1:] for p in pairs[:active]]
+
+        def h(v, t):
+            best = 0.0
+            for df, dft, dt, dtt in pairs:
+                b = dft - df[v]
+                if b > best:
+                    best = b
+                b = dt[v] - dtt
+                if b > best:
+                    best = b
+            return best
+        return h
+
+    def query(self, source: int, target: int, active: int = 4) -> Tuple[float, List[int]]:
+        """(distance, path); (INF, []) if target is unreachable."""
+        dist, pred, info = astar(self.graph, source, target, self.heuristic(source, target, active))
+        self.last_stats = {"expanded": info["expanded"]}
+        if info["distance"] == INF:
+            return INF, []
+        path = []
+        v = target
+        while v is not None:
+            path.append(v)
+            v = pred[v]
+        path.reverse()
+        return info["distance"], path
+
+    # --- files -------------------------------------------------------------------
+
+    def save(self, path):
+        k = len(self.landmarks)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, FLAG_DIRECTED if self.directed else 0,
+                                 self.num_nodes, k))
+            write_array(f, 'q', self.landmarks)
+            for df in self.dist_from:
+                write_array(f, 'd', df)
+            if self.directed:
+                for dt in self.dist_to:
+                    write_array(f, 'd', dt)
+
+    @classmethod
+    def load(cls, path, graph):
+        """Landmarks saved for `graph` (checked against its node count)."""
+        with open(path, "rb") as f:
+            head = f.read(_HEADER.size)
+            if len(head) < _HEADER.size:
+                raise ValueError(f"{path}: truncated header")
+            magic, version, flags, n, k = _HEADER.unpack(head)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: not an ALT landmark file")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{path}: unsupported format version {version}")
+            if n != graph.num_nodes:
+                raise ValueError(f"{path}: built for {n} nodes, graph has {graph.num_nodes}")
+            try:
+                landmarks = list(read_array(f, 'q', k))
+                dist_from = [read_array(f, 'd', n) for _ in range(k)]
+                dist_to = [read_array(f, 'd', n) for _ in range(k)] if flags & FLAG_DIRECTED else None
+            except EOFError:
+                raise ValueError(f"{path}: file shorter than its header says") from None
+        return cls(graph, landmarks, dist_from, dist_to)
@@ -0,0 +1,83 @@
+# algorithms/astar.py
+"""
+A* / weighted A* for point-to-point queries with a pluggable heuristic.
+
+heuristic(v, target) must never overestimate the remaining distance for the result to be
+optimal; weight > 1 inflates it (weighted A*), trading optimality (cost <= weight * optimum)
+for fewer expansions. Vertices are re-opened when their label improves, so inconsistent
+heuristics still give correct (weight-bounded) answers.
+
+Grid ids encode (row, col) as row * cols + col (see generate_grid_graph), so
+manhattan()/octile() only need the column count.
+"""
+
+import heapq
+import math
+from typing import Callable
+
+def manhattan(cols: int, scale: float = 1.0) -> Callable[[int, int], float]:
+    """4-connected grids: |dr| + |dc| times the smallest edge weight."""
+    def h(v, target):
+        return scale * (abs(v // cols - target // cols) + abs(v % cols - target % cols))
+    return h
+
+def octile(cols: int, scale: float = 1.0) -> Callable[[int, int], float]:
+    """8-connected grids with diagonal cost sqrt(2) * straight cost."""
+    diag = math.sqrt(2) - 2
+    def h(v, target):
+        dr = abs(v // cols - target // cols)
+        dc = abs(v % cols - target % cols)
+        return scale * (dr + dc + diag * min(dr, dc))
+    return h
+
+def zero_heuristic(v, target):
+    return 0.0
+
+def grid_heuristic(graph, kind: str = None):
+    """
+    Default heuristic for a grid graph carrying .shape = (rows, cols) (set by generate_grid_graph).
+    kind: "manhattan" / "octile"; defaults to octile for 8-connected graphs, else manhattan.
+    Graphs without a shape get the zero heuristic (A* degrades to Dijkstra).
+    """
+    shape = getattr(graph, "shape", None)
+    if shape is None:
+        return zero_heuristic
+    if kind is None:
+        kind = "octile" if getattr(graph, "connectivity", 4) == 8 else "manhattan"
+    if kind == "manhattan":
+        return manhattan(shape[1])
+    if kind == "octile":
+        return octile(shape[1])
+    raise ValueError(f"unknown grid heuristic {kind!r}")
+
+def astar(graph, source: int, target: int, heuristic=None, weight: float = 1.0):
+    """
+    Returns (dist, pred, info) with sparse dicts over the vertices the search labelled;
+    dist[target] / pred chain from target are the answer (INF / None if unreachable).
+    info = {"distance", "expanded", "weight"}.
+    """
+    INF = float('inf')
+    h = heuristic or grid_heuristic(graph)
+    dist = {source: 0.0}
+    pred = {source: None}
+    # ties on f are broken towards smaller h (deeper nodes), which matters on open grids
+    h0 = weight * h(source, target)
+    heap = [(h0, h0, 0.0, source)]
+    expanded = 0
+    while heap:
+        f, _, d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        expanded += 1
+        if u == target:
+            break
+        for v, w in graph.get_neighbors(u):
+            nd = d + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                pred[v] = u
+                hv = weight * h(v, target)
+                heapq.heappush(heap, (nd + hv, hv, nd, v))
+    dist.setdefault(target, INF)
+    pred.setdefault(target, None)
+    return dist, pred, {"distance": dist[target], "expanded": expanded, "weight": weight}
@@ -0,0 +1,180 @@
+# algorithms/autotune.py
+"""
+Per-family tuning of the BMSSP parameters.
+
+autotune(graph) times run_bmssp on a few sources for every candidate (k, t, L) in both
+modes, checks each result against Dijkstra and keeps the fastest exact one. The choice is
+stored under the graph's signature (family, directedness, integral weights, average degree,
+size bucket) in a JSON file, so later queries on graphs of the same kind reuse it:
+
+    profile = autotune(graph, family="road")          # measure once, persisted
+    state, info = bmssp_tuned(other_road_graph, 0)    # picks the stored k / t / L / mode
+
+Profiles live in $BMSSP_PROFILE_PATH, default ~/.cache/bmssp/profiles.json.
+
+    python -m algorithms.autotune graph.csr --family road
+"""
+
+import json
+import math
+import os
+import random
+from typing import Dict, List, Optional, Tuple
+
+from .bmssp import bmssp_params, run_bmssp
+from .dijkstra import dijkstra
+from .instrument import perf_counter
+from .queues import weight_stats
+
+DEFAULT_PATH = os.path.join("~", ".cache", "bmssp", "profiles.json")
+MODES = ("fast", "safe")
+
+
+def profile_path(path=None) -> str:
+    return os.path.expanduser(path or os.environ.get("BMSSP_PROFILE_PATH") or DEFAULT_PATH)
+
+
+def _num_edges(graph) -> int:
+    """Stored (directed) edge entries; the mutable Graph has no count, so its lists are summed."""
+    m = getattr(graph, "num_edges", None)
+    if m is None:
+        m = sum(len(graph.get_neighbors(u)) for u in graph.nodes)
+    return m
+
+
+def graph_signature(graph, family: str = None) -> str:
+    """Key the profile is stored under, e.g. "grid/u/int/deg4/n2^16"."""
+    if family is None:
+        family = "grid" if hasattr(graph, "shape") else "general"
+    n = max(1, graph.num_nodes)
+    degree = _num_edges(graph) / n
+    integral = weight_stats(graph)[2]
+    return "/".join((family, "d" if getattr(graph, "directed", False) else "u",
+                     "int" if integral else "real", f"deg{round(degree)}",
+                     f"n2^{max(0, round(math.log2(n)))}"))
+
+
+def candidates(num_nodes: int) -> List[Tuple[int, int, int]]:
+    """The default (k, t, L) plus a small grid around it (L follows t as in bmssp_params)."""
+    out = [bmssp_params(num_nodes)]
+    for k in (1, 2, 4, 8):
+        for t in (1, 2, 4):
+            params = (k, t, bmssp_params(num_nodes, t)[2])
+            if params not in out:
+                out.append(params)
+    return out
+
+
+def _pick_sources(graph, count: int, rng) -> List[int]:
+    """Up to `count` distinct sources with at least one out-edge."""
+    n = graph.num_nodes
+    sources = []
+    for _ in range(20 * count):
+        if len(sources) == count:
+            break
+        v = rng.randrange(n)
+        # get_neighbors may be a lazy iterable (CSRGraph: a zip), so look for a first edge
+        if v not in sources and next(iter(graph.get_neighbors(v)), None) is not None:
+            sources.append(v)
+    return sources or [0]
+
+
+def autotune(graph, family: str = None, sources: int = 3, params=None, modes=MODES,
+             path=None, save: bool = True, rng=None) -> Dict:
+    """
+    Measure every (k, t, L) in `params` (default: candidates(n)) x `modes` on `sources`
+    random sources and return the fastest exact choice:
+        {"k", "t", "L", "mode", "time", "dijkstra_time", "signature", "tried"}
+    time / dijkstra_time are summed over the sources. With save=True the choice is written
+    to the profile file under graph_signature(graph, family).
+    """
+    rng = rng or random.Random(0)
+    srcs = _pick_sources(graph, sources, rng)
+    expected = []
+    dijkstra_time = 0.0
+    for s in srcs:
+        t0 = perf_counter()
+        dist, _ = dijkstra(graph, s)
+        dijkstra_time += perf_counter() - t0
+        expected.append(dist)
+
+    best = None
+    tried = 0
+    for k, t, L in (params or candidates(graph.num_nodes)):
+        for mode in modes:
+            elapsed = 0.0
+            exact = True
+            for s, dist in zip(srcs, expected):
+                t0 = perf_counter()
+                state, _ = run_bmssp(graph, s, mode=mode, k=k, t=t, L=L)
+                elapsed += perf_counter() - t0
+                got = state.dist
+                if any(not math.isclose(got[v], d, rel_tol=1e-9) for v, d in dist.items()):
+                    exact = False
+                    break
+                if best is not None and elapsed >= best["time"]:
+                    break       # already slower than the best, stop measuring it
+            tried += 1
+            if exact and (best is None or elapsed < best["time"]):
+                best = {"k": k, "t": t, "L": L, "mode": mode, "time": elapsed}
+
+    if best is None:
+        raise RuntimeError("no candidate produced exact distances")
+    best["dijkstra_time"] = dijkstra_time
+    best["signature"] = graph_signature(graph, family)
+    best["tried"] = tried
+    if save:
+        save_profile(best["signature"], best, path)
+    return best
+
+
+def load_profiles(path=None) -> Dict[str, Dict]:
+    try:
+        with open(profile_path(path)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_profile(signature: str, profile: Dict, path=None):
+    """Store `profile` under `signature`, keeping the other entries (written atomically)."""
+    path = profile_path(path)
+    profiles = load_profiles(path)
+    profiles[signature] = profile
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(profiles, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def lookup(graph, family: str = None, path=None) -> Optional[Dict]:
+    """Stored profile for graphs like `graph`, or None."""
+    return load_profiles(path).get(graph_signature(graph, family))
+
+
+def bmssp_tuned(graph, source: int, family: str = None, path=None, **kwargs):
+    """run_bmssp with the stored k / t / L / mode for this graph's signature (defaults if none)."""
+    profile = lookup(graph, family, path)
+    if profile is not None:
+        for key in ("k", "t", "L", "mode"):
+            kwargs.setdefault(key, profile[key])
+    return run_bmssp(graph, source, **kwargs)
+
+
+if __name__ == "__main__":
+    import argparse
+    from core.graph_io import load_csr
+
+    parser = argparse.ArgumentParser(description="tune k / t / L / mode for a binary CSR graph")
+    parser.add_argument("graph", help="file written by core.graph_io.save_csr")
+    parser.add_argument("--family", type=str, default=None)
+    parser.add_argument("--sources", type=int, default=3)
+    parser.add_argument("--path", type=str, default=None)
+    args = parser.parse_args()
+
+    g = load_csr(args.graph)
+    best = autotune(g, family=args.family, sources=args.sources, path=args.path)
+    print(f"{best['signature']}: k={best['k']} t={best['t']} L={best['L']} mode={best['mode']} "
+          f"{best['time']:.3f}s (dijkstra {best['dijkstra_time']:.3f}s, {best['tried']} tried) "
+          f"-> {profile_path(args.path)}")
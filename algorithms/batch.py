@@ -0,0 +1,207 @@
+# algorithms/batch.py
+"""
+Many-source shortest paths on one static graph.
+
+batch_sssp(graph, sources, engine=..., workers=N) answers one SSSP per source on a
+process pool and yields (source, dist, pred) as each one finishes (unordered).
+distance_matrix(graph, sources, targets, ...) builds a many-to-many table the same way
+but ships back only the requested target columns.
+
+The graph is frozen to CSR once and its offsets/targets/weights buffers are copied into a
+single multiprocessing.shared_memory block. Workers attach to that block read-only and wrap
+it in a CSRGraph over memoryviews, so nothing graph-sized is pickled per task (or per worker).
+
+Graphs opened with core.graph_io.load_csr are already file-backed: workers simply mmap the
+same file (graph.mapped_path) and share its page cache, no shared-memory copy is made.
+
+Parallelism inside a single query (BMSSP base case, delta-stepping phases) uses the same
+shared-memory CSR through parallel.WorkerPool.
+
+Results come back as compact arrays: dist array('d') (INF = unreachable) and
+pred array('q') (-1 = no predecessor), indexed by node id.
+"""
+
+from array import array
+from contextlib import nullcontext
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator, List, Tuple
+
+from core.graph import CSRGraph
+from core.graph_io import load_csr
+from .dijkstra import dijkstra
+from .bmssp import run_bmssp
+from .delta_stepping import delta_stepping
+
+INF = float('inf')
+
+# --- engines: (graph, source) -> (dist array, pred array) --------------------
+
+def _dijkstra_engine(graph, source):
+    dist, prev = dijkstra(graph, source)
+    n = graph.num_nodes
+    d = array('d', [INF]) * n
+    p = array('q', [-1]) * n
+    for v, dv in dist.items():
+        d[v] = dv
+        if prev[v] is not None:
+            p[v] = prev[v]
+    return d, p
+
+def _bmssp_safe_engine(graph, source):
+    state, _ = run_bmssp(graph, source, mode="safe")
+    return state.dist, state.pred
+
+def _bmssp_fast_engine(graph, source):
+    state, _ = run_bmssp(graph, source, mode="fast")
+    return state.dist, state.pred
+
+def _delta_stepping_engine(graph, source):
+    return delta_stepping(graph, source)
+
+ENGINES = {
+    "dijkstra": _dijkstra_engine,
+    "delta_stepping": _delta_stepping_engine,
+    "bmssp": _bmssp_fast_engine,
+    "bmssp_safe": _bmssp_safe_engine,
+    "bmssp_fast": _bmssp_fast_engine,
+}
+
+def _resolve_engine(engine):
+    if callable(engine):
+        return engine
+    try:
+        return ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"unknown engine {engine!r} (expected one of {sorted(ENGINES)})")
+
+# --- shared-memory CSR ------------------------------------------------------
+
+def as_csr(graph) -> CSRGraph:
+    """Frozen CSR view of `graph` (CSR graphs are returned as is)."""
+    if isinstance(graph, CSRGraph):
+        return graph
+    return graph.to_csr()
+
+class SharedCSR:
+    """
+    Owner of a shared-memory copy of a CSRGraph: [offsets | targets | weights].
+    Use as a context manager (or call close()) so the block is unlinked.
+    """
+
+    def __init__(self, csr: CSRGraph):
+        n, m = csr.num_nodes, csr.num_edges
+        nbytes = 8 * (n + 1) + 16 * m
+        self.shm = SharedMemory(create=True, size=max(1, nbytes))
+        buf = self.shm.buf
+        a = 8 * (n + 1)
+        b = a + 8 * m
+        buf[0:a] = memoryview(array('q', csr.offsets)).cast('B')
+        buf[a:b] = memoryview(array('q', csr.targets)).cast('B')
+        buf[b:b + 8 * m] = memoryview(array('d', csr.weights)).cast('B')
+        self.spec = (self.shm.name, n, m, csr.directed)
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def attach_csr(spec) -> Tuple[CSRGraph, SharedMemory]:
+    """Worker side: map a SharedCSR block as a read-only CSRGraph (keep the shm handle alive)."""
+    name, n, m, directed = spec
+    shm = SharedMemory(name=name)
+    buf = shm.buf
+    a = 8 * (n + 1)
+    b = a + 8 * m
+    offsets = buf[0:a].cast('q')
+    targets = buf[a:b].cast('q')
+    weights = buf[b:b + 8 * m].cast('d')
+    return CSRGraph(n, offsets, targets, weights, directed=directed), shm
+
+# --- worker process state ---------------------------------------------------
+
+_WORKER = {}
+
+def _init_worker(spec, engine, targets):
+    if spec[0] == "mmap":
+        graph, shm = load_csr(spec[1]), None
+    else:
+        graph, shm = attach_csr(spec)
+    _WORKER["graph"] = graph
+    _WORKER["shm"] = shm
+    _WORKER["engine"] = _resolve_engine(engine)
+    _WORKER["targets"] = targets
+
+def _solve(source):
+    dist, pred = _WORKER["engine"](_WORKER["graph"], source)
+    return source, dist, pred
+
+def _solve_row(source):
+    dist, _ = _WORKER["engine"](_WORKER["graph"], source)
+    return source, array('d', (dist[t] for t in _WORKER["targets"]))
+
+def _pool_map(graph, sources, engine, workers, task, targets=None):
+    csr = as_csr(graph)
+    path = getattr(csr, "mapped_path", None)
+    with (nullcontext() if path else SharedCSR(csr)) as shared:
+        spec = ("mmap", path) if path else shared.spec
+        ctx = get_context()
+        with ctx.Pool(workers, initializer=_init_worker, initargs=(spec, engine, targets)) as pool:
+            for item in pool.imap_unordered(task, sources):
+                yield item
+
+# --- public API ---------------------------------------------------------------
+
+def batch_sssp(graph, sources: Iterable[int], engine="bmssp", workers: int = 1) -> Iterator[Tuple[int, array, array]]:
+    """
+    Yield (source, dist, pred) for every source, in completion order.
+    engine: name from ENGINES or a picklable top-level (graph, source) -> (dist, pred) callable.
+    workers <= 1 runs in-process (no pool, no shared memory).
+    """
+    sources = list(sources)
+    if workers <= 1:
+        run = _resolve_engine(engine)
+        csr = as_csr(graph)
+        for s in sources:
+            dist, pred = run(csr, s)
+            yield s, dist, pred
+        return
+    _resolve_engine(engine)  # fail fast in the parent
+    yield from _pool_map(graph, sources, engine, workers, _solve)
+
+def distance_matrix(graph, sources: Iterable[int], targets: Iterable[int], engine="bmssp",
+                    workers: int = 1) -> List[array]:
+    """
+    rows[i][j] = distance from sources[i] to targets[j] (INF if unreachable).
+    Workers send back only the len(targets) column values of each row.
+    A source listed more than once is solved once; each of its rows is its own array.
+    """
+    sources = list(sources)
+    targets = list(targets)
+    index = {}
+    for i, s in enumerate(sources):
+        index.setdefault(s, []).append(i)
+    unique = list(index)
+    rows = [None] * len(sources)
+
+    def fill(s, row):
+        first, *rest = index[s]
+        rows[first] = row
+        for i in rest:
+            rows[i] = array('d', row)
+
+    if workers <= 1:
+        for s, dist, _ in batch_sssp(graph, unique, engine, workers=1):
+            fill(s, array('d', (dist[t] for t in targets)))
+        return rows
+    _resolve_engine(engine)
+    for s, row in _pool_map(graph, unique, engine, workers, _solve_row, targets):
+        fill(s, row)
+    return rows
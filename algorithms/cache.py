@@ -0,0 +1,109 @@
+# algorithms/cache.py
+"""
+Bounded cache of shortest-path trees.
+
+Entries are keyed by (graph identity, graph.version, source, engine) and store the tree as
+compact arrays (dist array('d'), pred array('q') with -1 = none), ~16 bytes per node.
+Eviction is LRU, bounded by entry count and optionally by total bytes.
+
+Invalidation is automatic: a lookup that sees a new graph.version drops every entry of the
+older version of that graph, and entries of a graph are dropped when it is garbage collected.
+"""
+
+import weakref
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from .batch import ENGINES
+
+class SPTCache:
+    def __init__(self, maxsize: int = 64, max_bytes: Optional[int] = None):
+        self.maxsize = max(1, int(maxsize))
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # (gid, version, source, engine) -> (dist, pred)
+        self._versions = {}             # gid -> version currently cached
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _size(dist, pred):
+        return len(dist) * dist.itemsize + len(pred) * pred.itemsize
+
+    def _drop(self, key):
+        dist, pred = self._entries.pop(key)
+        self.nbytes -= self._size(dist, pred)
+
+    def _forget_graph(self, gid):
+        for key in [k for k in self._entries if k[0] == gid]:
+            self._drop(key)
+        self._versions.pop(gid, None)
+
+    def _check_version(self, graph):
+        gid = id(graph)
+        version = getattr(graph, "version", 0)
+        known = self._versions.get(gid)
+        if known is None:
+            self._versions[gid] = version
+            try:
+                weakref.finalize(graph, self._forget_graph, gid)
+            except TypeError:
+                pass  # not weak-referenceable: entries live until evicted
+        elif known != version:
+            # graph mutated: every tree of the old version is stale
+            stale = [k for k in self._entries if k[0] == gid]
+            for key in stale:
+                self._drop(key)
+            self.invalidations += len(stale)
+            self._versions[gid] = version
+        return gid, version
+
+    def get(self, graph, source: int, engine: str = "bmssp") -> Optional[Tuple]:
+        gid, version = self._check_version(graph)
+        key = (gid, version, source, engine)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, graph, source: int, engine: str, dist, pred):
+        gid, version = self._check_version(graph)
+        key = (gid, version, source, engine)
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (dist, pred)
+        self.nbytes += self._size(dist, pred)
+        while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None and self.nbytes > self.max_bytes and len(self._entries) > 1):
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def get_or_compute(self, graph, source: int, engine: str = "bmssp") -> Tuple:
+        """(dist, pred) arrays for `source`, computed with batch.ENGINES[engine] on a miss."""
+        entry = self.get(graph, source, engine)
+        if entry is None:
+            entry = ENGINES[engine](graph, source)
+            self.put(graph, source, engine, *entry)
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def __len__(self):
+        return len(self._entries)
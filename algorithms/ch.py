@@ -0,0 +1,291 @@
+# algorithms/ch.py
+"""
+Contraction hierarchies (Geisberger, Sanders, Schultes & Delling, 2008).
+
+Preprocessing contracts the vertices one by one, least important first. Contracting v
+removes it and, for every in-neighbour u and out-neighbour x, adds a shortcut u -> x of
+weight w(u, v) + w(v, x) unless a witness search (Dijkstra from u that skips v, cut
+after `settle_limit` settled vertices) finds a path that is no longer. Importance is the
+edge difference (shortcuts added - edges removed) plus the number of already contracted
+neighbours, re-evaluated lazily when a vertex reaches the top of the queue.
+
+rank[v] is the contraction order. The result is two CSR graphs over the original edges
+and shortcuts: `up` (u -> x with rank[x] > rank[u], stored at u) and `down` (u -> x with
+rank[u] > rank[x], stored at x, searched backwards). A query runs Dijkstra upwards from
+the source in `up` and from the target in `down`; every shortest path has a highest-rank
+vertex where the two meet, so both searches stay tiny. Each edge remembers the contracted
+vertex it bypasses (`mids`, -1 for original edges) so the path can be unpacked.
+
+The hierarchy describes the graph as it was built: any later edit (graph.version
+changed) makes it stale; valid_for() tells Robot to fall back to a regular search.
+
+    ch = ContractionHierarchy.build(graph)
+    distance, path = ch.query(source, target)
+    ch.save("map.ch"); ch = ContractionHierarchy.load("map.ch", graph)
+
+File format (little-endian): 40-byte header magic b"BMSSP_CH", u32 format version,
+u32 flags (bit 0 = directed), u64 num_nodes, u64 up edges, u64 down edges; then
+rank int64[num_nodes] and, for up then down: offsets int64[num_nodes + 1],
+targets int64[edges], weights float64[edges], mids int64[edges].
+"""
+
+import heapq
+import struct
+from array import array
+from typing import List, Tuple
+
+from core.graph_io import read_array, write_array
+
+INF = float('inf')
+MAGIC = b"BMSSP_CH"
+FORMAT_VERSION = 1
+FLAG_DIRECTED = 1
+_HEADER = struct.Struct("<8sIIQQQ")
+
+
+def _witness(out, source, skip, targets, limit, settle_limit):
+    """
+    Tentative distances from source in the remaining graph without `skip`; stops past
+    `limit`, after settle_limit vertices or once every vertex of `targets` is settled.
+    """
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    settled = 0
+    left = len(targets)
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if d > limit or settled >= settle_limit:
+            break
+        settled += 1
+        if u in targets:
+            left -= 1
+            if not left:
+                break
+        for v, w in out[u].items():
+            if v == skip:
+                continue
+            nd = d + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return dist
+
+
+def _to_csr(n, edges):
+    """edges[v] = [(target, w, mid), ...] -> (offsets, targets, weights, mids) arrays."""
+    offsets = array('q', [0])
+    targets, weights, mids = array('q'), array('d'), array('q')
+    for v in range(n):
+        for x, w, m in edges[v]:
+            targets.append(x)
+            weights.append(w)
+            mids.append(m)
+        offsets.append(len(targets))
+    return offsets, targets, weights, mids
+
+
+class ContractionHierarchy:
+    engine = "ch"
+
+    def __init__(self, num_nodes: int, rank, up, down, directed: bool = False, graph=None):
+        self.num_nodes = num_nodes
+        self.rank = rank
+        self.up = up            # (offsets, targets, weights, mids)
+        self.down = down
+        self.directed = directed
+        self.graph = graph
+        self.graph_version = getattr(graph, "version", 0)
+        self.last_stats = {}
+
+    @property
+    def num_shortcuts(self) -> int:
+        return sum(1 for m in self.up[3] if m >= 0) + sum(1 for m in self.down[3] if m >= 0)
+
+    @classmethod
+    def build(cls, graph, settle_limit: int = 64):
+        n = graph.num_nodes
+        out = [dict() for _ in range(n)]        # remaining graph: u -> {x: w}
+        inn = [dict() for _ in range(n)]        # and its transpose
+        for u in graph.nodes:
+            for v, w in graph.get_neighbors(u):
+                if v != u and w < out[u].get(v, INF):
+                    out[u][v] = w
+                    inn[v][u] = w
+        mid = {}                                # (u, x) -> vertex a shortcut bypasses
+        deleted = [0] * n                       # contracted neighbours per vertex
+
+        def shortcuts(v):
+            res = []
+            outs = out[v]
+            if not outs:
+                return res
+            top = max(outs.values())
+            for u, wu in inn[v].items():
+                dist = _witness(out, u, v, outs, wu + top, settle_limit)
+                for x, wx in outs.items():
+                    if x != u and dist.get(x, INF) > wu + wx:
+                        res.append((u, x, wu + wx))
+            return res
+
+        def priority(v, sc):
+            return len(sc) - len(inn[v]) - len(out[v]) + deleted[v]
+
+        heap = [(priority(v, shortcuts(v)), v) for v in range(n)]
+        heapq.heapify(heap)
+        rank = array('q', [0]) * n
+        up = [None] * n
+        down = [None] * n
+        order = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            sc = shortcuts(v)
+            p = priority(v, sc)
+            if heap and p > heap[0][0]:
+                heapq.heappush(heap, (p, v))
+                continue
+            rank[v] = order
+            order += 1
+            # every remaining neighbour is contracted later, i.e. ranks higher
+            up[v] = [(x, w, mid.get((v, x), -1)) for x, w in out[v].items()]
+            down[v] = [(u, w, mid.get((u, v), -1)) for u, w in inn[v].items()]
+            for u in inn[v]:
+                del out[u][v]
+                deleted[u] += 1
+            for x in out[v]:
+                del inn[x][v]
+                deleted[x] += 1
+            out[v] = inn[v] = None
+            for u, x, w in sc:
+                if w < out[u].get(x, INF):
+                    out[u][x] = w
+                    inn[x][u] = w
+                    mid[(u, x)] = v
+        return cls(n, rank, _to_csr(n, up), _to_csr(n, down),
+                   getattr(graph, "directed", False), graph)
+
+    def valid_for(self, graph) -> bool:
+        return graph is self.graph and getattr(graph, "version", 0) == self.graph_version
+
+    # --- queries ---------------------------------------------------------------------
+
+    def query(self, source: int, target: int) -> Tuple[float, List[int]]:
+        """(distance, path); (INF, []) if target is unreachable."""
+        df = {source: 0.0}
+        db = {target: 0.0}
+        pf = {source: None}     # v -> (vertex, edge index in `up`) that reached it
+        pb = {target: None}     # v -> (vertex, edge index in `down`) that reached it
+        hf = [(0.0, source)]
+        hb = [(0.0, target)]
+        best = 0.0 if source == target else INF
+        meet = source if source == target else None
+        settled = 0
+        up, down = self.up, self.down
+        while hf or hb:
+            if hf and (not hb or hf[0][0] <= hb[0][0]):
+                heap, lab, other, par, (off, tg, wt, _) = hf, df, db, pf, up
+            else:
+                heap, lab, other, par, (off, tg, wt, _) = hb, db, df, pb, down
+            d, u = heapq.heappop(heap)
+            if d > lab[u]:
+                continue
+            if d >= best:
+                heap.clear()    # nothing in this direction can improve the meeting point
+                continue
+            settled += 1
+            du = other.get(u)
+            if du is not None and d + du < best:
+                best = d + du
+                meet = u
+            for i in range(off[u], off[u + 1]):
+                v = tg[i]
+                nd = d + wt[i]
+                if nd < lab.get(v, INF):
+                    lab[v] = nd
+                    par[v] = (u, i)
+                    heapq.heappush(heap, (nd, v))
+        self.last_stats = {"expanded": settled}
+        if meet is None:
+            return INF, []
+
+        # hierarchy edges source -> meet (up) and meet -> target (down)
+        edges = []
+        v = meet
+        while pf[v] is not None:
+            u, i = pf[v]
+            edges.append((u, v, up[3][i]))
+            v = u
+        edges.reverse()
+        v = meet
+        while pb[v] is not None:
+            x, i = pb[v]
+            edges.append((v, x, down[3][i]))
+            v = x
+        path = [source]
+        for u, x, m in edges:
+            path.extend(self._unpack(u, x, m)[1:])
+        return best, path
+
+    def _mid(self, u, x):
+        """Bypassed vertex of the cheapest hierarchy edge u -> x."""
+        if self.rank[u] < self.rank[x]:
+            at, want, (off, tg, wt, mids) = u, x, self.up
+        else:
+            at, want, (off, tg, wt, mids) = x, u, self.down
+        best, m = INF, -1
+        for i in range(off[at], off[at + 1]):
+            if tg[i] == want and wt[i] < best:
+                best, m = wt[i], mids[i]
+        return m
+
+    def _unpack(self, u, x, m) -> List[int]:
+        """Original-edge path of the hierarchy edge u -> x that bypasses m."""
+        path = [u]
+        stack = [(u, x, m)]
+        while stack:
+            a, b, c = stack.pop()
+            if c < 0:
+                path.append(b)
+            else:
+                stack.append((c, b, self._mid(c, b)))
+                stack.append((a, c, self._mid(a, c)))
+        return path
+
+    # --- files -------------------------------------------------------------------------
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, FLAG_DIRECTED if self.directed else 0,
+                                 self.num_nodes, len(self.up[1]), len(self.down[1])))
+            write_array(f, 'q', self.rank)
+            for csr in (self.up, self.down):
+                for typecode, data in zip("qqdq", csr):
+                    write_array(f, typecode, data)
+
+    @classmethod
+    def load(cls, path, graph=None):
+        """
+        Queries do not need the graph; pass it to tie the hierarchy to it (valid_for() then
+        accepts that graph until its version changes).
+        """
+        with open(path, "rb") as f:
+            head = f.read(_HEADER.size)
+            if len(head) < _HEADER.size:
+                raise ValueError(f"{path}: truncated header")
+            magic, version, flags, n, m_up, m_down = _HEADER.unpack(head)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: not a contraction hierarchy file")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{path}: unsupported format version {version}")
+            if graph is not None and n != graph.num_nodes:
+                raise ValueError(f"{path}: built for {n} nodes, graph has {graph.num_nodes}")
+            try:
+                rank = read_array(f, 'q', n)
+                csrs = []
+                for m in (m_up, m_down):
+                    csrs.append((read_array(f, 'q', n + 1), read_array(f, 'q', m),
+                                 read_array(f, 'd', m), read_array(f, 'q', m)))
+            except EOFError:
+                raise ValueError(f"{path}: file shorter than its header says") from None
+        return cls(n, rank, csrs[0], csrs[1], bool(flags & FLAG_DIRECTED), graph)
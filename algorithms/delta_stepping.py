@@ -0,0 +1,133 @@
+# algorithms/delta_stepping.py
+"""
+Delta-stepping SSSP (Meyer & Sanders).
+
+Tentative labels live in buckets of width delta: bucket i holds vertices with
+i * delta <= dist < (i + 1) * delta. The lowest non-empty bucket is emptied in phases:
+relax the light edges (w <= delta) of everything removed from it, which can refill the same
+bucket, until it stays empty; then relax the heavy edges (w > delta) of every vertex
+removed in that bucket once. All relaxations of one phase are independent, so with a
+parallel.WorkerPool large phases are split over the workers: they compute proposals
+against the shared labels and the caller applies them with a min-reduction.
+
+delta trades phases against wasted work: delta -> 0 is Dijkstra (one vertex per bucket),
+delta -> inf is Bellman-Ford. The default is the mean edge weight.
+
+Returns (dist array('d'), pred array('q')) like the batch.py engines (INF / -1 = none).
+"""
+
+import heapq
+from array import array
+from typing import List, Tuple
+
+INF = float('inf')
+
+
+def default_delta(graph) -> float:
+    """Mean edge weight (1.0 for graphs without edges or with only zero weights)."""
+    if hasattr(graph, "weights"):
+        m = len(graph.weights)
+        total = sum(graph.weights)
+    else:
+        m = 0
+        total = 0.0
+        for u in graph.nodes:
+            for _, w in graph.get_neighbors(u):
+                m += 1
+                total += w
+    return total / m if m and total > 0 else 1.0
+
+
+def relax_edges(graph, dist, nodes: List[int], delta: float, light: bool):
+    """
+    Proposals (v, d, parent) for the light (w <= delta) or heavy out-edges of `nodes`
+    that beat dist[v]; at most one (the smallest) per v.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    best = {}
+    for u in nodes:
+        du = dist[u]
+        for e in range(offsets[u], offsets[u + 1]):
+            w = weights[e]
+            if (w <= delta) != light:
+                continue
+            v = targets[e]
+            nd = du + w
+            if nd < dist[v]:
+                old = best.get(v)
+                if old is None or nd < old[0]:
+                    best[v] = (nd, u)
+    return [(v, d, u) for v, (d, u) in best.items()]
+
+
+def delta_stepping(graph, source: int, delta: float = None, pool=None) -> Tuple[array, array]:
+    """
+    Non-CSR graphs are frozen with to_csr() first.
+    pool: optional parallel.WorkerPool; phases with at least pool.min_batch vertices run
+    on its workers, smaller ones in this process.
+    """
+    if delta is None:
+        delta = default_delta(graph)
+    if delta <= 0:
+        raise ValueError("delta must be positive")
+    if pool is not None:
+        graph = pool.graph
+    elif not hasattr(graph, "offsets"):
+        graph = graph.to_csr()
+    n = graph.num_nodes
+    if pool is None:
+        dist = array('d', [INF]) * n
+    else:
+        dist = pool.dist
+        dist[:] = array('d', [INF]) * n
+    pred = array('q', [-1]) * n
+
+    buckets = {}            # bucket index -> vertices (entries go stale when a label drops)
+    order = []              # heap of bucket indices
+
+    def apply(proposals):
+        for v, d, u in proposals:
+            if d < dist[v]:
+                dist[v] = d
+                pred[v] = u
+                i = int(d / delta)
+                b = buckets.get(i)
+                if b is None:
+                    buckets[i] = [v]
+                    heapq.heappush(order, i)
+                else:
+                    b.append(v)
+
+    def relax(nodes, light):
+        if pool is not None and len(nodes) >= pool.min_batch:
+            apply(pool.relax(nodes, delta, light))
+        else:
+            apply(relax_edges(graph, dist, nodes, delta, light))
+
+    apply([(source, 0.0, -1)])
+    while order:
+        i = heapq.heappop(order)
+        settled = []
+        seen = set()
+        while True:
+            b = buckets.pop(i, None)
+            if not b:
+                break
+            # live entries only: label still in bucket i, once per phase
+            frontier = []
+            for v in b:
+                if v not in seen and int(dist[v] / delta) == i:
+                    seen.add(v)
+                    frontier.append(v)
+            if not frontier:
+                continue
+            settled.extend(frontier)
+            seen.clear()
+            # may refill bucket i (it then also reappears in `order` as an empty entry)
+            relax(frontier, light=True)
+        if settled:
+            relax(list(dict.fromkeys(settled)), light=False)
+
+    if pool is not None:
+        dist = array('d', dist)
+    return dist, pred
@@ -1,61 +1,167 @@
 # algorithms/dijkstra.py
 """
-Dijkstra baseline and the 'mini_dijkstra' used as base-case for BMSSP.
+Dijkstra baseline (optionally point-to-point), bidirectional Dijkstra,
+and the 'mini_dijkstra' used as base-case for BMSSP.
+
+queue= picks the priority queue (see queues.py): None / "heap" (heapq), "bfs", "dial",
+"radix", "dary" (indexed d-ary heap with decrease-key), or "auto" to choose from the
+graph's edge-weight statistics. mini_dijkstra keeps heapq: it pops at most k + 1 entries.
 """
 
 import heapq
-from typing import Tuple, Dict, Set, List
+from typing import Tuple, List, Dict
+from .state import SSSPState
+from .queues import make_queue
 
-def dijkstra(graph, source: int):
+def dijkstra(graph, source: int, target: int = None, stats: Dict = None, queue=None):
+    """
+    Single-source Dijkstra. With `target`, stops as soon as target is settled:
+    dist[target] and its predecessor chain are exact, other labels may be upper bounds.
+    If `stats` is a dict, stats["settled"] receives the number of settled vertices.
+    """
     dist = {v: float('inf') for v in graph.nodes}
     prev = {v: None for v in graph.nodes}
     dist[source] = 0.0
-    heap = [(0.0, source)]
-    while heap:
-        d, u = heapq.heappop(heap)
+    pq = make_queue(queue, graph)
+    push, pop = pq.push, pq.pop
+    push((0.0, source))
+    settled = 0
+    while True:
+        try:
+            d, u = pop()
+        except IndexError:
+            break
         if d > dist[u]:
             continue
+        settled += 1
+        if u == target:
+            break
         for v, w in graph.get_neighbors(u):
             nd = d + w
             if nd < dist[v]:
                 dist[v] = nd
                 prev[v] = u
-                heapq.heappush(heap, (nd, v))
+                push((nd, v))
+    if stats is not None:
+        stats["settled"] = settled
     return dist, prev
 
-def mini_dijkstra(graph, source: int, B: float, distances: Dict[int, float],
-                  predecessors: Dict[int, int], k: int) -> Tuple[float, Set[int]]:
+def bidirectional_dijkstra(graph, source: int, target: int, queue=None):
+    """
+    Point-to-point Dijkstra growing one search from `source` and one (on the reversed graph)
+    from `target`, alternating on the smaller frontier and stopping once
+    top_forward + top_backward >= best meeting distance.
+    Undirected graphs (Graph.add_edge) use the same adjacency both ways; directed CSR graphs
+    search their transpose backwards.
+
+    Returns (dist, pred, info) with *sparse* dicts: only vertices the forward search labelled
+    plus the s-t path. dist[target] / the pred chain from target are exact;
+    info = {"distance", "settled", "meet"}.
+    """
+    INF = float('inf')
+    backward = graph.reversed() if getattr(graph, "directed", False) else graph
+
+    df = {source: 0.0}
+    db = {target: 0.0}
+    pf = {source: None}
+    nb = {target: None}     # next hop toward target in the backward tree
+    hf = make_queue(queue, graph)
+    hb = make_queue(queue, backward)
+    hf.push((0.0, source))
+    hb.push((0.0, target))
+    mu = 0.0 if source == target else INF
+    meet = source if source == target else None
+    settled = 0
+
+    while len(hf) and len(hb) and hf.peek()[0] + hb.peek()[0] < mu:
+        if len(hf) <= len(hb):
+            heap, lab, other, link, g = hf, df, db, pf, graph
+        else:
+            heap, lab, other, link, g = hb, db, df, nb, backward
+        d, u = heap.pop()
+        if d > lab[u]:
+            continue
+        settled += 1
+        for v, w in g.get_neighbors(u):
+            nd = d + w
+            if nd < lab.get(v, INF):
+                lab[v] = nd
+                link[v] = u
+                heap.push((nd, v))
+            if v in other:
+                cand = lab[v] + other[v]
+                if cand < mu:
+                    mu = cand
+                    meet = v
+
+    dist = df
+    pred = pf
+    if meet is not None:
+        # splice the backward half of the path onto the forward tree
+        x = meet
+        while nb[x] is not None:
+            y = nb[x]
+            pred[y] = x
+            dist[y] = mu - db[y]
+            x = y
+    dist.setdefault(target, INF)
+    pred.setdefault(target, None)
+    return dist, pred, {"distance": mu, "settled": settled, "meet": meet}
+
+def mini_dijkstra(graph, source: int, B: float, state: SSSPState, k: int) -> Tuple[float, List[int]]:
     """
     Run a Dijkstra-like expansion from source x up to (k+1) nodes or until no more nodes found within B.
-    Returns (B_prime, U_set) with U_set being nodes discovered with d < B_prime and all complete.
+    Returns (B_prime, U_list) with U_list being nodes discovered with d < B_prime and all complete.
+    Every node whose label gets lowered is marked as a seed in `state` (relaxation here
+    is cut at B, so those labels are not fully propagated yet).
+    A neighbour whose label already equals d + w (set earlier by find_pivots) is expanded
+    as well, as with the paper's "<=" relaxation; otherwise the base case stops at x.
     """
-    # Use local heap seeded with current known distance for source
-    import heapq
+    dist = state.dist
+    pred = state.pred
+    seed_mark = state.seed_mark
+    seed_list = state.seed_list
+    in_U0, gen = state.stamp("base")
     heap = []
-    seen = set()
-    U0 = set()
+    U0 = []
+    pops = relaxed = 0
     # seed
-    initial = distances.get(source, float('inf'))
-    heapq.heappush(heap, (initial, source))
+    heapq.heappush(heap, (dist[source], source))
     while heap and len(U0) < (k + 1):
         d, u = heapq.heappop(heap)
-        if d > distances.get(u, float('inf')):
+        pops += 1
+        if d > dist[u]:
             continue
         if d >= B:
             break
-        if u in U0:
+        if in_U0[u] == gen:
             continue
-        U0.add(u)
+        in_U0[u] = gen
+        U0.append(u)
         for v, w in graph.get_neighbors(u):
             nd = d + w
-            if nd < distances.get(v, float('inf')) and nd < B:
-                distances[v] = nd
-                predecessors[v] = u
-                heapq.heappush(heap, (nd, v))
+            if nd >= B:
+                continue
+            dv = dist[v]
+            if nd < dv:
+                dist[v] = nd
+                pred[v] = u
+                relaxed += 1
+                if not seed_mark[v]:
+                    seed_mark[v] = 1
+                    seed_list.append(v)
+            elif nd > dv or in_U0[v] == gen:
+                continue
+            heapq.heappush(heap, (nd, v))
+    prof = state.profiler
+    if prof is not None:
+        prof.count("relaxations", relaxed)
+        prof.count("heap_pushes", relaxed + 1)
+        prof.count("heap_pops", pops)
     if len(U0) <= k:
         return B, U0
     else:
-        Bprime = max(distances[v] for v in U0)
+        Bprime = max(dist[v] for v in U0)
         # U returned should be {v in U0 : d(v) < Bprime}
-        U = set(v for v in U0 if distances[v] < Bprime)
+        U = [v for v in U0 if dist[v] < Bprime]
         return Bprime, U
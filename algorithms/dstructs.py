@@ -6,17 +6,31 @@ Supports:
  - batch_prepend(list_of_pairs)
  - pull() -> (subset_keys, separator_value)
 
-This is a pragmatic implementation designed to be efficient enough for ~50k nodes.
+Layout (Lemma 3.3 of the paper, block-based):
+ - D1: blocks ordered by upper bound (D1_bounds is sorted, bisect finds the target block).
+       A block that grows past M is split around its median, so every block stays O(M).
+ - D0: deque of prepended blocks, each of size <= M, smallest block first.
+ - key_map: current best value per key. Entries whose value no longer matches key_map
+   (superseded by a smaller value, or already pulled) are stale and are dropped lazily
+   whenever a block is touched, instead of being searched for and deleted eagerly.
+
+pull() only touches the prefix blocks of D0 / D1 that hold its M answers plus the next
+head block of each sequence for the separator, so it never scans the whole structure.
 """
 
-import heapq
+from bisect import bisect_left
 from collections import deque
-from typing import List, Tuple, Dict
+from typing import List, Tuple
 
 class Block:
-    def __init__(self, items: List[Tuple[int, float]] = None):
+    __slots__ = ("items", "ub")
+
+    def __init__(self, items: List[Tuple[int, float]] = None, ub: float = None):
         self.items = items or []
-        self.update_bound()
+        if ub is None:
+            self.update_bound()
+        else:
+            self.ub = ub
 
     def update_bound(self):
         if not self.items:
@@ -38,13 +52,27 @@ class PartialSortingDS:
     def __init__(self, M: int, B: float):
         self.M = max(1, int(M))
         self.B = B
-        self.D0 = deque()   # prepended batches (each sorted ascending)
-        self.D1 = []        # list of Block()
-        self.D1_bounds = [] # list of upper bounds of blocks
-        self.key_map = {}   # current best value for key
-
-    def _rebuild_bounds(self):
-        self.D1_bounds = [blk.ub for blk in self.D1]
+        self.D0 = deque()           # prepended blocks (lists of pairs), smallest first
+        self.D1 = [Block([], B)]    # blocks ordered by upper bound; last one bounded by B
+        self.D1_bounds = [B]        # parallel list of upper bounds (sorted)
+        self.key_map = {}           # current best value for key
+
+    def _live(self, items):
+        key_map = self.key_map
+        return [(k, v) for k, v in items if key_map.get(k) == v]
+
+    def _split(self, i: int):
+        blk = self.D1[i]
+        live = self._live(blk.items)
+        if len(live) <= self.M:
+            blk.items = live
+            return
+        live.sort(key=lambda x: x[1])
+        mid = len(live) // 2
+        left = Block(live[:mid], live[mid - 1][1])
+        blk.items = live[mid:]
+        self.D1.insert(i, left)
+        self.D1_bounds.insert(i, left.ub)
 
     def insert(self, pair):
         key, value = pair
@@ -52,14 +80,16 @@ class PartialSortingDS:
         if old is not None and value >= old:
             return
         self.key_map[key] = value
-        # Add to last block (create if necessary)
-        if not self.D1 or len(self.D1[-1].items) >= 2 * self.M:
-            blk = Block([pair])
-            self.D1.append(blk)
-            self.D1_bounds.append(blk.ub)
-        else:
-            self.D1[-1].push(pair)
-            self.D1_bounds[-1] = self.D1[-1].ub
+        i = bisect_left(self.D1_bounds, value)
+        if i == len(self.D1):
+            # value >= B: tolerate it in the last block
+            i -= 1
+            self.D1[i].ub = value
+            self.D1_bounds[i] = value
+        blk = self.D1[i]
+        blk.items.append(pair)
+        if len(blk.items) > self.M:
+            self._split(i)
 
     def batch_prepend(self, pairs: List[Tuple[int, float]]):
         if not pairs:
@@ -71,68 +101,110 @@ class PartialSortingDS:
                     best[k] = v
             else:
                 best[k] = v
-        batch = [(k, best[k]) for k in best]
-        batch.sort(key=lambda x: x[1])
-        # update current map with batch values if better
-        for k, v in batch:
-            old = self.key_map.get(k)
+        # only entries that improve the current map become live
+        key_map = self.key_map
+        batch = []
+        for k, v in best.items():
+            old = key_map.get(k)
             if old is None or v < old:
-                self.key_map[k] = v
-        self.D0.appendleft(batch)
-
-    def pull(self):
-        # collect prefix of D0 up to M
-        d0_acc = []
-        for batch in self.D0:
-            for k, v in batch:
-                # only consider current map value
-                cur = self.key_map.get(k)
-                if cur is not None:
-                    d0_acc.append((k, cur))
-                if len(d0_acc) >= self.M:
-                    break
-            if len(d0_acc) >= self.M:
+                key_map[k] = v
+                batch.append((k, v))
+        if not batch:
+            return
+        batch.sort(key=lambda x: x[1])
+        M = self.M
+        for start in range(((len(batch) - 1) // M) * M, -1, -M):
+            self.D0.appendleft(batch[start:start + M])
+
+    def _collect_d0(self):
+        """Pop D0 blocks from the front until >= M live entries are gathered."""
+        acc = []
+        while self.D0 and len(acc) < self.M:
+            acc.extend(self._live(self.D0.popleft()))
+        return acc
+
+    def _collect_d1(self):
+        """Take D1 blocks from the front until >= M live entries are gathered (last block kept)."""
+        acc = []
+        taken = 0
+        while taken < len(self.D1) - 1 and len(acc) < self.M:
+            acc.extend(self._live(self.D1[taken].items))
+            taken += 1
+        if len(acc) < self.M:
+            last = self.D1[-1]
+            acc.extend(self._live(last.items))
+            last.items = []
+        del self.D1[:taken]
+        del self.D1_bounds[:taken]
+        return acc
+
+    def _head_min(self):
+        """Smallest live value at the front of D0 / D1, dropping fully stale head blocks."""
+        best = float('inf')
+        while self.D0:
+            live = self._live(self.D0[0])
+            if live:
+                self.D0[0] = live
+                best = min(v for _, v in live)
                 break
+            self.D0.popleft()
+        while self.D1:
+            blk = self.D1[0]
+            live = self._live(blk.items)
+            if live or len(self.D1) == 1:
+                blk.items = live
+                if live:
+                    best = min(best, min(v for _, v in live))
+                break
+            del self.D1[0]
+            del self.D1_bounds[0]
+        return best
 
-        # collect blocks from D1 until we have at least M candidates
-        d1_acc = []
-        idx = 0
-        while len(d0_acc) + len(d1_acc) < self.M and idx < len(self.D1):
-            blk = self.D1[idx]
-            for k, v in blk.items:
-                cur = self.key_map.get(k)
-                if cur is not None:
-                    d1_acc.append((k, cur))
-            idx += 1
+    def pull(self):
+        d0_acc = self._collect_d0()
+        d1_acc = self._collect_d1()
 
         if not d0_acc and not d1_acc:
             return [], self.B
 
-        # deduplicate and choose best per key
-        cand = d0_acc + d1_acc
+        # deduplicate and choose best per key (remember where each came from)
         best = {}
-        for k, v in cand:
-            if k not in best or v < best[k]:
-                best[k] = v
-        cand_list = [(k, best[k]) for k in best]
+        for k, v in d0_acc:
+            best[k] = (v, 0)
+        for k, v in d1_acc:
+            if k not in best or v < best[k][0]:
+                best[k] = (v, 1)
+        cand_list = [(k, vo[0], vo[1]) for k, vo in best.items()]
 
         if len(cand_list) <= self.M:
             chosen = cand_list
+            rest = []
         else:
-            chosen = heapq.nsmallest(self.M, cand_list, key=lambda x: x[1])
+            cand_list.sort(key=lambda x: x[1])
+            chosen = cand_list[:self.M]
+            rest = cand_list[self.M:]
 
-        chosen_keys = [k for k, _ in chosen]
-        max_chosen = max(v for _, v in chosen) if chosen else self.B
+        chosen_keys = [k for k, _, _ in chosen]
 
         # remove chosen keys from key_map so they won't be returned again until re-inserted
         for k in chosen_keys:
             self.key_map.pop(k, None)
 
-        # find smallest remaining value (separator) among key_map
-        smallest_remain = float('inf')
-        for val in self.key_map.values():
-            if val < smallest_remain:
-                smallest_remain = val
+        # leftovers go back to the front of the sequence they came from
+        rest0 = [(k, v) for k, v, origin in rest if origin == 0]
+        rest1 = [(k, v) for k, v, origin in rest if origin == 1]
+        if rest0:
+            self.D0.appendleft(rest0)
+        if rest1:
+            ub = max(v for _, v in rest1)
+            if len(self.D1) == 1 and not self.D1[0].items:
+                self.D1[0].items = rest1
+            else:
+                self.D1.insert(0, Block(rest1, ub))
+                self.D1_bounds.insert(0, ub)
+
+        # separator: smallest remaining value (head blocks are the only candidates)
+        smallest_remain = self._head_min()
         separator = smallest_remain if smallest_remain != float('inf') else self.B
 
         return chosen_keys, separator
@@ -0,0 +1,327 @@
+# algorithms/hpa.py
+"""
+Hierarchical path-finding A* (HPA*, Botea, Mueller & Schaeffer, 2004) on grid graphs.
+
+The map is cut into cluster_size x cluster_size clusters. Along every border between two
+neighbouring clusters, each maximal run of cell pairs that are free on both sides becomes
+an entrance: one transition in the middle of the run, or one at each end for runs of at
+least LONG_ENTRANCE pairs. The transition cells are the abstract nodes; they are linked by
+ - inter edges: the grid edge across the border
+ - intra edges: the shortest path between two transition cells of the same cluster,
+   found by dijkstra restricted to that cluster (the cell path is kept for refinement)
+A query connects source and target to the transition cells of their clusters (again one
+cluster-local dijkstra each), runs A* over the small abstract graph and splices the stored
+cell paths together. Paths are near-optimal: they only cross borders at transitions.
+
+Obstacle changes (block_cell / unblock_cell / mark_changed) are applied lazily at the next
+query: only the cluster containing a changed cell, plus the neighbour across a border the
+cell lies on, are rebuilt. Edits made to the graph behind the hierarchy's back (its version
+changed) force a full rebuild.
+
+Needs an undirected grid graph carrying .shape = (rows, cols), node id = r * cols + c:
+generate_grid_graph graphs (pass their `obstacles` list, the adjacency still links blocked
+cells) or a core.grid_graph.GridGraph.
+"""
+
+from typing import Dict, List, Tuple
+
+from .astar import astar, grid_heuristic
+from .dijkstra import dijkstra
+
+INF = float('inf')
+LONG_ENTRANCE = 6
+
+
+class _ClusterView:
+    """The free cells of one cluster as a graph: edges leaving the box are hidden."""
+
+    def __init__(self, hpa, cluster):
+        cs = hpa.cluster_size
+        cols = hpa.cols
+        r0 = cluster[0] * cs
+        c0 = cluster[1] * cs
+        r1 = min(r0 + cs, hpa.rows)
+        c1 = min(c0 + cs, cols)
+        self.nodes = [r * cols + c for r in range(r0, r1) for c in range(c0, c1)]
+        # filtered once per build: every entrance runs a search over the same cells
+        free = hpa.is_free
+        get = hpa.graph.get_neighbors
+        self.adj = {u: [(v, w) for v, w in get(u)
+                        if r0 <= v // cols < r1 and c0 <= v % cols < c1 and free(v)]
+                    for u in self.nodes if free(u)}
+
+    def get_neighbors(self, u):
+        return self.adj.get(u, ())
+
+    neighbors = get_neighbors
+
+
+class _AbstractView:
+    """Abstract graph plus the temporary source / target edges of one query, for astar()."""
+
+    def __init__(self, hpa, extra):
+        self.hpa = hpa
+        self.extra = extra
+
+    def get_neighbors(self, u):
+        hpa = self.hpa
+        out = list(hpa._inter.get(u, {}).items())
+        out.extend(hpa._intra.get(u, {}).items())
+        extra = self.extra.get(u)
+        if extra:
+            out.extend(extra.items())
+        return out
+
+    neighbors = get_neighbors
+
+
+class HPAStar:
+    """
+    hpa = HPAStar(graph, cluster_size=16, obstacles=obstacles)
+    path = hpa.find_path(source, target)        # [] if unreachable
+    hpa.block_cell(node)                        # next query rebuilds the touched clusters
+    """
+
+    def __init__(self, graph, cluster_size: int = 16, obstacles=None):
+        shape = getattr(graph, "shape", None)
+        if shape is None:
+            raise ValueError("HPAStar needs a grid graph with .shape = (rows, cols)")
+        if getattr(graph, "directed", False):
+            raise ValueError("HPAStar needs an undirected graph")
+        if cluster_size < 2:
+            raise ValueError("cluster_size must be at least 2")
+        self.graph = graph
+        self.rows, self.cols = shape
+        self.cluster_size = cluster_size
+        self.obstacles = obstacles
+        self.heuristic = grid_heuristic(graph)
+        self.cluster_rows = -(-self.rows // cluster_size)
+        self.cluster_cols = -(-self.cols // cluster_size)
+
+        self._border = {}           # (cluster, cluster) -> [(a, b, w), ...] transition pairs
+        self._inter = {}            # cell -> {cell across a border: w}
+        self._intra = {}            # transition cell -> {transition cell of the same cluster: d}
+        self._paths = {}            # cluster -> {(u, v): cells from u to v}, u < v
+        self._entrances = {}        # cluster -> transition cells in it
+        self._dirty = set()
+        self.clusters_built = 0     # cluster (re)builds so far
+        self.last_stats = {}
+        self.rebuild()
+
+    # --- cells / clusters ----------------------------------------------------
+
+    def is_free(self, v) -> bool:
+        obstacles = self.obstacles
+        if obstacles is not None and obstacles[v]:
+            return False
+        is_blocked = getattr(self.graph, "is_blocked", None)
+        return not (is_blocked is not None and is_blocked(v))
+
+    def cluster_of(self, v) -> Tuple[int, int]:
+        r, c = divmod(v, self.cols)
+        return r // self.cluster_size, c // self.cluster_size
+
+    def _borders_of(self, cluster):
+        cr, cc = cluster
+        if cr > 0:
+            yield (cr - 1, cc), cluster
+        if cr < self.cluster_rows - 1:
+            yield cluster, (cr + 1, cc)
+        if cc > 0:
+            yield (cr, cc - 1), cluster
+        if cc < self.cluster_cols - 1:
+            yield cluster, (cr, cc + 1)
+
+    @property
+    def num_abstract_nodes(self) -> int:
+        return sum(len(e) for e in self._entrances.values())
+
+    # --- building ------------------------------------------------------------
+
+    def rebuild(self):
+        """(Re)build the whole hierarchy from the current obstacles."""
+        self._border.clear()
+        self._inter.clear()
+        self._intra.clear()
+        self._paths.clear()
+        self._entrances.clear()
+        self._dirty.clear()
+        self.graph_version = getattr(self.graph, "version", 0)
+        clusters = [(cr, cc) for cr in range(self.cluster_rows) for cc in range(self.cluster_cols)]
+        for cluster in clusters:
+            for key in self._borders_of(cluster):
+                if key[0] == cluster:
+                    self._build_border(key)
+        for cluster in clusters:
+            self._build_cluster(cluster)
+
+    def _edge_weight(self, a, b):
+        for v, w in self.graph.get_neighbors(a):
+            if v == b:
+                return w
+        return None
+
+    def _build_border(self, key):
+        for a, b, _ in self._border.get(key, ()):
+            self._inter[a].pop(b, None)
+            self._inter[b].pop(a, None)
+        (cr, cc), (dr, dc) = key
+        cs, cols = self.cluster_size, self.cols
+        if dr > cr:     # horizontal border: last row of the upper cluster / first of the lower
+            r = dr * cs - 1
+            pairs = [(r * cols + c, (r + 1) * cols + c)
+                     for c in range(cc * cs, min((cc + 1) * cs, cols))]
+        else:           # vertical border
+            c = dc * cs - 1
+            pairs = [(r * cols + c, r * cols + c + 1)
+                     for r in range(cr * cs, min((cr + 1) * cs, self.rows))]
+        transitions = []
+        run = []
+        for a, b in pairs + [(None, None)]:
+            w = None
+            if a is not None and self.is_free(a) and self.is_free(b):
+                w = self._edge_weight(a, b)
+            if w is not None:
+                run.append((a, b, w))
+                continue
+            if len(run) >= LONG_ENTRANCE:
+                transitions.extend((run[0], run[-1]))
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+        self._border[key] = transitions
+        for a, b, w in transitions:
+            self._inter.setdefault(a, {})[b] = w
+            self._inter.setdefault(b, {})[a] = w
+
+    def _build_cluster(self, cluster):
+        for u in self._entrances.get(cluster, ()):
+            self._intra.pop(u, None)
+        entrances = set()
+        for key in self._borders_of(cluster):
+            side = 0 if key[0] == cluster else 1
+            entrances.update(t[side] for t in self._border.get(key, ()))
+        entrances = sorted(entrances)
+        self._entrances[cluster] = entrances
+        paths = self._paths[cluster] = {}
+        view = _ClusterView(self, cluster)
+        # undirected: one search per pair (u < v), the path is reversed for v -> u
+        for i, u in enumerate(entrances[:-1]):
+            dist, pred = dijkstra(view, u)
+            for v in entrances[i + 1:]:
+                d = dist[v]
+                if d == INF:
+                    continue
+                self._intra.setdefault(u, {})[v] = d
+                self._intra.setdefault(v, {})[u] = d
+                paths[(u, v)] = _walk(pred, v)
+        self.clusters_built += 1
+
+    # --- obstacle changes ------------------------------------------------------
+
+    def mark_changed(self, v):
+        """Cell v changed free / blocked (e.g. in the obstacles list); applied at the next query."""
+        self._dirty.add(v)
+
+    def block_cell(self, v):
+        """Tombstone v in the graph and mark it changed."""
+        self.graph.block_node(v)
+        self.graph_version = getattr(self.graph, "version", 0)
+        self._dirty.add(v)
+
+    def unblock_cell(self, v):
+        self.graph.unblock_node(v)
+        self.graph_version = getattr(self.graph, "version", 0)
+        self._dirty.add(v)
+
+    def refresh(self):
+        """Rebuild what the pending changes touched (everything if the graph changed elsewhere)."""
+        if getattr(self.graph, "version", 0) != self.graph_version:
+            self.rebuild()
+            return
+        if not self._dirty:
+            return
+        cs = self.cluster_size
+        borders = set()
+        clusters = set()
+        for v in self._dirty:
+            cluster = self.cluster_of(v)
+            clusters.add(cluster)
+            r, c = divmod(v, self.cols)
+            for key in self._borders_of(cluster):
+                lower = key[0] == cluster           # v's cluster is the upper / left one
+                if key[0][0] != key[1][0]:
+                    touches = r % cs == (cs - 1 if lower else 0)
+                else:
+                    touches = c % cs == (cs - 1 if lower else 0)
+                if touches:
+                    borders.add(key)
+        for key in borders:
+            self._build_border(key)
+            clusters.update(key)
+        for cluster in clusters:
+            self._build_cluster(cluster)
+        self._dirty.clear()
+
+    # --- queries -------------------------------------------------------------------
+
+    def _local(self, v):
+        """dijkstra from v inside its cluster: (dist, pred) over the cluster's cells."""
+        return dijkstra(_ClusterView(self, self.cluster_of(v)), v)
+
+    def find_path(self, source: int, target: int) -> List[int]:
+        """Cells from source to target ([] if either is blocked or no path exists)."""
+        self.refresh()
+        self.last_stats = {"expanded": 0, "abstract_nodes": self.num_abstract_nodes}
+        if not (self.is_free(source) and self.is_free(target)):
+            return []
+        if source == target:
+            return [source]
+        s_dist, s_pred = self._local(source)
+        t_dist, t_pred = self._local(target)
+        extra: Dict[int, Dict[int, float]] = {source: {}}
+        for e in self._entrances[self.cluster_of(source)]:
+            if e != source and s_dist[e] < INF:
+                extra[source][e] = s_dist[e]
+        for e in self._entrances[self.cluster_of(target)]:
+            if e != target and t_dist[e] < INF:
+                extra.setdefault(e, {})[target] = t_dist[e]
+        if s_dist.get(target, INF) < INF:
+            extra[source][target] = s_dist[target]
+
+        dist, pred, info = astar(_AbstractView(self, extra), source, target, self.heuristic)
+        self.last_stats["expanded"] = info["expanded"]
+        self.last_stats["distance"] = info["distance"]
+        if info["distance"] == INF:
+            return []
+        hops = _walk(pred, target)
+        path = [source]
+        for a, b in zip(hops, hops[1:]):
+            path.extend(self._refine(a, b, extra, source, target, s_pred, t_pred)[1:])
+        return path
+
+    def _refine(self, a, b, extra, source, target, s_pred, t_pred):
+        """Cell path of the cheapest abstract edge a -> b."""
+        options = []
+        if b in self._inter.get(a, ()):
+            options.append((self._inter[a][b], [a, b]))
+        if b in self._intra.get(a, ()):
+            paths = self._paths[self.cluster_of(a)]
+            cells = paths[(a, b)] if a < b else paths[(b, a)][::-1]
+            options.append((self._intra[a][b], cells))
+        if b in extra.get(a, ()):
+            if a == source:
+                cells = _walk(s_pred, b)
+            else:
+                cells = _walk(t_pred, a)[::-1]      # t_pred is rooted at target
+            options.append((extra[a][b], cells))
+        return min(options, key=lambda o: o[0])[1]
+
+
+def _walk(pred, v) -> List[int]:
+    path = []
+    while v is not None:
+        path.append(v)
+        v = pred[v]
+    path.reverse()
+    return path
@@ -0,0 +1,257 @@
+# algorithms/incremental.py
+"""
+Incremental replanning with D* Lite (Koenig & Likhachev, 2002).
+
+The search runs backwards from the goal and keeps g / rhs labels plus its open list
+between calls. Cost changes arrive as deltas (update_edge, block_node, unblock_node) and
+only the vertices whose rhs depended on a changed edge are re-queued, so a replan touches
+the affected part of the shortest-path tree instead of the whole graph. The start may move
+between calls (set_start), which D* Lite absorbs through the key modifier km.
+
+The planner never mutates the graph: blocked vertices and edge cost overrides live in an
+overlay on top of graph.get_neighbors(). Undirected graphs (Graph.add_edge) use the same
+adjacency for predecessors; directed CSR graphs use their transpose.
+
+Neighbour lists are cached as first read. After block_node / unblock_node the next plan()
+re-reads the lists of v and the cells around it, so the cell may also be (un)blocked in
+the graph itself: on an 8-connected GridGraph that drops or restores the diagonals that
+cut v's corners, which the overlay alone cannot know about. Block in the planner before
+the graph (a blocked cell has no neighbours left to find its surroundings by).
+"""
+
+import heapq
+from typing import Callable, Dict, List
+
+INF = float('inf')
+
+class DStarLite:
+    def __init__(self, graph, start: int, goal: int, heuristic: Callable[[int, int], float] = None):
+        self.graph = graph
+        self.graph_version = getattr(graph, "version", 0)  # graph edits behind our back invalidate the labels
+        self.reverse = graph.reversed() if getattr(graph, "directed", False) else graph
+        self.start = start
+        self.goal = goal
+        self.h = heuristic or (lambda a, b: 0.0)
+        self.km = 0.0
+        self._last_start = start
+
+        self.g = {}
+        self.rhs = {goal: 0.0}
+        self._open = {}          # vertex -> current key (lazy heap, stale entries skipped)
+        self._heap = []
+        self.blocked = set()
+        self.cost_override = {}  # (u, v) -> cost, INF = edge removed
+        self._out = {}           # u -> graph's out-edges of u as last read
+        self._in = self._out if self.reverse is graph else {}
+        self._changed = set()    # cells (un)blocked since the last plan()
+        self._around_changed = set()
+
+        self.expanded = 0        # vertices expanded by the last plan()
+        self.total_expanded = 0
+        self._push(goal)
+
+    # --- costs / adjacency -------------------------------------------------
+
+    def _cost(self, u, v, w):
+        if u in self.blocked or v in self.blocked:
+            return INF
+        if self.cost_override:
+            return self.cost_override.get((u, v), w)
+        return w
+
+    def _succ(self, u):
+        nbrs = self._out.get(u)
+        if nbrs is None:
+            nbrs = self._out[u] = list(self.graph.get_neighbors(u))
+        for v, w in nbrs:
+            yield v, self._cost(u, v, w)
+
+    def _pred(self, v):
+        nbrs = self._in.get(v)
+        if nbrs is None:
+            nbrs = self._in[v] = list(self.reverse.get_neighbors(v))
+        for u, w in nbrs:
+            yield u, self._cost(u, v, w)
+
+    # --- open list ---------------------------------------------------------
+
+    def _key(self, s):
+        k2 = min(self.g.get(s, INF), self.rhs.get(s, INF))
+        return (k2 + self.h(self.start, s) + self.km, k2)
+
+    def _push(self, s):
+        key = self._key(s)
+        self._open[s] = key
+        heapq.heappush(self._heap, (key, s))
+
+    def _top(self):
+        heap = self._heap
+        while heap:
+            key, s = heap[0]
+            if self._open.get(s) == key:
+                return key, s
+            heapq.heappop(heap)
+        return (INF, INF), None
+
+    def _update_vertex(self, s):
+        if self.g.get(s, INF) != self.rhs.get(s, INF):
+            self._push(s)
+        else:
+            self._open.pop(s, None)
+
+    def _best_rhs(self, u):
+        best = INF
+        g = self.g
+        for v, c in self._succ(u):
+            val = c + g.get(v, INF)
+            if val < best:
+                best = val
+        return best
+
+    # --- deltas ------------------------------------------------------------
+
+    def _edges_changed(self, changes):
+        """changes: iterable of (u, v, old_cost) applied *after* the overlay was updated."""
+        g = self.g
+        for u, v, c_old in changes:
+            if u == self.goal:
+                continue
+            c_new = self._cost(u, v, self._base_cost(u, v))
+            if c_new < c_old:
+                self.rhs[u] = min(self.rhs.get(u, INF), c_new + g.get(v, INF))
+            elif self.rhs.get(u, INF) == c_old + g.get(v, INF):
+                self.rhs[u] = self._best_rhs(u)
+            self._update_vertex(u)
+
+    def _base_cost(self, u, v):
+        best = INF
+        for x, w in self.graph.get_neighbors(u):
+            if x == v and w < best:
+                best = w
+        return best
+
+    def _around(self, v):
+        """v plus every cell next to it, in the cached and in the current adjacency."""
+        cells = {v}
+        for lists, graph in ((self._out, self.graph), (self._in, self.reverse)):
+            cells.update(x for x, _ in lists.get(v, ()))
+            cells.update(x for x, _ in graph.get_neighbors(v))
+        return cells
+
+    def _cells_changed(self):
+        """Re-read the edges around every (un)blocked cell and repair the rhs of their tails."""
+        cells = self._around_changed
+        for v in self._changed:
+            cells |= self._around(v)
+        for u in cells:
+            self._out.pop(u, None)
+            self._in.pop(u, None)
+        rhs = self.rhs
+        for u in cells:
+            if u != self.goal:
+                rhs[u] = self._best_rhs(u)
+                self._update_vertex(u)
+        self._changed = set()
+        self._around_changed = set()
+
+    def update_edge(self, u: int, v: int, w: float):
+        """Set the cost of u->v (and v->u on undirected graphs); w=INF removes the edge."""
+        pairs = [(u, v)]
+        if not getattr(self.graph, "directed", False):
+            pairs.append((v, u))
+        changes = []
+        for a, b in pairs:
+            changes.append((a, b, self._cost(a, b, self._base_cost(a, b))))
+            self.cost_override[(a, b)] = w
+        self._edges_changed(changes)
+
+    def block_node(self, v: int):
+        if v in self.blocked:
+            return
+        self.blocked.add(v)
+        self._changed.add(v)
+        self._around_changed |= self._around(v)
+
+    def unblock_node(self, v: int):
+        if v not in self.blocked:
+            return
+        self.blocked.discard(v)
+        self._changed.add(v)
+        self._around_changed |= self._around(v)
+
+    def set_start(self, start: int):
+        """Robot moved: keep all labels, shift keys by h(old_start, new_start)."""
+        if start == self.start:
+            return
+        self.km += self.h(self._last_start, start)
+        self._last_start = start
+        self.start = start
+
+    # --- search ------------------------------------------------------------
+
+    def compute_shortest_path(self):
+        if self._changed:
+            self._cells_changed()
+        g = self.g
+        rhs = self.rhs
+        start = self.start
+        expanded = 0
+        while True:
+            k_old, u = self._top()
+            if u is None:
+                break
+            start_key = self._key(start)
+            if not (k_old < start_key or rhs.get(start, INF) > g.get(start, INF)):
+                break
+            expanded += 1
+            k_new = self._key(u)
+            if k_old < k_new:
+                self._push(u)
+            elif g.get(u, INF) > rhs.get(u, INF):
+                g[u] = rhs[u]
+                self._open.pop(u, None)
+                gu = g[u]
+                for s, c in self._pred(u):
+                    if s != self.goal and c + gu < rhs.get(s, INF):
+                        rhs[s] = c + gu
+                        self._update_vertex(s)
+            else:
+                g_old = g.get(u, INF)
+                g[u] = INF
+                if u != self.goal and rhs.get(u, INF) == g_old:
+                    rhs[u] = self._best_rhs(u)
+                self._update_vertex(u)
+                for s, c in self._pred(u):
+                    if s != self.goal and rhs.get(s, INF) == c + g_old:
+                        rhs[s] = self._best_rhs(s)
+                        self._update_vertex(s)
+        self.expanded = expanded
+        self.total_expanded += expanded
+
+    def plan(self) -> List[int]:
+        """Repair the search tree and return the current start->goal path ([] if unreachable)."""
+        self.compute_shortest_path()
+        # rhs(start) is exact on termination (g(start) itself may still be stale)
+        if self.rhs.get(self.start, INF) == INF:
+            return []
+        path = [self.start]
+        seen = {self.start}
+        u = self.start
+        while u != self.goal:
+            best, nxt = INF, None
+            for v, c in self._succ(u):
+                val = c + self.g.get(v, INF)
+                if val < best:
+                    best, nxt = val, v
+            if nxt is None or nxt in seen:
+                return []
+            path.append(nxt)
+            seen.add(nxt)
+            u = nxt
+        return path
+
+    def distance(self) -> float:
+        return self.rhs.get(self.start, INF)
+
+    def labels(self) -> Dict[int, float]:
+        return dict(self.g)
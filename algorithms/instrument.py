@@ -0,0 +1,102 @@
+# algorithms/instrument.py
+"""
+Optional instrumentation for the BMSSP pipeline.
+
+A Profiler collects
+ - counters: relaxations (labels lowered), heap_pushes / heap_pops, pulls, inserts,
+   batch_prepends, recursion_calls, stalls (frames cut short because a child made no progress), ...
+ - wall time per phase (perf_counter, inclusive): find_pivots, base_case, ds_insert,
+   ds_pull, ds_batch_prepend, recursion, verify, repair
+ - the deepest recursion level reached
+
+It is hung on SSSPState.profiler. When that is None (the default) the hot loops only pay
+for a few local integer adds per call; timing and the DS proxy exist only while profiling.
+
+    prof = Profiler(callback=lambda phase, seconds: print(phase, seconds))
+    state, info = run_bmssp(graph, 0, profile=prof)
+    info["profile"]   # == prof.report()
+"""
+
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Optional
+
+perf_counter = time.perf_counter
+
+
+class Profiler:
+    def __init__(self, callback: Optional[Callable[[str, float], None]] = None):
+        self.counters = defaultdict(int)
+        self.phases = defaultdict(float)
+        self.callback = callback        # called as callback(phase, seconds) after each timed span
+        self.min_level = None
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] += n
+
+    def add_time(self, phase: str, seconds: float):
+        self.phases[phase] += seconds
+        if self.callback is not None:
+            self.callback(phase, seconds)
+
+    def phase(self, name: str):
+        """Context manager timing one span of `name`."""
+        return _Span(self, name)
+
+    def enter_level(self, level: int):
+        self.counters["recursion_calls"] += 1
+        if self.min_level is None or level < self.min_level:
+            self.min_level = level
+
+    def wrap_ds(self, ds):
+        return _ProfiledDS(ds, self)
+
+    def report(self) -> Dict:
+        return {"counters": dict(self.counters), "phases": dict(self.phases)}
+
+
+class _Span:
+    __slots__ = ("prof", "name", "t0")
+
+    def __init__(self, prof: Profiler, name: str):
+        self.prof = prof
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.prof.add_time(self.name, perf_counter() - self.t0)
+
+
+class _ProfiledDS:
+    """PartialSortingDS proxy counting and timing insert / batch_prepend / pull."""
+
+    def __init__(self, ds, prof: Profiler):
+        self.ds = ds
+        self.prof = prof
+
+    def insert(self, pair):
+        t0 = perf_counter()
+        self.ds.insert(pair)
+        self.prof.add_time("ds_insert", perf_counter() - t0)
+        self.prof.counters["inserts"] += 1
+
+    def batch_prepend(self, pairs):
+        t0 = perf_counter()
+        self.ds.batch_prepend(pairs)
+        self.prof.add_time("ds_batch_prepend", perf_counter() - t0)
+        self.prof.counters["batch_prepends"] += 1
+        self.prof.counters["batch_prepend_items"] += len(pairs)
+
+    def pull(self):
+        t0 = perf_counter()
+        out = self.ds.pull()
+        self.prof.add_time("ds_pull", perf_counter() - t0)
+        self.prof.counters["pulls"] += 1
+        self.prof.counters["pulled_items"] += len(out[0])
+        return out
+
+    def is_empty(self):
+        return self.ds.is_empty()
@@ -0,0 +1,199 @@
+# algorithms/parallel.py
+"""
+Process pool for work *inside* one shortest-path query (batch.py parallelises across
+sources instead).
+
+WorkerPool(graph, workers) shares the graph the same way batch.py does (one shared-memory
+CSR copy, or the mapped file of a load_csr graph) plus one shared float64 label array
+`pool.dist`. Workers only read shared memory; they send back *proposals* (v, d, parent)
+and the parent applies them with a min-reduction, so no two processes ever write the
+same label.
+
+Two tasks run on it:
+ - expand_seeds: bounded per-seed Dijkstra expansions for the BMSSP base case
+   (run_bmssp(..., pool=pool) -> pool.base_case); each worker expands its seeds with
+   private labels
+ - relax: one delta-stepping phase (light or heavy edges of a bucket), filtered against
+   the shared labels (delta_stepping.delta_stepping(..., pool=pool))
+
+Work below min_batch items stays in the calling process: a pool round trip costs far
+more than a handful of relaxations.
+
+    with WorkerPool(graph, workers=8) as pool:
+        state, info = run_bmssp(graph, 0, pool=pool)
+        dist, pred = delta_stepping(graph, 0, pool=pool)
+"""
+
+import heapq
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Tuple
+
+from core.graph_io import load_csr
+from .batch import SharedCSR, as_csr, attach_csr
+from .delta_stepping import relax_edges
+
+INF = float('inf')
+MIN_BATCH = 256         # fewer seeds / frontier nodes than this are handled in-process
+
+# --- worker side ----------------------------------------------------------------
+
+_WORKER = {}
+
+def _init_worker(spec, dist_name, n):
+    if spec[0] == "mmap":
+        graph, shm = load_csr(spec[1]), None
+    else:
+        graph, shm = attach_csr(spec)
+    dist_shm = SharedMemory(name=dist_name)
+    _WORKER["graph"] = graph
+    _WORKER["shm"] = shm
+    _WORKER["dist_shm"] = dist_shm
+    _WORKER["dist"] = dist_shm.buf[:8 * n].cast('d')
+
+def expand_seed(graph, s: int, ds: float, B: float, k: int, known=None):
+    """
+    Bounded Dijkstra from s (label ds) on private labels: settles up to k + 1 vertices
+    below B. Returns (settled [(v, d)] in order, proposals [(v, d, parent)]).
+    known: labels at dispatch time (the pool's shared snapshot); vertices that already
+    have a smaller one are not expanded and only strict improvements are proposed.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    label = {s: ds}
+    parent = {}
+    done = set()
+    settled = []
+    heap = [(ds, s)]
+    while heap and len(settled) <= k:
+        d, u = heapq.heappop(heap)
+        if d > label[u] or u in done:
+            continue
+        if d >= B:
+            break
+        done.add(u)
+        settled.append((u, d))
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            nd = d + weights[e]
+            if nd < B and nd < label.get(v, INF):
+                if known is not None and nd > known[v]:
+                    continue
+                label[v] = nd
+                parent[v] = u
+                heapq.heappush(heap, (nd, v))
+    if known is None:
+        return settled, [(v, label[v], p) for v, p in parent.items()]
+    return settled, [(v, label[v], p) for v, p in parent.items() if label[v] < known[v]]
+
+def _expand_task(args):
+    seeds, B, k = args
+    graph = _WORKER["graph"]
+    known = _WORKER["dist"]
+    return [expand_seed(graph, s, ds, B, k, known) for s, ds in seeds]
+
+def _relax_task(args):
+    nodes, delta, light = args
+    return relax_edges(_WORKER["graph"], _WORKER["dist"], nodes, delta, light)
+
+# --- parent side ------------------------------------------------------------------
+
+def _chunks(items, parts: int):
+    size = -(-len(items) // parts)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+class WorkerPool:
+    """
+    Worker processes attached to one graph. Use as a context manager (or call close())
+    so the processes exit and the shared blocks are unlinked.
+    """
+
+    def __init__(self, graph, workers: int = 2, min_batch: int = MIN_BATCH):
+        self.graph = as_csr(graph)
+        self.workers = max(1, int(workers))
+        self.min_batch = min_batch
+        n = self.graph.num_nodes
+        path = getattr(self.graph, "mapped_path", None)
+        self._shared = None if path else SharedCSR(self.graph)
+        spec = ("mmap", path) if path else self._shared.spec
+        self._dist_shm = SharedMemory(create=True, size=max(8, 8 * n))
+        self.dist = self._dist_shm.buf[:8 * n].cast('d')
+        self._pool = get_context().Pool(self.workers, initializer=_init_worker,
+                                         initargs=(spec, self._dist_shm.name, n))
+
+    def expand_seeds(self, seeds: List[Tuple[int, float]], B: float, k: int):
+        """
+        expand_seed for every (s, ds) in seeds, spread over the workers (results in seed order).
+        Workers prune against self.dist: publish the current labels there first.
+        """
+        tasks = [(chunk, B, k) for chunk in _chunks(seeds, self.workers)]
+        out = []
+        for part in self._pool.map(_expand_task, tasks):
+            out.extend(part)
+        return out
+
+    def relax(self, nodes: List[int], delta: float, light: bool):
+        """relax_edges over the shared labels, one chunk of nodes per worker (proposals concatenated)."""
+        tasks = [(chunk, delta, light) for chunk in _chunks(nodes, self.workers)]
+        out = []
+        for part in self._pool.map(_relax_task, tasks):
+            out.extend(part)
+        return out
+
+    def base_case(self, B: float, S: List[int], state, k: int) -> Tuple[float, List[int]]:
+        """
+        BMSSP level 0 for many seeds at once: per-seed expansions run on the pool, their label
+        proposals are merged into state with a min-reduction (every lowered label becomes a seed,
+        as in mini_dijkstra). Returns (B_prime, U) like the sequential base case.
+        """
+        dist = state.dist
+        pred = state.pred
+        seed_mark = state.seed_mark
+        seed_list = state.seed_list
+        relaxed = 0
+        Bprime_min = B
+        U_total = []
+        in_U, gen = state.stamp(("U", 0))
+        self.dist[:] = dist             # snapshot the labels for the workers to prune against
+        for settled, proposals in self.expand_seeds([(s, dist[s]) for s in S], B, k):
+            for v, d, p in proposals:
+                if d < dist[v]:
+                    dist[v] = d
+                    pred[v] = p
+                    relaxed += 1
+                    if not seed_mark[v]:
+                        seed_mark[v] = 1
+                        seed_list.append(v)
+            if len(settled) <= k:
+                U = settled
+            else:
+                Bp = max(d for _, d in settled)
+                Bprime_min = min(Bprime_min, Bp)
+                U = [(v, d) for v, d in settled if d < Bp]
+            for u, _ in U:
+                if in_U[u] != gen:
+                    in_U[u] = gen
+                    U_total.append(u)
+        # as in the sequential base case: only vertices below the smallest B' are complete
+        U_total = [u for u in U_total if dist[u] < Bprime_min]
+        prof = state.profiler
+        if prof is not None:
+            prof.count("relaxations", relaxed)
+            prof.count("parallel_base_cases")
+        return Bprime_min, U_total
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self.dist.release()
+            self._dist_shm.close()
+            self._dist_shm.unlink()
+            if self._shared is not None:
+                self._shared.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
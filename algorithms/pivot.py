@@ -5,69 +5,114 @@ Per Lemma 3.2: given bound B and set S, perform k-step relaxations (bounded Bell
 to grow W. If W becomes large (> k|S|) return P = S. Otherwise, build forest among W using predecessor
 relationships and select pivots P as roots of subtrees with size >= k.
 
-This implementation updates distances in-place and returns (P, W).
+This implementation updates state.dist / state.pred in-place and returns (P, W) as lists.
+Nodes whose label is lowered are marked as seeds in the state: relaxation stops at B,
+so their labels still have to be propagated later.
+W / frontier membership uses the state's generation-stamped marks, not per-call sets.
+With state.relaxer set (NumPy backend), large frontiers are relaxed as one batch per round.
 """
 
-from collections import defaultdict
-from typing import Set, Dict, Tuple
+from typing import List, Tuple
+from .state import SSSPState
 
-def find_pivots(graph, distances: Dict[int, float], S: Set[int], B: float, k: int):
-    W = set(S)
-    frontier = set(S)
-    pred = {}
+
+def find_pivots(graph, state: SSSPState, S: List[int], B: float, k: int) -> Tuple[List[int], List[int]]:
+    dist = state.dist
+    pred = state.pred
+    seed_mark = state.seed_mark
+    seed_list = state.seed_list
+
+    in_W, gW = state.stamp("pivot_W")
+    lowered, gL = state.stamp("pivot_lowered")
+    W = []
+    for s in S:
+        if in_W[s] != gW:
+            in_W[s] = gW
+            W.append(s)
+    frontier = list(W)
+    limit = k * max(1, len(S))
+    relaxed = 0
+    vec = state.relaxer
 
     for _ in range(max(1, k)):
-        new_frontier = set()
-        for u in list(frontier):
-            d_u = distances.get(u, float('inf'))
+        if vec is not None and len(frontier) >= vec.min_frontier:
+            frontier, lowered_now = vec.relax_round(frontier, B, in_W, gW, W, lowered, gL)
+            relaxed += lowered_now
+            if len(W) > limit:
+                break
+            continue
+        in_next, gN = state.stamp("pivot_frontier")
+        new_frontier = []
+        for u in frontier:
+            d_u = dist[u]
             if d_u >= B:
                 continue
             for v, w in graph.get_neighbors(u):
                 newd = d_u + w
-                if newd < distances.get(v, float('inf')) and newd < B:
-                    distances[v] = newd
+                if newd < dist[v] and newd < B:
+                    dist[v] = newd
                     pred[v] = u
-                    new_frontier.add(v)
-                    W.add(v)
+                    relaxed += 1
+                    lowered[v] = gL
+                    if not seed_mark[v]:
+                        seed_mark[v] = 1
+                        seed_list.append(v)
+                    if in_next[v] != gN:
+                        in_next[v] = gN
+                        new_frontier.append(v)
+                    if in_W[v] != gW:
+                        in_W[v] = gW
+                        W.append(v)
         frontier = new_frontier
-        if len(W) > k * max(1, len(S)):
-            return set(S), W
+        if len(W) > limit:
+            break
+
+    if state.profiler is not None:
+        state.profiler.count("relaxations", relaxed)
+    if len(W) > limit:
+        return list(S), W
 
-    # Build children map for forest
-    children = defaultdict(list)
-    has_parent = set()
-    for child, parent in pred.items():
-        if parent in W:
-            children[parent].append(child)
-            has_parent.add(child)
+    # Build children map for forest (only edges set during this call, parent inside W)
+    children = {}
+    has_parent, gP = state.stamp("pivot_has_parent")
+    for child in W:
+        if lowered[child] == gL:
+            parent = pred[child]
+            if in_W[parent] == gW:
+                children.setdefault(parent, []).append(child)
+                has_parent[child] = gP
 
-    # roots: nodes in S that are in W, plus any W node that has no recorded parent
-    roots = set()
+    # roots: nodes in S (all of them are in W), plus any W node that has no recorded parent
+    roots = list(S)
+    is_root, gR = state.stamp("pivot_root")
     for s in S:
-        if s in W:
-            roots.add(s)
+        is_root[s] = gR
     for node in W:
-        if node not in has_parent and node not in roots:
-            roots.add(node)
+        if has_parent[node] != gP and is_root[node] != gR:
+            is_root[node] = gR
+            roots.append(node)
 
+    # iterative post-order subtree sizes (each node counted once even if reachable twice)
     subtree_size = {}
-    def dfs(u):
-        if u in subtree_size:
-            return subtree_size[u]
-        total = 1
-        for v in children.get(u, []):
-            total += dfs(v)
-        subtree_size[u] = total
-        return total
-
-    for r in list(roots):
-        dfs(r)
-
-    P = set()
-    for s in S:
-        if s in subtree_size and subtree_size[s] >= k:
-            P.add(s)
+    for r in roots:
+        if r in subtree_size:
+            continue
+        stack = [(r, False)]
+        while stack:
+            u, done = stack.pop()
+            if done:
+                total = 1
+                for v in children.get(u, ()):
+                    total += subtree_size.get(v, 0)
+                subtree_size[u] = total
+            elif u not in subtree_size:
+                subtree_size[u] = 0  # in progress: guards zero-weight cycles
+                stack.append((u, True))
+                for v in children.get(u, ()):
+                    if v not in subtree_size:
+                        stack.append((v, False))
 
+    P = [s for s in S if subtree_size.get(s, 0) >= k]
     if not P:
-        P = set(S)
+        P = list(S)
     return P, W
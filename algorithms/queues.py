@@ -0,0 +1,314 @@
+# algorithms/queues.py
+"""
+Priority queues for the Dijkstra family.
+
+Every queue has the same lazy-deletion interface the heapq loops already use:
+    push((d, v))    add an entry (an older entry for v may stay behind, callers skip
+                    entries with d > dist[v])
+    pop() -> (d, v) smallest entry; raises IndexError when empty (like heapq.heappop)
+    peek() -> (d, v) smallest entry without removing it (IndexError when empty)
+    len(q)          number of entries (stale ones included)
+so a loop is `while True: try: d, u = pop() except IndexError: break`.
+
+Kinds
+ - "heap":  heapq on (d, v) tuples, any non-negative weights (the default fallback)
+ - "bfs":   FIFO deque; every edge has the same positive weight and there is one source,
+            so keys leave the queue in pushed order (O(1) push / pop, both in C)
+ - "dial":  Dial's circular bucket array (max_weight + 1 buckets) for small integer weights
+            and one source: all live keys are within [current, current + max_weight]
+ - "radix": radix heap for integer weights; only needs keys >= the last popped key, so it
+            also serves multi-source (seeded) searches
+ - "dary":  indexed d-ary heap keyed by vertex id with decrease-key: push on a queued vertex
+            lowers its key in place, so the queue holds each vertex at most once (size <= V
+            instead of up to E lazy entries) and never returns stale entries
+
+select_queue(graph, multi_source) picks one from the graph's edge-weight statistics
+(min / max / all-integer), computed once per graph version and cached on the graph.
+In CPython the pure-Python bucket queues only beat heapq's C implementation for small
+integer weights, so larger integer weights stay on "heap" unless asked for explicitly.
+"""
+
+import heapq
+from array import array
+from collections import deque
+from functools import partial
+from typing import Tuple
+
+INF = float('inf')
+
+KINDS = ("heap", "bfs", "dial", "radix", "dary")
+# integer weights up to this use the bucket queues; above it heapq was faster in CPython
+# (measured on random graphs with 200k nodes, 3 edges each)
+MAX_BUCKET_WEIGHT = 1024
+DARY_ARITY = 4
+
+
+class HeapQueue:
+    __slots__ = ("items", "push", "pop")
+
+    def __init__(self):
+        self.items = []
+        self.push = partial(heapq.heappush, self.items)
+        self.pop = partial(heapq.heappop, self.items)
+
+    def peek(self):
+        return self.items[0]
+
+    def __len__(self):
+        return len(self.items)
+
+
+class FIFOQueue:
+    __slots__ = ("items", "push", "pop")
+
+    def __init__(self):
+        self.items = deque()
+        self.push = self.items.append
+        self.pop = self.items.popleft
+
+    def peek(self):
+        return self.items[0]
+
+    def __len__(self):
+        return len(self.items)
+
+
+class DialQueue:
+    """Circular buckets indexed by int(d) mod (max_weight + 1)."""
+
+    __slots__ = ("buckets", "nb", "cur", "count")
+
+    def __init__(self, max_weight: int):
+        self.nb = int(max_weight) + 1
+        self.buckets = [[] for _ in range(self.nb)]
+        self.cur = None
+        self.count = 0
+
+    def push(self, item):
+        k = int(item[0])
+        # keys pushed are >= the last one popped, so the cursor may move back, never past it
+        if self.cur is None or not self.count or k < self.cur:
+            self.cur = k
+        self.buckets[k % self.nb].append(item)
+        self.count += 1
+
+    def _head(self):
+        if not self.count:
+            raise IndexError("empty queue")
+        buckets = self.buckets
+        nb = self.nb
+        cur = self.cur
+        while not buckets[cur % nb]:
+            cur += 1
+        self.cur = cur
+        return buckets[cur % nb]
+
+    def pop(self):
+        bucket = self._head()
+        self.count -= 1
+        return bucket.pop()
+
+    def peek(self):
+        return self._head()[-1]
+
+    def __len__(self):
+        return self.count
+
+
+class RadixQueue:
+    """
+    Radix heap over integer keys: bucket i holds keys whose highest bit differing from the
+    last popped key is bit i - 1. Popping from an empty bucket 0 redistributes the first
+    non-empty bucket around its minimum; each entry moves O(log C) times in total.
+    """
+
+    __slots__ = ("buckets", "last", "count")
+
+    def __init__(self):
+        self.buckets = [[] for _ in range(65)]
+        self.last = 0
+        self.count = 0
+
+    def push(self, item):
+        self.buckets[(int(item[0]) ^ self.last).bit_length()].append(item)
+        self.count += 1
+
+    def _settle(self):
+        """Make bucket 0 non-empty (it then holds the minimum)."""
+        buckets = self.buckets
+        if not buckets[0]:
+            if not self.count:
+                raise IndexError("empty queue")
+            i = 1
+            while not buckets[i]:
+                i += 1
+            items = buckets[i]
+            buckets[i] = []
+            last = self.last = int(min(items)[0])
+            for item in items:
+                buckets[(int(item[0]) ^ last).bit_length()].append(item)
+        return buckets[0]
+
+    def pop(self):
+        bucket = self._settle()
+        self.count -= 1
+        return bucket.pop()
+
+    def peek(self):
+        return self._settle()[-1]
+
+    def __len__(self):
+        return self.count
+
+
+class DaryHeap:
+    """
+    Indexed d-ary min-heap over vertex ids 0..n-1: heap is a list of vertices, keys / pos are
+    flat arrays indexed by vertex (pos -1 = not queued). A wider node (arity 4) makes the
+    tree shallower, so decrease-key (sift-up) is cheap and pops touch fewer levels.
+    """
+
+    __slots__ = ("arity", "heap", "keys", "pos")
+
+    def __init__(self, n: int, arity: int = DARY_ARITY):
+        self.arity = arity
+        self.heap = []
+        self.keys = array('d', [INF]) * n
+        self.pos = array('q', [-1]) * n
+
+    def push(self, item):
+        """Insert v with key d, or lower v's key to d if it is queued with a larger one."""
+        d, v = item
+        keys = self.keys
+        pos = self.pos
+        heap = self.heap
+        i = pos[v]
+        if i < 0:
+            i = len(heap)
+            heap.append(v)
+        elif d >= keys[v]:
+            return
+        keys[v] = d
+        # sift up (inlined: this is the hot path of every relaxation)
+        arity = self.arity
+        while i > 0:
+            parent = (i - 1) // arity
+            pv = heap[parent]
+            if keys[pv] <= d:
+                break
+            heap[i] = pv
+            pos[pv] = i
+            i = parent
+        heap[i] = v
+        pos[v] = i
+
+    decrease_key = push
+
+    def pop(self):
+        heap = self.heap
+        if not heap:
+            raise IndexError("pop from an empty heap")
+        keys = self.keys
+        pos = self.pos
+        top = heap[0]
+        pos[top] = -1
+        v = heap.pop()
+        n = len(heap)
+        if n:
+            # sift the former last element down from the root
+            d = keys[v]
+            arity = self.arity
+            i = 0
+            while True:
+                first = arity * i + 1
+                if first >= n:
+                    break
+                best = first
+                best_key = keys[heap[first]]
+                for c in range(first + 1, min(first + arity, n)):
+                    kc = keys[heap[c]]
+                    if kc < best_key:
+                        best = c
+                        best_key = kc
+                if best_key >= d:
+                    break
+                cv = heap[best]
+                heap[i] = cv
+                pos[cv] = i
+                i = best
+            heap[i] = v
+            pos[v] = i
+        return keys[top], top
+
+    def peek(self):
+        if not self.heap:
+            raise IndexError("empty heap")
+        top = self.heap[0]
+        return self.keys[top], top
+
+    def __len__(self):
+        return len(self.heap)
+
+
+def weight_stats(graph) -> Tuple[float, float, bool]:
+    """(min weight, max weight, all weights integral) over every edge; cached per graph version."""
+    own = getattr(graph, "weight_stats", None)
+    if own is not None:
+        return own()
+    version = getattr(graph, "version", 0)
+    cached = getattr(graph, "_weight_stats", None)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    if hasattr(graph, "weights"):
+        weights = graph.weights
+    else:
+        weights = (w for u in graph.nodes for _, w in graph.get_neighbors(u))
+    lo, hi, integral = INF, -INF, True
+    for w in weights:
+        if w < lo:
+            lo = w
+        if w > hi:
+            hi = w
+        if integral and w != int(w):
+            integral = False
+    stats = (lo, hi, integral)
+    try:
+        graph._weight_stats = (version, stats)
+    except AttributeError:
+        pass
+    return stats
+
+
+def select_queue(graph, multi_source: bool = False) -> str:
+    """Cheapest queue kind that is exact for `graph` (see module docstring)."""
+    lo, hi, integral = weight_stats(graph)
+    if lo == INF or lo < 0:
+        return "heap"
+    if lo == hi and lo > 0 and not multi_source:
+        return "bfs"
+    if integral and hi <= MAX_BUCKET_WEIGHT:
+        return "radix" if multi_source else "dial"
+    return "heap"
+
+
+def make_queue(kind, graph=None, multi_source: bool = False):
+    """
+    Queue object for `kind` (None / "heap", "bfs", "dial", "radix", "dary" or "auto").
+    "auto" and "dial" look at the graph's weight statistics, "dary" needs graph.num_nodes.
+    A callable is used as a factory: kind(graph) -> queue (e.g. a DaryHeap of another arity).
+    """
+    if callable(kind):
+        return kind(graph)
+    if kind == "auto":
+        kind = select_queue(graph, multi_source)
+    if kind is None or kind == "heap":
+        return HeapQueue()
+    if kind == "bfs":
+        return FIFOQueue()
+    if kind == "dial":
+        return DialQueue(max(1, int(weight_stats(graph)[1])))
+    if kind == "radix":
+        return RadixQueue()
+    if kind == "dary":
+        return DaryHeap(graph.num_nodes)
+    raise ValueError(f"unknown queue {kind!r} (expected one of {KINDS} or 'auto')")
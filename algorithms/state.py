@@ -0,0 +1,85 @@
+# algorithms/state.py
+"""
+Array-backed distance / predecessor state shared by the BMSSP recursion.
+
+For dense integer node ids 0..n-1 the dict-of-floats state is replaced by flat arrays:
+ - dist: array('d'), INF for unreached
+ - pred: array('q'), -1 for "no predecessor"
+ - seed_mark: bytearray, 1 while a node's label is lowered but not yet propagated
+   through all of its out-edges (the fast-mode repair seeds)
+
+Set membership inside the recursion (U per level, W / frontier in find_pivots, the
+base-case U0) uses generation-stamped mark arrays: stamp(key) starts a new generation
+in O(1) instead of allocating and clearing a fresh set() per call.
+
+profiler: optional instrument.Profiler the recursion reports counters / phase times to
+(None = off). relaxer: optional vectorized.FrontierRelaxer for batched relaxation
+(None = scalar loops). pool: optional parallel.WorkerPool running large base cases on
+worker processes (None = in-process).
+"""
+
+from array import array
+from typing import Dict, List, Tuple
+
+INF = float('inf')
+
+
+class SSSPState:
+    __slots__ = ("n", "dist", "pred", "seed_mark", "seed_list", "_marks", "_gens", "profiler", "relaxer", "pool")
+
+    def __init__(self, n: int):
+        self.n = n
+        self.dist = array('d', [INF]) * n
+        self.pred = array('q', [-1]) * n
+        self.seed_mark = bytearray(n)
+        self.seed_list = []     # nodes ever marked as seeds (may hold cleared ones)
+        self._marks = {}        # key -> array('I') of generation stamps
+        self._gens = {}         # key -> current generation
+        self.profiler = None
+        self.relaxer = None
+        self.pool = None
+
+    def add_seed(self, v: int):
+        if not self.seed_mark[v]:
+            self.seed_mark[v] = 1
+            self.seed_list.append(v)
+
+    def seeds(self) -> List[int]:
+        """Nodes whose labels are still unpropagated (each once). Compacts seed_list."""
+        mark = self.seed_mark
+        out = []
+        for v in self.seed_list:
+            if mark[v] == 1:
+                mark[v] = 2
+                out.append(v)
+        for v in out:
+            mark[v] = 1
+        self.seed_list = list(out)
+        return out
+
+    def stamp(self, key) -> Tuple[array, int]:
+        """
+        Start a fresh generation for mark array `key`.
+        Returns (marks, gen); marks[v] == gen means v is a member in this generation.
+        """
+        marks = self._marks.get(key)
+        if marks is None:
+            marks = array('I', bytes(array('I').itemsize * self.n))
+            self._marks[key] = marks
+            gen = 1
+        else:
+            gen = self._gens[key] + 1
+            if gen >= 1 << (8 * marks.itemsize):
+                # wrapped around: clear once, restart generations
+                marks[:] = array('I', bytes(marks.itemsize * self.n))
+                gen = 1
+        self._gens[key] = gen
+        return marks, gen
+
+    def distances_dict(self, nodes) -> Dict[int, float]:
+        dist = self.dist
+        return {v: dist[v] for v in nodes}
+
+    def predecessors_dict(self, nodes) -> Dict[int, int]:
+        pred = self.pred
+        return {v: (pred[v] if pred[v] >= 0 else None) for v in nodes}
@@ -0,0 +1,151 @@
+# algorithms/vectorized.py
+"""
+Optional NumPy backend for the BMSSP relaxation steps (run_bmssp(..., backend="numpy")).
+
+On a CSRGraph the whole frontier is relaxed in one batch instead of edge by edge:
+  gather   every out-edge of the frontier (offsets -> flat edge indices)
+  compute  candidate = dist[u] + w
+  filter   candidate < dist[v] (and < B)
+  scatter  min per target: stable lexsort on (v, candidate), first row per v wins,
+           so ties go to the first edge in frontier / CSR order like the scalar loop
+
+NumPy works on zero-copy views of the state's array('d') / array('q') / bytearray buffers
+and of the CSR arrays, so scalar and vector steps can be mixed freely on the same state.
+Frontiers smaller than min_frontier stay on the scalar path (NumPy call overhead dominates).
+
+Within one round the batch reads the labels from the start of the round (Jacobi style),
+the scalar loop sees labels lowered earlier in the same round (Gauss-Seidel). Intermediate
+labels can therefore differ, but every lowered label is tracked as a seed exactly as in the
+scalar path, so the final repaired distances are the same.
+"""
+
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+HAVE_NUMPY = np is not None
+INF = float('inf')
+
+BACKENDS = ("python", "numpy", "auto")
+MIN_FRONTIER = 64       # smaller frontiers are relaxed by the scalar loops
+
+
+def make_relaxer(graph, state, backend: str = "python", min_frontier: int = None):
+    """FrontierRelaxer for backend="numpy" / "auto", or None for the scalar path."""
+    if min_frontier is None:
+        min_frontier = MIN_FRONTIER
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r} (expected one of {BACKENDS})")
+    if backend == "python":
+        return None
+    usable = HAVE_NUMPY and hasattr(graph, "offsets")
+    if backend == "auto":
+        return FrontierRelaxer(graph, state, min_frontier) if usable else None
+    if not HAVE_NUMPY:
+        raise ImportError("backend='numpy' needs numpy installed")
+    if not hasattr(graph, "offsets"):
+        raise ValueError("backend='numpy' needs a CSRGraph (see Graph.to_csr / Graph.from_edge_list)")
+    return FrontierRelaxer(graph, state, min_frontier)
+
+
+class FrontierRelaxer:
+    def __init__(self, graph, state, min_frontier: int = MIN_FRONTIER):
+        self.state = state
+        self.min_frontier = min_frontier
+        self.offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+        self.targets = np.frombuffer(graph.targets, dtype=np.int64)
+        self.weights = np.frombuffer(graph.weights, dtype=np.float64)
+        self.dist = np.frombuffer(state.dist, dtype=np.float64)
+        self.pred = np.frombuffer(state.pred, dtype=np.int64)
+        self.seed_mark = np.frombuffer(state.seed_mark, dtype=np.uint8)
+
+    def _gather(self, frontier):
+        """(src, candidate, target) for every out-edge of the frontier, in frontier / CSR order."""
+        starts = self.offsets[frontier]
+        lens = self.offsets[frontier + 1] - starts
+        total = int(lens.sum())
+        if total == 0:
+            return None
+        src = np.repeat(frontier, lens)
+        # flat edge index = start of its row + position inside the row
+        idx = np.repeat(starts - (np.cumsum(lens) - lens), lens) + np.arange(total)
+        return src, self.dist[src] + self.weights[idx], self.targets[idx]
+
+    def _scatter_min(self, src, cand, tgt, bound: float):
+        """Apply the improving candidates (best per target); returns (targets, new labels)."""
+        dist = self.dist
+        keep = cand < dist[tgt]
+        if bound < INF:
+            keep &= cand < bound
+        if not keep.any():
+            return tgt[:0], cand[:0]
+        src, cand, tgt = src[keep], cand[keep], tgt[keep]
+        order = np.lexsort((cand, tgt))
+        ts = tgt[order]
+        first = np.empty(len(ts), dtype=bool)
+        first[0] = True
+        np.not_equal(ts[1:], ts[:-1], out=first[1:])
+        sel = order[first]
+        v = tgt[sel]
+        d = cand[sel]
+        dist[v] = d
+        self.pred[v] = src[sel]
+        mark = self.seed_mark
+        fresh = v[mark[v] == 0]
+        mark[fresh] = 1
+        self.state.seed_list.extend(fresh.tolist())
+        return v, d
+
+    def relax_round(self, frontier: List[int], B: float, in_W, gW: int, W: List[int],
+                    lowered, gL: int) -> Tuple[List[int], int]:
+        """
+        One bounded find_pivots round. Updates dist / pred / seeds, W (marks + list) and the
+        lowered stamps; returns (next frontier, number of labels lowered).
+        """
+        F = np.array(frontier, dtype=np.int64)
+        F = F[self.dist[F] < B]
+        got = self._gather(F)
+        if got is None:
+            return [], 0
+        v, _ = self._scatter_min(*got, bound=B)
+        if len(v):
+            np.frombuffer(lowered, dtype=np.uint32)[v] = gL
+            w_marks = np.frombuffer(in_W, dtype=np.uint32)
+            new_w = v[w_marks[v] != gW]
+            w_marks[new_w] = gW
+            W.extend(new_w.tolist())
+        return v.tolist(), len(v)
+
+    def relax_all(self, nodes: List[int], B: float, Bi: float, Bi_prime: float,
+                  in_U=None, gen: int = 0):
+        """
+        Unbounded scan of every finite node in `nodes` (their seed marks are cleared first).
+        Returns (relaxed, to_insert, to_prepend): lowered labels with Bi <= d < B go to the
+        DS insert list, Bi_prime <= d < Bi to the batch-prepend list, as (node, d) pairs.
+        Targets whose label is matched exactly and that are not stamped in in_U are listed
+        too, like in the scalar loop of bmssp_iterative.
+        """
+        U = np.array(nodes, dtype=np.int64)
+        U = U[self.dist[U] < INF]
+        self.seed_mark[U] = 0
+        got = self._gather(U)
+        if got is None:
+            return 0, [], []
+        src, cand, tgt = got
+        tie = cand == self.dist[tgt]
+        if in_U is not None:
+            tie &= np.frombuffer(in_U, dtype=np.uint32)[tgt] != gen
+        tv, td = tgt[tie], cand[tie]
+        v, d = self._scatter_min(src, cand, tgt, bound=INF)
+        relaxed = len(v)
+        if len(tv):
+            v = np.concatenate((v, tv))
+            d = np.concatenate((d, td))
+        ins = (d >= Bi) & (d < B)
+        pre = (d >= Bi_prime) & (d < Bi)
+        to_insert = list(zip(v[ins].tolist(), d[ins].tolist()))
+        to_prepend = list(zip(v[pre].tolist(), d[pre].tolist()))
+        return relaxed, to_insert, to_prepend
@@ -0,0 +1,94 @@
+# algorithms/verify.py
+"""
+Linear-time shortest-path certificate check.
+
+(dist, pred) is a valid SSSP answer for `source` iff
+ 1. dist[source] == 0 and source has no predecessor,
+ 2. every edge (u, v, w) with finite dist[u] is relaxed: dist[u] + w >= dist[v],
+ 3. every finite non-source v has a predecessor p whose edge is tight:
+    dist[p] + w(p, v) == dist[v],
+ 4. the predecessor links are acyclic (so every tree path ends at the source).
+
+This is one pass over the edges plus one pass over the predecessor forest,
+O(V + E), instead of an O(E log V) reference Dijkstra run.
+"""
+
+from typing import Set, Tuple
+
+
+def _no_pred(p) -> bool:
+    # dict-based engines use None, array-backed state uses -1
+    return p is None or p < 0
+
+
+def verify_sssp(graph, source: int, dist, pred, tol: float = 1e-9) -> Tuple[bool, Set[int], Set[int]]:
+    """
+    Check (dist, pred) against graph. dist / pred may be dicts or arrays indexed by node id.
+    Returns (ok, unrelaxed, broken):
+    - unrelaxed: nodes u with an out-edge that can still lower its head's distance, or
+                 whose edge to a successor v (pred[v] == u) is not tight
+                 (a Dijkstra seeded from these repairs the distances)
+    - broken: nodes whose own predecessor link is invalid (wrong source label, missing,
+              not an edge of the graph, or on a cycle)
+    A loose predecessor edge is usually a stale label upstream that the seeded repair
+    lowers; callers re-check the repaired answer for the rare case it does not.
+    """
+    INF = float('inf')
+    unrelaxed = set()
+    broken = set()
+    linked = bytearray(graph.num_nodes)    # pred edge into v: 0 none, 1 only loose, 2 tight
+
+    if dist[source] != 0 or not _no_pred(pred[source]):
+        broken.add(source)
+
+    # 1 pass over edges: relaxation + tightness of predecessor edges
+    for u in graph.nodes:
+        du = dist[u]
+        if du == INF:
+            continue
+        for v, w in graph.get_neighbors(u):
+            dv = dist[v]
+            nd = du + w
+            if pred[v] == u and linked[v] != 2:
+                # parallel edges: one tight copy is enough
+                linked[v] = 2 if nd <= dv + tol else 1
+            if nd < dv - tol:
+                unrelaxed.add(u)
+
+    # predecessor links of reached nodes must exist (and be tight, else repair from them)
+    for v in graph.nodes:
+        if v == source:
+            continue
+        p = pred[v]
+        if dist[v] == INF:
+            if not _no_pred(p):
+                broken.add(v)
+        elif _no_pred(p) or not linked[v]:
+            broken.add(v)
+        elif linked[v] == 1:
+            unrelaxed.add(p)
+
+    # acyclic: walk every predecessor chain once (0 = new, 1 = on current walk, 2 = done)
+    color = bytearray(graph.num_nodes)
+    for v in graph.nodes:
+        if color[v] or dist[v] == INF:
+            continue
+        walk = []
+        x = v
+        while True:
+            if color[x] == 2:
+                break  # joins a chain that was already checked
+            if color[x] == 1:
+                broken.update(walk[walk.index(x):])  # came back onto this walk: cycle
+                break
+            color[x] = 1
+            walk.append(x)
+            p = pred[x]
+            if x == source or _no_pred(p):
+                break
+            x = p
+        for y in walk:
+            color[y] = 2
+
+    ok = not unrelaxed and not broken
+    return ok, unrelaxed, broken
@@ -0,0 +1,73 @@
+# benchmarks/bench_bridge.py
+"""
+Control-loop latency / throughput of the robot bridge against the mock sim (no CoppeliaSim).
+
+For each simulated round-trip latency: the blocking loop of bmssp_pioneer_follow.py
+(plan, then setObjectPosition + sleep(step) per cell) vs the asyncio bridge
+(coppeliasim_integration.async_bridge). Reported: wall time for the whole path, moves per
+second, sim calls, and the median / max time from deciding a position to the sim applying it.
+
+Usage:
+    python -m benchmarks.bench_bridge --size 40 --step 0.01 --latency 0,0.002,0.01
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from statistics import median
+
+from algorithms.dijkstra import dijkstra
+from simulation.grid_world import generate_grid_graph
+from simulation.robot_sim import Robot
+from coppeliasim_integration.async_bridge import AsyncPioneer, CELL_SIZE, ROBOT_Z
+from coppeliasim_integration.mock_sim import MockSim
+
+def blocking_follow(sim, graph, cols, start, goal, step):
+    """The original script's loop, instrumented."""
+    t0 = time.perf_counter()
+    robot = sim.getObject("/PioneerP3DX")
+    path = Robot(None, mode="bmssp").calculate_path(graph, start, goal)
+    latencies = []
+    for p in path:
+        r, c = divmod(p, cols)
+        t = time.perf_counter()
+        sim.setObjectPosition(robot, -1, [r * CELL_SIZE, c * CELL_SIZE, ROBOT_Z])
+        latencies.append(time.perf_counter() - t)
+        time.sleep(step)
+    total = time.perf_counter() - t0
+    return {"moves": len(path) - 1, "time": total, "sim_calls": sum(sim.calls.values()),
+            "latency_median": median(latencies), "latency_max": max(latencies),
+            "moves_per_second": (len(path) - 1) / total}
+
+def async_follow(sim, graph, obstacles, cols, start, goal, step):
+    bridge = AsyncPioneer(sim, graph, list(obstacles), cols, step_time=step)
+    try:
+        return asyncio.run(bridge.follow(start, goal))
+    finally:
+        bridge.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=40)
+    parser.add_argument("--obstacles", type=float, default=0.15)
+    parser.add_argument("--step", type=float, default=0.01)
+    parser.add_argument("--latency", type=str, default="0,0.002,0.01")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    n = args.size
+    graph, obstacles = generate_grid_graph(n, n, args.obstacles)
+    start = next(v for v in range(n * n) if not obstacles[v])
+    # farthest reachable cell, so the path is long whatever the obstacle draw
+    reach, _ = dijkstra(graph, start)
+    goal = max((v for v in reach if reach[v] < float('inf')), key=reach.get)
+    for latency in (float(x) for x in args.latency.split(",")):
+        print(f"round trip {latency * 1e3:.1f}ms, step {args.step * 1e3:.1f}ms")
+        for name, run in (("blocking", lambda sim: blocking_follow(sim, graph, n, start, goal, args.step)),
+                          ("asyncio", lambda sim: async_follow(sim, graph, obstacles, n, start, goal, args.step))):
+            r = run(MockSim(latency=latency))
+            print(f"  {name:>8}: {r['moves']} moves in {r['time']:.3f}s ({r['moves_per_second']:.0f}/s), "
+                  f"{r['sim_calls']} sim calls, latency median {r['latency_median'] * 1e3:.2f}ms "
+                  f"max {r['latency_max'] * 1e3:.2f}ms")
@@ -0,0 +1,69 @@
+# benchmarks/bench_dstructs.py
+"""
+Micro-benchmark for PartialSortingDS: insert, batch_prepend and pull throughput, measured separately.
+Usage:
+    python -m benchmarks.bench_dstructs --n 200000 --M 64
+"""
+
+import time
+import random
+import argparse
+
+from algorithms.dstructs import PartialSortingDS
+
+def _filled(n: int, M: int, B: float, values):
+    D = PartialSortingDS(M, B)
+    for key, v in enumerate(values):
+        D.insert((key, v))
+    return D
+
+def bench_insert(n: int, M: int, B: float = 1e9):
+    values = [random.uniform(0.0, B) for _ in range(n)]
+    D = PartialSortingDS(M, B)
+    t0 = time.perf_counter()
+    for key, v in enumerate(values):
+        D.insert((key, v))
+    return n / (time.perf_counter() - t0)
+
+def bench_batch_prepend(n: int, M: int, batch_size: int = 256, B: float = 1e9):
+    # each batch is smaller than everything already present, as in bmssp_iterative
+    D = _filled(1, M, B, [B / 2])
+    hi = B / 2
+    batches = []
+    for b in range(n // batch_size):
+        lo = hi - batch_size
+        batches.append([(b * batch_size + i + 1, random.uniform(lo, hi)) for i in range(batch_size)])
+        hi = lo
+    t0 = time.perf_counter()
+    for batch in batches:
+        D.batch_prepend(batch)
+    return (len(batches) * batch_size) / (time.perf_counter() - t0)
+
+def bench_pull(n: int, M: int, B: float = 1e9):
+    D = _filled(n, M, B, [random.uniform(0.0, B) for _ in range(n)])
+    pulled = 0
+    t0 = time.perf_counter()
+    while not D.is_empty():
+        keys, _ = D.pull()
+        pulled += len(keys)
+    return pulled / (time.perf_counter() - t0)
+
+def run(n=200000, M=64):
+    res = {
+        "n": n,
+        "M": M,
+        "insert_per_s": bench_insert(n, M),
+        "batch_prepend_per_s": bench_batch_prepend(n, M),
+        "pull_keys_per_s": bench_pull(n, M),
+    }
+    for name in ("insert_per_s", "batch_prepend_per_s", "pull_keys_per_s"):
+        print(f"{name:>22}: {res[name]:,.0f}")
+    return res
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=200000)
+    parser.add_argument("--M", type=int, default=64)
+    args = parser.parse_args()
+    random.seed(42)
+    print(run(args.n, args.M))
@@ -0,0 +1,78 @@
+# benchmarks/bench_heaps.py
+"""
+Lazy heapq vs the indexed d-ary heap (decrease-key) in Dijkstra.
+
+For each graph: runtime of dijkstra(queue=...) (best of --repeats) plus, from one
+instrumented run, pushes, stale pops (entries skipped because the vertex was already
+settled with a smaller label) and the peak queue size.
+
+Usage:
+    python -m benchmarks.bench_heaps --n 100000 --deg 3,16 --families uniform,powerlaw
+"""
+
+import argparse
+import random
+import time
+
+from algorithms.dijkstra import dijkstra
+from algorithms.queues import DaryHeap, make_queue
+from benchmarks.generators import FAMILIES
+
+INF = float('inf')
+
+def queue_profile(graph, source, pq):
+    """Dijkstra loop mirroring dijkstra() that records queue statistics."""
+    dist = [INF] * graph.num_nodes
+    dist[source] = 0.0
+    push, pop = pq.push, pq.pop
+    push((0.0, source))
+    pushes, stale, peak = 1, 0, 1
+    while True:
+        try:
+            d, u = pop()
+        except IndexError:
+            break
+        if d > dist[u]:
+            stale += 1
+            continue
+        for v, w in graph.get_neighbors(u):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                push((nd, v))
+                pushes += 1
+        size = len(pq)
+        if size > peak:
+            peak = size
+    return {"pushes": pushes, "stale_pops": stale, "peak_size": peak}
+
+def bench(graph, source=0, repeats=3, arities=(2, 4, 8)):
+    results = {}
+    kinds = [("heapq", "heap")]
+    kinds += [(f"dary{a}", (lambda g, a=a: DaryHeap(g.num_nodes, a))) for a in arities]
+    for name, queue in kinds:
+        best = INF
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            dijkstra(graph, source, queue=queue)
+            best = min(best, time.perf_counter() - t0)
+        row = {"time": best}
+        row.update(queue_profile(graph, source, make_queue(queue, graph)))
+        results[name] = row
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--deg", type=str, default="3,16")
+    parser.add_argument("--families", type=str, default="uniform,powerlaw,road")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    for family in args.families.split(","):
+        for deg in (int(x) for x in args.deg.split(",")):
+            graph = FAMILIES[family](args.n, deg, rng=random.Random(42))
+            print(f"{family} n={graph.num_nodes} m={graph.num_edges}")
+            for name, r in bench(graph, repeats=args.repeats).items():
+                print(f"  {name:>7}: time={r['time']:.3f}s pushes={r['pushes']:>8} "
+                      f"stale={r['stale_pops']:>8} peak={r['peak_size']:>8}")
@@ -0,0 +1,109 @@
+# benchmarks/bench_preprocess.py
+"""
+Preprocessing cost vs query speedup of ALT landmarks and contraction hierarchies.
+
+For each graph: build time and file size of alt.Landmarks (--landmarks) and
+ch.ContractionHierarchy, load time of the saved files, then --queries random
+point-to-point queries answered by dijkstra(target=...), bidirectional Dijkstra, A* with
+the landmarks and the hierarchy (mean time, settled / expanded vertices). "break-even" is
+the number of queries after which preprocessing has paid for itself against Dijkstra.
+Every answer is checked against Dijkstra's distance.
+
+CH preprocessing suits road- and grid-like maps; on random expanders (uniform, powerlaw)
+the contracted core gets dense and building takes minutes in pure Python.
+
+Usage:
+    python -m benchmarks.bench_preprocess --n 20000 --families grid,road --queries 200
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from algorithms.alt import Landmarks
+from algorithms.ch import ContractionHierarchy
+from algorithms.dijkstra import bidirectional_dijkstra, dijkstra
+from benchmarks.generators import FAMILIES
+
+INF = float('inf')
+
+
+def bench(graph, queries=100, landmarks=8, rng=random):
+    n = graph.num_nodes
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+    results = {}
+    oracles = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, build, load in (
+                ("alt", lambda: Landmarks.build(graph, landmarks, rng=rng), Landmarks.load),
+                ("ch", lambda: ContractionHierarchy.build(graph), ContractionHierarchy.load)):
+            t0 = time.perf_counter()
+            oracle = build()
+            t1 = time.perf_counter()
+            path = os.path.join(tmp, name)
+            oracle.save(path)
+            t2 = time.perf_counter()
+            oracles[name] = load(path, graph)
+            t3 = time.perf_counter()
+            results[name] = {"build": t1 - t0, "save": t2 - t1, "load": t3 - t2,
+                             "bytes": os.path.getsize(path)}
+
+    reference = []
+    total = settled = 0
+    for s, t in pairs:
+        stats = {}
+        t0 = time.perf_counter()
+        dist, _ = dijkstra(graph, s, target=t, stats=stats)
+        total += time.perf_counter() - t0
+        settled += stats["settled"]
+        reference.append(dist[t])
+    results["dijkstra"] = {"query": total / queries, "expanded": settled / queries}
+
+    total = settled = 0
+    for s, t in pairs:
+        t0 = time.perf_counter()
+        _, _, info = bidirectional_dijkstra(graph, s, t)
+        total += time.perf_counter() - t0
+        settled += info["settled"]
+    results["bidirectional"] = {"query": total / queries, "expanded": settled / queries}
+
+    for name, oracle in oracles.items():
+        total = expanded = mismatches = 0
+        for (s, t), ref in zip(pairs, reference):
+            t0 = time.perf_counter()
+            d, _ = oracle.query(s, t)
+            total += time.perf_counter() - t0
+            expanded += oracle.last_stats["expanded"]
+            if abs(d - ref) > 1e-9 * max(1.0, abs(ref)) and not (d == ref == INF):
+                mismatches += 1
+        row = results[name]
+        row.update(query=total / queries, expanded=expanded / queries, mismatches=mismatches)
+        gain = results["dijkstra"]["query"] - row["query"]
+        row["break_even"] = row["build"] / gain if gain > 0 else INF
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=20000)
+    parser.add_argument("--deg", type=int, default=3)
+    parser.add_argument("--families", type=str, default="grid,road")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--landmarks", type=int, default=8)
+    args = parser.parse_args()
+
+    for family in args.families.split(","):
+        graph = FAMILIES[family](args.n, args.deg, rng=random.Random(42))
+        print(f"{family} n={graph.num_nodes} m={graph.num_edges}")
+        res = bench(graph, args.queries, args.landmarks, rng=random.Random(7))
+        base = res["dijkstra"]["query"]
+        for name, r in res.items():
+            line = (f"  {name:>13}: query={r['query'] * 1e3:8.3f}ms  x{base / r['query']:6.1f}  "
+                    f"expanded={r['expanded']:9.1f}")
+            if "build" in r:
+                line += (f"  build={r['build']:.2f}s  load={r['load'] * 1e3:.1f}ms  "
+                         f"{r['bytes'] / 1e6:.1f}MB  break-even={r['break_even']:.0f} queries"
+                         f"  mismatches={r['mismatches']}")
+            print(line)
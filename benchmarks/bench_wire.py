@@ -0,0 +1,113 @@
+# benchmarks/bench_wire.py
+"""
+Grid / path signal encoding: the JSON of bmssp_pioneer_follow.py vs core.wire.
+
+Per grid size: bytes per frame and encode / decode time (best of --repeats) for
+ - json       json.dumps(list of 0/1 ints) / json.loads
+ - full       bit-packed frame (GridEncoder.full / GridDecoder.decode)
+ - delta      frame carrying --changes flipped cells since the previous frame, found by
+              diffing the whole grid (encode) ...
+ - events     ... or handed over as the flipped cell ids (encode_changes)
+and for a corner-to-corner staircase path: json.dumps(list) vs encode_path (varint deltas).
+
+Usage:
+    python -m benchmarks.bench_wire --sizes 50,500,2000 --changes 20 --repeats 5
+"""
+
+import argparse
+import json
+import random
+import time
+
+from core.wire import GridDecoder, GridEncoder, decode_path, encode_path
+
+def best_time(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def staircase_path(size):
+    path = [0]
+    r = c = 0
+    while r < size - 1 or c < size - 1:
+        if c < size - 1 and (c <= r or r == size - 1):
+            c += 1
+        else:
+            r += 1
+        path.append(r * size + c)
+    return path
+
+def bench_grid(size, changes, repeats, rng):
+    n = size * size
+    occ = bytearray(1 if rng.random() < 0.2 else 0 for _ in range(n))
+    cells = list(occ)
+    rows = {}
+
+    text = json.dumps(cells)
+    rows["json"] = (len(text), best_time(lambda: json.dumps(cells), repeats),
+                    best_time(lambda: json.loads(text), repeats))
+
+    enc = GridEncoder(size, size)
+    frame = enc.full(occ)
+    rows["full"] = (len(frame), best_time(lambda: enc.full(occ), repeats),
+                    best_time(lambda: GridDecoder().decode(frame), repeats))
+
+    # one delta frame after a full one; the decoder is re-primed for every timed decode
+    enc = GridEncoder(size, size)
+    base = enc.encode(occ)
+    nxt = bytearray(occ)
+    for _ in range(changes):
+        nxt[rng.randrange(n)] ^= 1
+
+    def encode_delta():
+        e = GridEncoder(size, size)
+        e.encode(occ)
+        return e.encode(nxt)
+
+    delta = encode_delta()
+    dec = GridDecoder()
+
+    def decode_delta():
+        dec.seq = 1
+        dec.decode(delta)
+
+    dec.decode(base)
+    t_enc = best_time(encode_delta, repeats) - rows["full"][1]      # minus the priming full frame
+    rows["delta"] = (len(delta), max(t_enc, 0.0), best_time(decode_delta, repeats))
+
+    flipped = [v for v in range(n) if occ[v] != nxt[v]]
+    enc = GridEncoder(size, size)
+    enc.encode(occ)
+    packed = enc._last
+
+    def encode_events():
+        enc.seq = 1
+        enc._last = packed          # rewind to the full frame
+        return enc.encode_changes(flipped)
+
+    rows["events"] = (len(encode_events()), best_time(encode_events, repeats), rows["delta"][2])
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=str, default="50,500,2000")
+    parser.add_argument("--changes", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    for size in (int(x) for x in args.sizes.split(",")):
+        print(f"grid {size}x{size}")
+        for name, (nbytes, t_enc, t_dec) in bench_grid(size, args.changes, args.repeats, rng).items():
+            print(f"  {name:>6}: {nbytes:>10} bytes  encode {t_enc * 1e3:8.3f}ms  decode {t_dec * 1e3:8.3f}ms")
+        path = staircase_path(size)
+        text = json.dumps(path)
+        data = encode_path(path)
+        print(f"  path of {len(path)} nodes: json {len(text)} bytes "
+              f"({best_time(lambda: json.dumps(path), args.repeats) * 1e3:.3f}ms / "
+              f"{best_time(lambda: json.loads(text), args.repeats) * 1e3:.3f}ms), "
+              f"varint {len(data)} bytes ({best_time(lambda: encode_path(path), args.repeats) * 1e3:.3f}ms / "
+              f"{best_time(lambda: decode_path(data), args.repeats) * 1e3:.3f}ms)")
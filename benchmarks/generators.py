@@ -0,0 +1,91 @@
+# benchmarks/generators.py
+"""
+Graph families for the benchmark suite. Every generator returns a frozen CSRGraph.
+
+ - uniform:  directed, every node gets `deg` random out-neighbours, uniform weights
+ - grid:     undirected 4-connected grid of ~n cells with random obstacles, unit weights
+             (.shape = (rows, cols) is set, so grid heuristics work)
+ - powerlaw: directed preferential-attachment graph (heavy-tailed in-degree)
+ - road:     undirected geometric graph: random points in the unit square, each linked to
+             its `deg` nearest neighbours, Euclidean weights (planar-ish, like road networks)
+"""
+
+import math
+import random
+
+from core.graph import Graph
+
+def uniform_random(n: int, deg: int = 2, weight_range=(1.0, 10.0), rng=random):
+    edges = []
+    for u in range(n):
+        neighbors = set()
+        while len(neighbors) < min(deg, n - 1):
+            v = rng.randrange(0, n)
+            if v != u:
+                neighbors.add(v)
+        for v in neighbors:
+            edges.append((u, v, rng.uniform(weight_range[0], weight_range[1])))
+    return Graph.from_edge_list(n, edges, directed=True)
+
+def grid_obstacles(n: int, deg: int = 4, obstacle_prob: float = 0.2, rng=random):
+    """deg is ignored (always 4-connected); the grid is the largest square with <= n cells."""
+    side = max(2, int(math.isqrt(n)))
+    blocked = [rng.random() < obstacle_prob for _ in range(side * side)]
+    blocked[0] = blocked[-1] = False
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            i = r * side + c
+            if blocked[i]:
+                continue
+            if c + 1 < side and not blocked[i + 1]:
+                edges.append((i, i + 1, 1.0))
+            if r + 1 < side and not blocked[i + side]:
+                edges.append((i, i + side, 1.0))
+    g = Graph.from_edge_list(side * side, edges, directed=False)
+    g.shape = (side, side)
+    return g
+
+def power_law(n: int, deg: int = 2, weight_range=(1.0, 10.0), rng=random):
+    """Each new node links to `deg` targets picked proportionally to their degree (plus one)."""
+    edges = []
+    pool = [0]      # node repeated once per incident edge + 1
+    for u in range(1, n):
+        for _ in range(min(deg, u)):
+            v = rng.choice(pool)
+            w = rng.uniform(weight_range[0], weight_range[1])
+            edges.append((u, v, w))
+            edges.append((v, u, w))
+            pool.append(v)
+        pool.append(u)
+    return Graph.from_edge_list(n, edges, directed=True)
+
+def road_like(n: int, deg: int = 3, rng=random):
+    pts = [(rng.random(), rng.random()) for _ in range(n)]
+    cells = max(1, int(math.sqrt(n / 2)))
+    buckets = {}
+    for i, (x, y) in enumerate(pts):
+        buckets.setdefault((int(x * cells), int(y * cells)), []).append(i)
+    edges = []
+    for i, (x, y) in enumerate(pts):
+        cx, cy = int(x * cells), int(y * cells)
+        ring = 1
+        cand = []
+        while len(cand) <= deg and ring <= cells:
+            cand = [j for dx in range(-ring, ring + 1) for dy in range(-ring, ring + 1)
+                    for j in buckets.get((cx + dx, cy + dy), ()) if j != i]
+            ring += 1
+        cand.sort(key=lambda j: (pts[j][0] - x) ** 2 + (pts[j][1] - y) ** 2)
+        for j in cand[:deg]:
+            if i < j:
+                edges.append((i, j, math.dist(pts[i], pts[j])))
+            else:
+                edges.append((j, i, math.dist(pts[i], pts[j])))
+    return Graph.from_edge_list(n, sorted(set(edges)), directed=False)
+
+FAMILIES = {
+    "uniform": uniform_random,
+    "grid": grid_obstacles,
+    "powerlaw": power_law,
+    "road": road_like,
+}
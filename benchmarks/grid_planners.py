@@ -0,0 +1,58 @@
+# benchmarks/grid_planners.py
+"""
+Compare node expansions and time of Dijkstra, BMSSP, bidirectional Dijkstra, A* and HPA*
+on grid worlds from generate_grid_graph (point-to-point, corner to corner).
+HPA*'s hierarchy is built before the query; its build time is reported separately.
+Usage:
+    python -m benchmarks.grid_planners --rows 50 --cols 50 --obstacles 0.2 --weight 1.5
+"""
+
+import time
+import random
+import argparse
+
+from simulation.grid_world import generate_grid_graph
+from simulation.robot_sim import Robot
+from algorithms.hpa import HPAStar
+
+def compare_planners(graph, source: int, target: int, astar_weight: float = 1.0,
+                     obstacles=None, cluster_size: int = 16):
+    """Returns {engine: {"expanded", "time", "path_len"}} for every Robot mode (hpa: also "build")."""
+    results = {}
+    modes = ["dijkstra", "bmssp", "bidirectional", "astar"]
+    robots = {m: Robot(None, mode=m) for m in modes}
+    t0 = time.perf_counter()
+    hierarchy = HPAStar(graph, cluster_size, obstacles=obstacles)
+    build = time.perf_counter() - t0
+    robots["hpa"] = Robot(None, mode="hpa", hierarchy=hierarchy)
+    if astar_weight != 1.0:
+        robots["wastar"] = Robot(None, mode="astar", astar_weight=astar_weight)
+    for name, robot in robots.items():
+        t0 = time.perf_counter()
+        path = robot.calculate_path(graph, source, target)
+        elapsed = time.perf_counter() - t0
+        results[name] = {
+            "expanded": robot.last_stats["expanded"],
+            "time": elapsed,
+            "path_len": len(path),
+        }
+    results["hpa"]["build"] = build
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--cols", type=int, default=50)
+    parser.add_argument("--obstacles", type=float, default=0.2)
+    parser.add_argument("--weight", type=float, default=1.0, help="extra weighted-A* run if != 1")
+    parser.add_argument("--implicit", action="store_true", help="implicit GridGraph instead of an adjacency list")
+    parser.add_argument("--connectivity", type=int, default=4, choices=[4, 8], help="with --implicit")
+    parser.add_argument("--cluster", type=int, default=16, help="HPA* cluster size")
+    args = parser.parse_args()
+    random.seed(42)
+    graph, _ = generate_grid_graph(args.rows, args.cols, args.obstacles,
+                                   implicit=args.implicit, connectivity=args.connectivity)
+    res = compare_planners(graph, 0, args.rows * args.cols - 1, args.weight, cluster_size=args.cluster)
+    for name, r in res.items():
+        extra = f"  build={r['build']:.4f}s" if "build" in r else ""
+        print(f"{name:>14}: expanded={r['expanded']:>7}  time={r['time']:.4f}s  path_len={r['path_len']}{extra}")
@@ -3,6 +3,7 @@
 Benchmark runner to compare Dijkstra vs BMSSP (safe / fast modes).
 Usage:
     python -m benchmarks.run_benchmark --n 2000 --deg 2 --mode safe
+For sweeps over graph families with repeats, memory and JSON/CSV output see benchmarks/suite.py.
 """
 
 import time
@@ -13,6 +14,7 @@ from typing import List, Tuple
 from core.graph import Graph
 from algorithms.dijkstra import dijkstra
 from algorithms.bmssp import bmssp_main
+from algorithms.verify import verify_sssp
 
 def generate_random_sparse_graph(n: int, avg_deg: int = 2, weight_range=(1.0, 10.0)):
     edges = []
@@ -30,25 +32,17 @@ def generate_random_sparse_graph(n: int, avg_deg: int = 2, weight_range=(1.0, 10
     return edges
 
 def run_demo(n=2000, avg_deg=2, mode="safe"):
-    # build graph
-    edges = []
-    for u in range(n):
-        for _ in range(avg_deg):
-            v = random.randrange(0, n)
-            if v == u:
-                continue
-            edges.append((u, v, random.uniform(1.0, 10.0)))
-    graph = Graph.from_edge_list(n, edges)
+    graph = Graph.from_edge_list(n, generate_random_sparse_graph(n, avg_deg))
     source = 0
 
-    t0 = time.time()
+    t0 = time.perf_counter()
     dist_dij, prev = dijkstra(graph, source)
-    t_dij = time.time() - t0
+    t_dij = time.perf_counter() - t0
     print(f"Dijkstra time: {t_dij:.4f}s")
 
-    t0 = time.time()
+    t0 = time.perf_counter()
     dist_bm, pred, info = bmssp_main(graph, source, mode=mode)
-    t_bm = time.time() - t0
+    t_bm = time.perf_counter() - t0
     print(f"BMSSP time ({mode}): {t_bm:.4f}s")
 
     mismatch = 0
@@ -59,7 +53,11 @@ def run_demo(n=2000, avg_deg=2, mode="safe"):
             mismatch += 1
 
     print(f"Mismatch count: {mismatch} out of {graph.num_nodes}")
-    return {"n": n, "dijkstra": t_dij, "bmssp": t_bm, "mismatch": mismatch, "mode": mode}
+    certified, _, _ = verify_sssp(graph, source, dist_bm, pred)
+    print(f"Certificate check: {'ok' if certified else 'FAILED'}")
+    print(f"Repair: {info['repair_settled']} settled from {info['repair_seeds']} seeds")
+    return {"n": n, "dijkstra": t_dij, "bmssp": t_bm, "mismatch": mismatch, "certified": certified, "mode": mode,
+            "repair_seeds": info["repair_seeds"], "repair_settled": info["repair_settled"]}
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -0,0 +1,231 @@
+# benchmarks/suite.py
+"""
+Benchmark suite: sweep graph family x n x degree, run every engine with warmup + repeats
+(time.perf_counter), and record per engine:
+ - time_min / time_median / time_mean over the repeats
+ - peak_bytes: tracemalloc peak of one extra (untimed) run
+ - edges_relaxed: edges scanned in one extra run through a counting graph proxy
+   (None for engines that freeze the graph to CSR and scan its arrays directly)
+ - mismatches vs. a reference Dijkstra run, plus the O(V+E) certificate for SSSP engines
+
+Results go to JSON and/or CSV; --compare flags rows whose median time regressed by more
+than --threshold against an earlier JSON file (exit code 1 if any did).
+
+Usage:
+    python -m benchmarks.suite --families uniform,grid --n 2000,20000 --deg 2,4 \\
+        --repeats 5 --json out.json --csv out.csv
+    python -m benchmarks.suite ... --compare baseline.json --threshold 1.15
+"""
+
+import csv
+import json
+import random
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from algorithms.dijkstra import dijkstra, bidirectional_dijkstra
+from algorithms.bmssp import bmssp_main
+from algorithms.delta_stepping import delta_stepping
+from algorithms.astar import astar, grid_heuristic
+from algorithms.verify import verify_sssp
+from algorithms.queues import weight_stats
+from algorithms.vectorized import HAVE_NUMPY
+from benchmarks.generators import FAMILIES
+
+INF = float('inf')
+
+# engine name -> (kind, fn). SSSP engines: fn(graph, source) -> (dist, pred);
+# point-to-point engines: fn(graph, source, target) -> (dist, pred)
+ENGINES = {
+    "dijkstra": ("sssp", lambda g, s: dijkstra(g, s)),
+    "bmssp_safe": ("sssp", lambda g, s: bmssp_main(g, s, mode="safe")[:2]),
+    "bmssp_fast": ("sssp", lambda g, s: bmssp_main(g, s, mode="fast")[:2]),
+    "dijkstra_auto": ("sssp", lambda g, s: dijkstra(g, s, queue="auto")),
+    "delta_stepping": ("sssp", lambda g, s: delta_stepping(g, s)),
+    "dijkstra_p2p": ("p2p", lambda g, s, t: dijkstra(g, s, target=t)),
+    "bmssp_p2p": ("p2p", lambda g, s, t: bmssp_main(g, s, mode="fast", target=t)[:2]),
+    "bidirectional": ("p2p", lambda g, s, t: bidirectional_dijkstra(g, s, t)[:2]),
+    "astar": ("p2p", lambda g, s, t: astar(g, s, t, grid_heuristic(g))[:2]),
+}
+if HAVE_NUMPY:
+    # "auto": the edge-counting proxy is not CSR, so that one extra run takes the scalar path
+    ENGINES["bmssp_numpy"] = ("sssp", lambda g, s: bmssp_main(g, s, mode="fast", backend="auto")[:2])
+
+class CountingGraph:
+    """Proxy that counts every edge handed out by get_neighbors()."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.num_nodes = graph.num_nodes
+        self.directed = getattr(graph, "directed", False)
+        self.shape = getattr(graph, "shape", None)
+        self.edges = 0
+
+    @property
+    def nodes(self):
+        return self.graph.nodes
+
+    def get_neighbors(self, node):
+        nbrs = list(self.graph.get_neighbors(node))
+        self.edges += len(nbrs)
+        return nbrs
+
+    neighbors = get_neighbors
+
+    def weight_stats(self):
+        # queue selection scans weights on the real graph (not counted as relaxations)
+        return weight_stats(self.graph)
+
+    def reversed(self):
+        return CountingGraph(self.graph.reversed())
+
+    def to_csr(self):
+        # the engine scans the frozen arrays, past this proxy: nothing left to count
+        self.edges = None
+        graph = self.graph
+        return graph if hasattr(graph, "offsets") else graph.to_csr()
+
+def _call(kind, fn, graph, source, target):
+    return fn(graph, source) if kind == "sssp" else fn(graph, source, target)
+
+def _far_target(ref):
+    """Farthest reachable node from the reference run (a hard point-to-point query)."""
+    best, far = -1.0, None
+    for v, d in ref.items():
+        if d < INF and d > best:
+            best, far = d, v
+    return far
+
+def _pick_source(graph, candidates=3):
+    """Of a few evenly spaced nodes, the one reaching the most nodes (obstacles can wall in node 0)."""
+    best = None
+    n = graph.num_nodes
+    for i in range(candidates):
+        s = i * n // candidates
+        ref, _ = dijkstra(graph, s)
+        reached = sum(1 for d in ref.values() if d < INF)
+        if best is None or reached > best[0]:
+            best = (reached, s, ref)
+    return best[1], best[2]
+
+def bench_engine(name, graph, source, target, ref, warmup=1, repeats=3):
+    kind, fn = ENGINES[name]
+    for _ in range(warmup):
+        _call(kind, fn, graph, source, target)
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        dist, pred = _call(kind, fn, graph, source, target)
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    _call(kind, fn, graph, source, target)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    counting = CountingGraph(graph)
+    _call(kind, fn, counting, source, target)
+
+    if kind == "sssp":
+        mismatches = sum(1 for v in graph.nodes
+                         if abs(dist[v] - ref[v]) > 1e-6 and not (dist[v] == INF and ref[v] == INF))
+        certified = verify_sssp(graph, source, dist, pred)[0]
+    else:
+        a, b = dist.get(target, INF), ref[target]
+        mismatches = int(abs(a - b) > 1e-6 and not (a == INF and b == INF))
+        certified = None
+    return {
+        "engine": name,
+        "time_min": min(times),
+        "time_median": statistics.median(times),
+        "time_mean": statistics.mean(times),
+        "repeats": repeats,
+        "peak_bytes": peak,
+        "edges_relaxed": counting.edges,
+        "mismatches": mismatches,
+        "certified": certified,
+    }
+
+def run_suite(families, sizes, degrees, engines, warmup=1, repeats=3, seed=42, log=print):
+    rows = []
+    for family in families:
+        for n in sizes:
+            for deg in degrees:
+                rng = random.Random(seed)
+                graph = FAMILIES[family](n, deg, rng=rng)
+                source, ref = _pick_source(graph)
+                target = _far_target(ref)
+                for name in engines:
+                    row = {"family": family, "n": graph.num_nodes, "deg": deg, "m": graph.num_edges}
+                    row.update(bench_engine(name, graph, source, target, ref, warmup, repeats))
+                    rows.append(row)
+                    log(f"{family:>9} n={row['n']:<8} deg={deg:<3} {name:>13}: "
+                        f"median={row['time_median']:.4f}s peak={row['peak_bytes'] / 1e6:.1f}MB "
+                        f"relaxed={row['edges_relaxed']} mismatches={row['mismatches']}")
+    return rows
+
+def _key(row):
+    return (row["family"], row["n"], row["deg"], row["engine"])
+
+def compare(rows, baseline_rows, threshold=1.15):
+    """Rows whose median time exceeds threshold x baseline (or that gained mismatches)."""
+    base = {_key(r): r for r in baseline_rows}
+    flagged = []
+    for row in rows:
+        old = base.get(_key(row))
+        if old is None:
+            continue
+        ratio = row["time_median"] / old["time_median"] if old["time_median"] > 0 else 1.0
+        if ratio > threshold or row["mismatches"] > old["mismatches"]:
+            flagged.append(dict(row, baseline_median=old["time_median"], ratio=ratio))
+    return flagged
+
+def write_json(rows, path):
+    with open(path, "w") as f:
+        json.dump({"rows": rows}, f, indent=2)
+
+def write_csv(rows, path):
+    if not rows:
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def _csv_list(text, conv=str):
+    return [conv(x) for x in text.split(",") if x]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--families", type=str, default=",".join(FAMILIES))
+    parser.add_argument("--n", type=str, default="2000,20000")
+    parser.add_argument("--deg", type=str, default="2,4")
+    parser.add_argument("--engines", type=str, default=",".join(ENGINES))
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", type=str, default=None)
+    parser.add_argument("--csv", type=str, default=None)
+    parser.add_argument("--compare", type=str, default=None, help="baseline JSON to flag regressions against")
+    parser.add_argument("--threshold", type=float, default=1.15)
+    args = parser.parse_args()
+
+    engines = _csv_list(args.engines)
+    unknown = [e for e in engines if e not in ENGINES]
+    if unknown:
+        parser.error(f"unknown engines: {unknown}")
+    rows = run_suite(_csv_list(args.families), _csv_list(args.n, int), _csv_list(args.deg, int),
+                     engines, args.warmup, args.repeats, args.seed)
+    if args.json:
+        write_json(rows, args.json)
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.compare:
+        with open(args.compare) as f:
+            flagged = compare(rows, json.load(f)["rows"], args.threshold)
+        for r in flagged:
+            print(f"REGRESSION {_key(r)}: {r['baseline_median']:.4f}s -> {r['time_median']:.4f}s (x{r['ratio']:.2f})")
+        if flagged:
+            raise SystemExit(1)
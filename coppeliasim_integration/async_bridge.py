@@ -0,0 +1,296 @@
+# coppeliasim_integration/async_bridge.py
+"""
+Asyncio bridge between the planners and a CoppeliaSim `sim` object (RemoteAPIClient or
+mock_sim.MockSim).
+
+bmssp_pioneer_follow.py plans once, then blocks on setObjectPosition + sleep(0.2) per
+cell: every waypoint waits for a ZMQ round trip on top of the step time, and nothing else
+can happen meanwhile. Here the three jobs run concurrently:
+ - planning runs on a worker thread (simulation.robot_sim.Robot), so the robot keeps
+   moving while a replan after block_cell() is computed; the new path replaces the rest
+   of the old one from wherever the robot is when it arrives
+ - signals are published as one batch (grid + path) in a single hop to the sim thread
+ - motion ticks on a fixed schedule (no drift from round trips) and hands positions to a
+   PositionStreamer: latest value wins, so a slow link coalesces waypoints instead of
+   queueing them behind each other
+
+All sim calls go through one SimLink thread: the ZMQ client is a single request / reply
+socket and not thread-safe, so calls are serialised there and never block the loop.
+
+    bridge = AsyncPioneer(sim, graph, obstacles, cols)
+    stats = asyncio.run(bridge.follow(start, goal))
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from statistics import median
+from typing import Dict, List, Optional
+
+from core.wire import GridEncoder, encode_path
+from simulation.robot_sim import Robot
+
+CELL_SIZE = 0.1         # metres per grid cell
+ROBOT_Z = 0.138         # Pioneer P3-DX ground clearance
+
+
+class SimLink:
+    """Runs blocking sim calls on one dedicated thread; counts calls and round-trip times."""
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.calls = 0
+        self.round_trips = []           # seconds per executor hop (a batch is one hop)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sim")
+
+    def _run_batch(self, calls):
+        sim = self.sim
+        return [getattr(sim, name)(*args) for name, args in calls]
+
+    async def batch(self, calls) -> list:
+        """Run [(method name, args), ...] back to back in one hop; returns their results."""
+        t0 = time.perf_counter()
+        out = await asyncio.get_running_loop().run_in_executor(self._executor, self._run_batch, calls)
+        self.round_trips.append(time.perf_counter() - t0)
+        self.calls += len(calls)
+        return out
+
+    async def call(self, name: str, *args):
+        return (await self.batch([(name, args)]))[0]
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+
+class PositionStreamer:
+    """
+    Latest-value-wins position channel. set() never waits; one sender task forwards the
+    newest position of every handle that changed since its last send (all in one hop).
+    latencies: seconds from set() to the sim having applied that position, for the
+    positions that were actually sent.
+    If a send fails (dropped link, invalid handle) the sender stops and keeps the exception
+    in `error`; set(), flush() and stop() raise it from then on.
+    """
+
+    def __init__(self, link: SimLink):
+        self.link = link
+        self.submitted = 0
+        self.sent = 0
+        self.latencies = []
+        self._pending = {}              # handle -> (position, time set)
+        self._wake = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = None
+        self.error = None
+
+    def start(self):
+        self._task = asyncio.ensure_future(self._run())
+
+    def set(self, handle, position):
+        if self.error is not None:
+            raise self.error
+        self._pending[handle] = (position, time.perf_counter())
+        self.submitted += 1
+        self._idle.clear()
+        self._wake.set()
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            if not self._pending:
+                continue
+            pending, self._pending = self._pending, {}
+            try:
+                await self.link.batch([("setObjectPosition", (h, -1, pos)) for h, (pos, _) in pending.items()])
+            except Exception as exc:
+                self.error = exc
+                self._pending.clear()
+                self._idle.set()        # nothing will be sent any more: release flush()
+                return
+            done = time.perf_counter()
+            self.latencies.extend(done - t for _, t in pending.values())
+            self.sent += len(pending)
+            if not self._pending:
+                self._idle.set()
+
+    async def flush(self):
+        """Wait until every position set so far has been sent."""
+        await self._idle.wait()
+        if self.error is not None:
+            raise self.error
+
+    async def stop(self):
+        try:
+            await self.flush()
+        finally:
+            if self._task is not None:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+                self._task = None
+
+
+class AsyncPioneer:
+    """
+    Drives one robot along planned paths on a cols-wide grid (node id = r * cols + c).
+    planner: a Robot (anything with calculate_path(graph, source, target) -> [nodes]);
+    default Robot(mode="bmssp"). step_time: seconds per cell.
+    codec: "json" (the scene scripts' format) or "binary" (core.wire: bit-packed grid
+    frames, deltas after the first one, varint paths).
+    """
+
+    def __init__(self, sim, graph, obstacles, cols: int, robot: str = "/PioneerP3DX",
+                 step_time: float = 0.2, planner=None, codec: str = "json"):
+        if codec not in ("json", "binary"):
+            raise ValueError(f"unknown codec {codec!r} (expected 'json' or 'binary')")
+        self.graph = graph
+        self.obstacles = obstacles
+        self.cols = cols
+        self.robot = robot
+        self.step_time = step_time
+        self.codec = codec
+        self._grid_encoder = GridEncoder(len(obstacles) // cols, cols) if codec == "binary" else None
+        self.planner = planner or Robot(None, mode="bmssp")
+        self.link = SimLink(sim)
+        self.plan_times = []
+        self.replans = 0
+        self._replan = None             # asyncio.Event, set by block_cell
+        self._publishing = []           # signal batches in flight
+
+    def position(self, node) -> List[float]:
+        r, c = divmod(node, self.cols)
+        return [r * CELL_SIZE, c * CELL_SIZE, ROBOT_Z]
+
+    async def plan(self, source: int, target: int) -> List[int]:
+        """Plan on a worker thread; [] if target is unreachable."""
+        t0 = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        path = await loop.run_in_executor(None, self.planner.calculate_path, self.graph, source, target)
+        self.plan_times.append(time.perf_counter() - t0)
+        if not path or path[0] != source:
+            return []
+        return path
+
+    async def publish(self, path: List[int]):
+        if self._grid_encoder is not None:
+            grid, data = self._grid_encoder.encode(self.obstacles), encode_path(path)
+        else:
+            grid, data = json.dumps([int(x) for x in self.obstacles]), json.dumps(path)
+        await self.link.batch([("setStringSignal", ("grid", grid)),
+                               ("setStringSignal", ("path", data))])
+
+    def block_cell(self, node: int):
+        """A cell became an obstacle: tombstone it and replan in the background."""
+        self.obstacles[node] = 1
+        self.planner.block_cell(self.graph, node)
+        if self._replan is not None:
+            self._replan.set()
+
+    async def follow(self, start: int, goal: int, max_wait: Optional[float] = None) -> Dict:
+        """
+        Move from start to goal, replanning whenever block_cell() is called. Returns stats;
+        stats["reached"] is False if the goal became unreachable (or max_wait seconds
+        passed without a usable path). A failing sim call is raised here.
+        """
+        self._replan = asyncio.Event()
+        streamer = PositionStreamer(self.link)
+        streamer.start()
+        t_start = time.perf_counter()
+        try:
+            handle = await self.link.call("getObject", self.robot)
+            path = await self.plan(start, goal)
+            self._publishing = [asyncio.ensure_future(self.publish(path))]
+            reached, moves, late = await self._drive(streamer, handle, start, goal, path, max_wait)
+            await asyncio.gather(*self._publishing)
+        finally:
+            try:
+                await streamer.stop()
+            finally:
+                # after a failure: drop signal batches still in flight instead of leaking them
+                for task in self._publishing:
+                    task.cancel()
+                await asyncio.gather(*self._publishing, return_exceptions=True)
+                self._publishing = []
+                self._replan = None
+        total = time.perf_counter() - t_start
+        lat = streamer.latencies
+        return {
+            "reached": reached,
+            "moves": moves,
+            "time": total,
+            "plan_time": sum(self.plan_times),
+            "replans": self.replans,
+            "positions_submitted": streamer.submitted,
+            "positions_sent": streamer.sent,
+            "sim_calls": self.link.calls,
+            "round_trip_median": median(self.link.round_trips) if self.link.round_trips else 0.0,
+            "latency_median": median(lat) if lat else 0.0,
+            "latency_max": max(lat) if lat else 0.0,
+            "late_ticks": late,
+            "moves_per_second": moves / total if total > 0 else 0.0,
+        }
+
+    async def _drive(self, streamer, handle, start, goal, path, max_wait):
+        loop = asyncio.get_running_loop()
+        cur = start
+        i = 0                           # path[i] == cur
+        moves = late = 0
+        pending = None                  # replan in flight
+        waiting_since = None
+        next_tick = loop.time()
+        streamer.set(handle, self.position(cur))
+        while cur != goal:
+            if self._replan.is_set() and pending is None:
+                self._replan.clear()
+                self.replans += 1
+                pending = asyncio.ensure_future(self.plan(cur, goal))
+            if pending is not None and pending.done():
+                new = pending.result()
+                pending = None
+                if not new:
+                    path, i = [], 0
+                elif cur in new:
+                    # the robot kept moving while planning: continue from where it is now
+                    path, i = new, new.index(cur)
+                    self._publishing.append(asyncio.ensure_future(self.publish(path)))
+                else:
+                    self._replan.set()
+            nxt = path[i + 1] if i + 1 < len(path) else None
+            if nxt is None or self.obstacles[nxt]:
+                # no usable next cell: hold position until a replan arrives
+                if pending is None and not self._replan.is_set():
+                    if not path or nxt is None:
+                        return False, moves, late
+                    self._replan.set()
+                if waiting_since is None:
+                    waiting_since = loop.time()
+                elif max_wait is not None and loop.time() - waiting_since > max_wait:
+                    return False, moves, late
+                await asyncio.sleep(0)
+                if pending is not None:
+                    await asyncio.wait([pending], timeout=self.step_time or None)
+                next_tick = loop.time()
+                continue
+            waiting_since = None
+            next_tick += self.step_time
+            delay = next_tick - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                late += 1
+                await asyncio.sleep(0)
+            cur = nxt
+            i += 1
+            moves += 1
+            streamer.set(handle, self.position(cur))
+        if pending is not None:
+            pending.cancel()
+        return True, moves, late
+
+    def close(self):
+        self.link.close()
@@ -0,0 +1,64 @@
+import sys, os, asyncio, argparse, random
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from simulation.grid_world import generate_grid_graph
+from coppeliasim_integration.async_bridge import AsyncPioneer
+
+
+parser = argparse.ArgumentParser(description="BMSSP path following over the asyncio bridge")
+parser.add_argument("--rows", type=int, default=50)
+parser.add_argument("--cols", type=int, default=50)
+parser.add_argument("--obstacles", type=float, default=0.22)
+parser.add_argument("--step", type=float, default=0.20, help="seconds per cell")
+parser.add_argument("--mock", action="store_true", help="use the local mock sim instead of CoppeliaSim")
+parser.add_argument("--latency", type=float, default=0.004, help="mock round-trip latency (s)")
+parser.add_argument("--block", type=int, default=0, help="cells blocked at random while driving")
+parser.add_argument("--codec", choices=("json", "binary"), default="json", help="signal format (binary: core.wire)")
+args = parser.parse_args()
+
+START = 0
+GOAL = args.rows * args.cols - 1
+
+if args.mock:
+    from coppeliasim_integration.mock_sim import MockRemoteAPIClient
+    client = MockRemoteAPIClient(latency=args.latency)
+else:
+    from coppeliasim_zmqremoteapi_client import RemoteAPIClient
+    print("🔵 Connecting to CoppeliaSim ...")
+    client = RemoteAPIClient()
+sim = client.getObject("sim")
+print("🟢 Connected" + (" (mock sim)" if args.mock else " to CoppeliaSim"))
+
+graph, obstacles = generate_grid_graph(rows=args.rows, cols=args.cols, obstacle_prob=args.obstacles)
+obstacles = [int(x) for x in obstacles]
+obstacles[START] = obstacles[GOAL] = 0
+bridge = AsyncPioneer(sim, graph, obstacles, args.cols, step_time=args.step, codec=args.codec)
+
+
+async def disturb():
+    # drop obstacles in front of the robot while it drives: replans run in the background
+    for _ in range(args.block):
+        await asyncio.sleep(args.step * 10)
+        cell = random.randrange(1, GOAL)
+        if not obstacles[cell]:
+            bridge.block_cell(cell)
+
+
+async def main():
+    blocker = asyncio.ensure_future(disturb())
+    stats = await bridge.follow(START, GOAL, max_wait=5.0)
+    blocker.cancel()
+    return stats
+
+
+stats = asyncio.run(main())
+bridge.close()
+
+if not stats["reached"]:
+    print("❌ No path found! Obstacles blocked.")
+else:
+    print(f"🏁 Path following complete! {stats['moves']} moves in {stats['time']:.2f}s, "
+          f"{stats['replans']} replans")
+print(f"   sim calls {stats['sim_calls']}, positions sent {stats['positions_sent']}/{stats['positions_submitted']}, "
+      f"command latency median {stats['latency_median'] * 1e3:.1f}ms max {stats['latency_max'] * 1e3:.1f}ms, "
+      f"late ticks {stats['late_ticks']}")
@@ -28,7 +28,7 @@ flat_grid = [int(x) for x in obstacles]
 
 
 # ✅ Run BMSSP
-dist, pred, _ = bmssp_main(graph, START)
+dist, pred, _ = bmssp_main(graph, START, mode="fast", target=GOAL)
 
 if pred.get(GOAL) is None:
     print("❌ No path found! Obstacles blocked.")
@@ -0,0 +1,106 @@
+# coppeliasim_integration/mock_sim.py
+"""
+Local stand-in for the ZMQ RemoteAPIClient and its `sim` object, so the bridge can be run
+and measured without CoppeliaSim.
+
+Every call sleeps for `latency` (+ up to `jitter`) seconds like one ZMQ request / reply
+round trip, and is serialised by a lock like the real single-socket client. Only the calls
+the planners use are implemented; state is kept in plain dicts and `calls` counts every
+call by name.
+
+    client = MockRemoteAPIClient(latency=0.004)
+    sim = client.getObject("sim")
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+
+
+class MockSim:
+    def __init__(self, latency: float = 0.002, jitter: float = 0.0, objects=("/PioneerP3DX",),
+                 rng=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = rng or random.Random(0)
+        self.handles = {path: i + 1 for i, path in enumerate(objects)}
+        self.positions = {h: [0.0, 0.0, 0.0] for h in self.handles.values()}
+        self.orientations = {h: [0.0, 0.0, 0.0] for h in self.handles.values()}
+        self.signals = {}
+        self.calls = Counter()
+        self.trace = []                 # (time, handle, position) of every setObjectPosition
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+
+    def _round_trip(self, name):
+        self.calls[name] += 1
+        delay = self.latency + (self.jitter * self.rng.random() if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _handle(self, handle):
+        if handle not in self.positions:
+            raise RuntimeError(f"invalid object handle {handle}")
+        return handle
+
+    def getObject(self, path):
+        with self._lock:
+            self._round_trip("getObject")
+            try:
+                return self.handles[path]
+            except KeyError:
+                raise RuntimeError(f"object does not exist: {path}")
+
+    def setObjectPosition(self, handle, relative_to, position):
+        with self._lock:
+            self._round_trip("setObjectPosition")
+            self.positions[self._handle(handle)] = list(position)
+            self.trace.append((time.perf_counter() - self._t0, handle, list(position)))
+
+    def getObjectPosition(self, handle, relative_to):
+        with self._lock:
+            self._round_trip("getObjectPosition")
+            return list(self.positions[self._handle(handle)])
+
+    def setObjectOrientation(self, handle, relative_to, euler):
+        with self._lock:
+            self._round_trip("setObjectOrientation")
+            self.orientations[self._handle(handle)] = list(euler)
+
+    def getObjectOrientation(self, handle, relative_to):
+        with self._lock:
+            self._round_trip("getObjectOrientation")
+            return list(self.orientations[self._handle(handle)])
+
+    def setStringSignal(self, name, value):
+        with self._lock:
+            self._round_trip("setStringSignal")
+            self.signals[name] = value
+
+    def getStringSignal(self, name):
+        with self._lock:
+            self._round_trip("getStringSignal")
+            return self.signals.get(name)
+
+    def clearStringSignal(self, name):
+        with self._lock:
+            self._round_trip("clearStringSignal")
+            self.signals.pop(name, None)
+
+    def getSimulationTime(self):
+        with self._lock:
+            self._round_trip("getSimulationTime")
+            return time.perf_counter() - self._t0
+
+
+class MockRemoteAPIClient:
+    """Drop-in for coppeliasim_zmqremoteapi_client.RemoteAPIClient (host / port are ignored)."""
+
+    def __init__(self, host: str = "localhost", port: int = 23000, **sim_options):
+        self.sim = MockSim(**sim_options)
+
+    def getObject(self, name):
+        if name == "sim":
+            return self.sim
+        raise RuntimeError(f"unknown remote object {name!r}")
@@ -1,9 +1,25 @@
 # core/graph.py
 
+from array import array
+
+
 class Graph:
     def __init__(self, num_nodes: int):
         self.num_nodes = num_nodes
         self.adj_list = {i: [] for i in range(num_nodes)}  # adjacency list
+        # tombstones: temporarily blocked nodes / directed edges, hidden by neighbors()
+        self.blocked_nodes = set()
+        self.blocked_edges = set()
+        # bumped on every mutation; caches and planners key on (graph, version)
+        self.version = 0
+
+    @classmethod
+    def from_edge_list(cls, num_nodes: int, edges, directed: bool = True):
+        """
+        Bulk loader: edges = iterable of (u, v, w).
+        Returns a frozen CSRGraph (see below), not a mutable Graph.
+        """
+        return CSRGraph.from_edge_list(num_nodes, edges, directed=directed)
 
     @property
     def nodes(self):
@@ -14,17 +30,175 @@ class Graph:
         """Undirected weighted graph"""
         self.adj_list[u].append((v, w))
         self.adj_list[v].append((u, w))
+        self.version += 1
 
     def neighbors(self, node):
-        """Return neighbors like: [(nbr, weight), ...]"""
-        return self.adj_list[node]
+        """Return neighbors like: [(nbr, weight), ...] (blocked nodes / edges skipped)"""
+        nbrs = self.adj_list[node]
+        if not self.blocked_nodes and not self.blocked_edges:
+            return nbrs
+        if node in self.blocked_nodes:
+            return []
+        bn = self.blocked_nodes
+        be = self.blocked_edges
+        return [(v, w) for v, w in nbrs if v not in bn and (node, v) not in be]
 
     def get_neighbors(self, node):
         """BMSSP ke compatible naming ke liye wrapper"""
         return self.neighbors(node)
 
     def remove_node(self, node):
-        """Node remove + edges cleanup"""
-        for key in list(self.adj_list.keys()):
-            self.adj_list[key] = [(n, w) for (n, w) in self.adj_list[key] if n != node]
+        """Node remove + edges cleanup, O(sum of neighbour degrees) since edges are stored both ways"""
+        for n in {v for v, _ in self.adj_list.get(node, ())}:
+            if n != node:
+                self.adj_list[n] = [(x, w) for (x, w) in self.adj_list[n] if x != node]
         self.adj_list.pop(node, None)
+        self.blocked_nodes.discard(node)
+        self.version += 1
+
+    def remove_edge(self, u, v):
+        """Delete every u-v edge (both directions), O(deg(u) + deg(v))"""
+        self.adj_list[u] = [(x, w) for (x, w) in self.adj_list[u] if x != v]
+        self.adj_list[v] = [(x, w) for (x, w) in self.adj_list[v] if x != u]
+        self.blocked_edges.discard((u, v))
+        self.blocked_edges.discard((v, u))
+        self.version += 1
+
+    def block_node(self, node):
+        """Temporarily hide node and all its edges, O(1). Undo with unblock_node."""
+        if node not in self.blocked_nodes:
+            self.blocked_nodes.add(node)
+            self.version += 1
+
+    def unblock_node(self, node):
+        if node in self.blocked_nodes:
+            self.blocked_nodes.discard(node)
+            self.version += 1
+
+    def block_edge(self, u, v):
+        """Temporarily hide the u-v edge in both directions, O(1)."""
+        if (u, v) not in self.blocked_edges:
+            self.blocked_edges.add((u, v))
+            self.blocked_edges.add((v, u))
+            self.version += 1
+
+    def unblock_edge(self, u, v):
+        if (u, v) in self.blocked_edges:
+            self.blocked_edges.discard((u, v))
+            self.blocked_edges.discard((v, u))
+            self.version += 1
+
+    def is_blocked(self, node):
+        return node in self.blocked_nodes
+
+    def to_csr(self):
+        """Freeze current adjacency into a CSRGraph (edges kept as stored, both directions; blocked ones dropped)."""
+        edges = ((u, v, w) for u in self.adj_list for v, w in self.neighbors(u))
+        return CSRGraph.from_edge_list(self.num_nodes, edges, directed=True)
+
+
+class CSRGraph:
+    """
+    Frozen compressed-sparse-row graph.
+
+    offsets[u] .. offsets[u+1] is the slice of `targets` / `weights` holding
+    the out-edges of u. Storage is flat `array` buffers (8 + 8 bytes per edge,
+    8 bytes per node), so multi-million-edge graphs stay compact and the
+    buffers can be handed to NumPy / shared memory without copying.
+
+    get_neighbors() keeps the Graph contract (iterable of (v, w)), so
+    dijkstra / mini_dijkstra / find_pivots / bmssp_iterative run unchanged.
+    Hot loops can use edge_range() and index targets/weights directly.
+    Frozen means the version never changes (always 0).
+    """
+
+    version = 0
+
+    def __init__(self, num_nodes: int, offsets, targets, weights, directed: bool = True):
+        if len(offsets) != num_nodes + 1:
+            raise ValueError("offsets must have num_nodes + 1 entries")
+        if len(targets) != len(weights) or len(targets) != offsets[num_nodes]:
+            raise ValueError("targets/weights length does not match offsets")
+        self.num_nodes = num_nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+
+    @classmethod
+    def from_edge_list(cls, num_nodes: int, edges, directed: bool = True):
+        """
+        Build CSR in bulk from an iterable of (u, v, w) (a generator is fine).
+        Undirected graphs store every edge in both directions.
+        """
+        src = array('q')
+        dst = array('q')
+        wts = array('d')
+        for u, v, w in edges:
+            src.append(u)
+            dst.append(v)
+            wts.append(w)
+        if not directed:
+            src, dst = src + dst, dst + src
+            wts = wts + wts
+        return cls.from_arrays(num_nodes, src, dst, wts, directed=directed)
+
+    @classmethod
+    def from_arrays(cls, num_nodes: int, src, dst, wts, directed: bool = True):
+        """Counting-sort parallel (src, dst, wts) arrays into CSR order (stable per source)."""
+        m = len(src)
+        offsets = array('q', bytes(8 * (num_nodes + 1)))
+        for u in src:
+            if u < 0 or u >= num_nodes:
+                raise ValueError(f"edge endpoint {u} out of range for {num_nodes} nodes")
+            offsets[u + 1] += 1
+        for i in range(num_nodes):
+            offsets[i + 1] += offsets[i]
+
+        cursor = offsets[:-1]
+        targets = array('q', bytes(8 * m))
+        weights = array('d', bytes(8 * m))
+        for i in range(m):
+            u = src[i]
+            v = dst[i]
+            if v < 0 or v >= num_nodes:
+                raise ValueError(f"edge endpoint {v} out of range for {num_nodes} nodes")
+            pos = cursor[u]
+            targets[pos] = v
+            weights[pos] = wts[i]
+            cursor[u] = pos + 1
+        return cls(num_nodes, offsets, targets, weights, directed=directed)
+
+    @property
+    def nodes(self):
+        return range(self.num_nodes)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def degree(self, node):
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def edge_range(self, node):
+        """Fast path: (start, end) index range into targets/weights, no tuples allocated."""
+        return self.offsets[node], self.offsets[node + 1]
+
+    def get_neighbors(self, node):
+        """Same contract as Graph.get_neighbors: iterable of (nbr, weight)."""
+        start = self.offsets[node]
+        end = self.offsets[node + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    neighbors = get_neighbors
+
+    def reversed(self):
+        """Transpose graph (in-edges become out-edges). Undirected graphs are their own transpose."""
+        if not self.directed:
+            return self
+        src = array('q', bytes(8 * self.num_edges))
+        offsets = self.offsets
+        for u in range(self.num_nodes):
+            for i in range(offsets[u], offsets[u + 1]):
+                src[i] = u
+        return CSRGraph.from_arrays(self.num_nodes, self.targets, src, self.weights, directed=True)
@@ -0,0 +1,202 @@
+# core/graph_io.py
+"""
+Graph files.
+
+Binary CSR format (little-endian, every section 8-byte aligned):
+    header   32 bytes: magic b"BMSSPCSR", u32 format version, u32 flags (bit 0 = directed),
+             u64 num_nodes, u64 num_edges
+    offsets  int64[num_nodes + 1]
+    targets  int64[num_edges]
+    weights  float64[num_edges]
+save_csr() writes it; load_csr() maps it with mmap and wraps the sections in a CSRGraph over
+read-only memoryviews: opening is O(1) (pages are faulted in on first touch) and every
+process mapping the same file shares one copy in the page cache.
+
+Text importers (streamed line by line, the text is never held in memory; parsed edges go
+straight into compact arrays, 24 bytes per edge):
+    read_dimacs(path)     DIMACS shortest-path .gr ("p sp n m" / "a u v w", 1-based ids)
+    read_edge_list(path)  "u v [w]" per line, 0-based ids, '#' / '%' comments
+Both accept .gz files.
+
+write_array / read_array (little-endian array sections) are shared with the preprocessing
+files of algorithms.alt and algorithms.ch.
+
+Convert once, then map:
+    python -m core.graph_io USA-road-d.NY.gr.gz ny.csr
+"""
+
+import gzip
+import mmap
+import struct
+import sys
+from array import array
+
+from core.graph import CSRGraph
+
+MAGIC = b"BMSSPCSR"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ")
+FLAG_DIRECTED = 1
+
+
+def _open_text(path):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "rt")
+    return open(path, "r")
+
+
+def _little_endian(arr):
+    if sys.byteorder == "big":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr
+
+
+def write_array(f, typecode: str, data):
+    """Append `data` to the binary file f as little-endian items of `typecode`."""
+    if not isinstance(data, array) or data.typecode != typecode:
+        data = array(typecode, data)
+    _little_endian(data).tofile(f)
+
+
+def read_array(f, typecode: str, count: int) -> array:
+    """Read `count` little-endian items of `typecode` (EOFError if the file is shorter)."""
+    arr = array(typecode)
+    arr.fromfile(f, count)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+
+def save_csr(graph: CSRGraph, path):
+    """Write `graph` (a CSRGraph, or anything with to_csr()) in the binary format."""
+    if not isinstance(graph, CSRGraph):
+        graph = graph.to_csr()
+    n, m = graph.num_nodes, graph.num_edges
+    flags = FLAG_DIRECTED if graph.directed else 0
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, flags, n, m))
+        for typecode, data in (('q', graph.offsets), ('q', graph.targets), ('d', graph.weights)):
+            write_array(f, typecode, data)
+
+
+def load_csr(path, use_mmap: bool = True) -> CSRGraph:
+    """
+    Open a binary CSR file. use_mmap=True maps it read-only (near-zero time, shared page cache);
+    False reads it into private arrays. The mapped graph keeps the mapping alive and remembers
+    its file as graph.mapped_path (batch workers map the same file instead of copying it).
+    """
+    with open(path, "rb") as f:
+        head = f.read(_HEADER.size)
+        if len(head) < _HEADER.size:
+            raise ValueError(f"{path}: truncated header")
+        magic, version, flags, n, m = _HEADER.unpack(head)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a BMSSP CSR file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported format version {version}")
+        a = _HEADER.size
+        b = a + 8 * (n + 1)
+        c = b + 8 * m
+        end = c + 8 * m
+        directed = bool(flags & FLAG_DIRECTED)
+
+        if not use_mmap or sys.byteorder == "big":
+            offsets = read_array(f, 'q', n + 1)
+            targets = read_array(f, 'q', m)
+            weights = read_array(f, 'd', m)
+            return CSRGraph(n, offsets, targets, weights, directed=directed)
+
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mm) < end:
+        mm.close()
+        raise ValueError(f"{path}: file shorter than its header says")
+    view = memoryview(mm)
+    graph = CSRGraph(n, view[a:b].cast('q'), view[b:c].cast('q'), view[c:end].cast('d'),
+                     directed=directed)
+    graph.mapped_path = str(path)
+    graph._mmap = mm
+    return graph
+
+
+def _finish(num_nodes, src, dst, wts, directed):
+    if not directed:
+        src, dst = src + dst, dst + src
+        wts = wts + wts
+    return CSRGraph.from_arrays(num_nodes, src, dst, wts, directed=directed)
+
+
+def read_dimacs(path, directed: bool = True) -> CSRGraph:
+    """Stream a DIMACS .gr file ("c" comments, one "p sp n m" line, "a u v w" arcs)."""
+    n = None
+    src, dst, wts = array('q'), array('q'), array('d')
+    with _open_text(path) as f:
+        for lineno, line in enumerate(f, 1):
+            tag = line[:1]
+            if tag == "a":
+                _, u, v, w = line.split()
+                src.append(int(u) - 1)
+                dst.append(int(v) - 1)
+                wts.append(float(w))
+            elif tag == "p":
+                parts = line.split()
+                if len(parts) != 4 or parts[1] != "sp":
+                    raise ValueError(f"{path}:{lineno}: expected 'p sp <nodes> <arcs>'")
+                n = int(parts[2])
+            elif tag not in ("c", "\n", "\r", ""):
+                raise ValueError(f"{path}:{lineno}: unexpected line {line.strip()!r}")
+    if n is None:
+        raise ValueError(f"{path}: missing 'p sp' problem line")
+    return _finish(n, src, dst, wts, directed)
+
+
+def read_edge_list(path, directed: bool = True, num_nodes: int = None,
+                   default_weight: float = 1.0) -> CSRGraph:
+    """Stream "u v [w]" lines (0-based ids). num_nodes defaults to max id + 1."""
+    src, dst, wts = array('q'), array('q'), array('d')
+    top = -1
+    with _open_text(path) as f:
+        for lineno, line in enumerate(f, 1):
+            parts = line.split()
+            if not parts or parts[0][0] in "#%":
+                continue
+            if len(parts) == 2:
+                w = default_weight
+            elif len(parts) == 3:
+                w = float(parts[2])
+            else:
+                raise ValueError(f"{path}:{lineno}: expected 'u v [w]'")
+            u, v = int(parts[0]), int(parts[1])
+            src.append(u)
+            dst.append(v)
+            wts.append(w)
+            if u > top:
+                top = u
+            if v > top:
+                top = v
+    if num_nodes is None:
+        num_nodes = top + 1
+    return _finish(num_nodes, src, dst, wts, directed)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="convert a .gr / edge-list file to the binary CSR format")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--undirected", action="store_true")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    name = args.input[:-3] if args.input.endswith(".gz") else args.input
+    reader = read_dimacs if name.endswith(".gr") else read_edge_list
+    g = reader(args.input, directed=not args.undirected)
+    t1 = time.perf_counter()
+    save_csr(g, args.output)
+    t2 = time.perf_counter()
+    load_csr(args.output)
+    t3 = time.perf_counter()
+    print(f"{g.num_nodes} nodes, {g.num_edges} edges: parse {t1 - t0:.2f}s, "
+          f"write {t2 - t1:.2f}s, map {(t3 - t2) * 1e3:.2f}ms")
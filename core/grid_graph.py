@@ -0,0 +1,153 @@
+# core/grid_graph.py
+"""
+Implicit grid graph: neighbours are computed from (r, c) and an occupancy bitmap on the
+fly, nothing per-edge is stored. A rows x cols map costs rows * cols bytes (1 = blocked),
+so 4096 x 4096 maps fit in 16 MB instead of an adjacency list of ~100M tuples.
+
+Node id = r * cols + c (same encoding as generate_grid_graph, so grid heuristics work).
+Satisfies the Graph interface used by the planners: num_nodes, nodes, get_neighbors /
+neighbors, reversed() (undirected: itself), block_node / unblock_node tombstones, version.
+"""
+
+import math
+import random
+from array import array
+
+from core.graph import CSRGraph
+
+SQRT2 = math.sqrt(2)
+
+
+def random_occupancy(n: int, prob: float, rng=random) -> bytearray:
+    """
+    n cells, each blocked (1) with probability ~prob, generated in bulk: one getrandbits call
+    for all n random bytes, mapped to 0/1 by bytes.translate (no per-cell Python loop).
+    prob is quantised to multiples of 1/256.
+    """
+    if n <= 0:
+        return bytearray()
+    cut = max(0, min(256, round(prob * 256)))
+    table = bytes(1 if b < cut else 0 for b in range(256))
+    raw = rng.getrandbits(8 * n).to_bytes(n, "little")
+    return bytearray(raw.translate(table))
+
+
+class GridGraph:
+    """
+    connectivity=4: up / down / left / right, cost `cost`.
+    connectivity=8: plus diagonals at cost * diagonal; a diagonal move needs both adjacent
+                    orthogonal cells free (no cutting corners of obstacles).
+    Blocked cells have no edges in or out.
+    """
+
+    directed = False
+
+    def __init__(self, rows: int, cols: int, occupancy=None, connectivity: int = 4,
+                 cost: float = 1.0, diagonal: float = SQRT2):
+        if connectivity not in (4, 8):
+            raise ValueError("connectivity must be 4 or 8")
+        self.rows = rows
+        self.cols = cols
+        self.shape = (rows, cols)
+        self.num_nodes = rows * cols
+        if occupancy is None:
+            occupancy = bytearray(self.num_nodes)
+        elif len(occupancy) != self.num_nodes:
+            raise ValueError("occupancy must have rows * cols entries")
+        self.occupancy = occupancy
+        self.connectivity = connectivity
+        self.cost = cost
+        self.diag_cost = cost * diagonal
+        self.version = 0
+
+    @classmethod
+    def random(cls, rows: int, cols: int, obstacle_prob: float = 0.2, connectivity: int = 4,
+               keep_free=(), rng=random):
+        occ = random_occupancy(rows * cols, obstacle_prob, rng)
+        for node in keep_free:
+            occ[node] = 0
+        return cls(rows, cols, occ, connectivity)
+
+    @property
+    def nodes(self):
+        return range(self.num_nodes)
+
+    def is_free(self, node) -> bool:
+        return not self.occupancy[node]
+
+    def get_neighbors(self, node):
+        """[(nbr, cost), ...] of the free neighbours (empty for a blocked cell)."""
+        occ = self.occupancy
+        if occ[node]:
+            return []
+        cols = self.cols
+        r, c = divmod(node, cols)
+        w = self.cost
+        out = []
+        up = r > 0 and not occ[node - cols]
+        down = r < self.rows - 1 and not occ[node + cols]
+        left = c > 0 and not occ[node - 1]
+        right = c < cols - 1 and not occ[node + 1]
+        if up:
+            out.append((node - cols, w))
+        if down:
+            out.append((node + cols, w))
+        if left:
+            out.append((node - 1, w))
+        if right:
+            out.append((node + 1, w))
+        if self.connectivity == 8:
+            d = self.diag_cost
+            if up and left and not occ[node - cols - 1]:
+                out.append((node - cols - 1, d))
+            if up and right and not occ[node - cols + 1]:
+                out.append((node - cols + 1, d))
+            if down and left and not occ[node + cols - 1]:
+                out.append((node + cols - 1, d))
+            if down and right and not occ[node + cols + 1]:
+                out.append((node + cols + 1, d))
+        return out
+
+    neighbors = get_neighbors
+
+    def reversed(self):
+        return self
+
+    def block_node(self, node):
+        """Mark the cell as an obstacle, O(1)."""
+        if not self.occupancy[node]:
+            self.occupancy[node] = 1
+            self.version += 1
+
+    def unblock_node(self, node):
+        if self.occupancy[node]:
+            self.occupancy[node] = 0
+            self.version += 1
+
+    def is_blocked(self, node):
+        return bool(self.occupancy[node])
+
+    def weight_stats(self):
+        """(min, max, all integral) edge weight, for algorithms.queues.select_queue."""
+        if self.connectivity == 4:
+            return self.cost, self.cost, float(self.cost).is_integer()
+        return self.cost, self.diag_cost, False
+
+    @property
+    def num_edges(self):
+        return sum(len(self.get_neighbors(u)) for u in range(self.num_nodes))
+
+    def to_csr(self):
+        """Explicit CSRGraph snapshot (for the NumPy backend / batch workers)."""
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for u in range(self.num_nodes):
+            for v, w in self.get_neighbors(u):
+                targets.append(v)
+                weights.append(w)
+            offsets.append(len(targets))
+        csr = CSRGraph(self.num_nodes, offsets, targets, weights, directed=False)
+        csr.shape = self.shape
+        csr.connectivity = self.connectivity
+        return csr
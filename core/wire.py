@@ -0,0 +1,250 @@
+# core/wire.py
+"""
+Compact wire format for the grid / path signals sent to the simulator.
+
+JSON spends ~2 bytes per grid cell ("0," / "1,") and one parse per value. Here:
+
+Grid frames (GridEncoder / GridDecoder), little-endian, 16-byte header:
+    magic b"BG", u8 format version, u8 kind (0 = full, 1 = delta), u32 rows, u32 cols,
+    u32 frame sequence number
+  full   occupancy bit-packed, cell i = bit (i % 8) of byte i // 8 (1 = blocked),
+         ceil(rows * cols / 8) bytes
+  delta  varint count, then the flipped cell ids as varint gaps (first id, then
+         id - previous id); applies to the frame with sequence number seq - 1 only
+The encoder sends a delta when it is smaller than a full frame and a full frame otherwise
+(and every `keyframe_every` frames, so a receiver that missed one resynchronises).
+
+Path (encode_path / decode_path):
+    magic b"BP", u8 format version, u8 0, u32 node count, then the first node id as a
+    varint and every following step as a zigzag varint of (node - previous node);
+    4-connected grid steps are +-1 / +-cols, so one or two bytes per step.
+
+Bit packing goes through int(bits, 2) / format(int, "b") on the whole grid at once and
+bytes.translate, so no Python-level loop runs per cell.
+"""
+
+import re
+import struct
+from typing import List, Optional, Tuple
+
+GRID_MAGIC = b"BG"
+PATH_MAGIC = b"BP"
+FORMAT_VERSION = 1
+FULL, DELTA = 0, 1
+_GRID_HEADER = struct.Struct("<2sBBIII")
+_PATH_HEADER = struct.Struct("<2sBBI")
+
+_TO_BITS = bytes([0x30] + [0x31] * 255)         # cell byte -> b"0" / b"1"
+_FROM_BITS = bytes(range(256)).replace(b"0", b"\x00").replace(b"1", b"\x01")
+_NONZERO = re.compile(rb"[^\x00]")
+
+
+# --- varints ---------------------------------------------------------------------
+
+def write_varint(out: bytearray, value: int):
+    """Unsigned LEB128: 7 bits per byte, high bit = more bytes follow."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos: int) -> Tuple[int, int]:
+    """(value, position after it)."""
+    result = shift = 0
+    while True:
+        try:
+            b = data[pos]
+        except IndexError:
+            raise ValueError("truncated varint") from None
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+def zigzag(n: int) -> int:
+    return (n << 1) if n >= 0 else ((-n << 1) - 1)
+
+
+def unzigzag(z: int) -> int:
+    return (z >> 1) if not z & 1 else -((z + 1) >> 1)
+
+
+# --- bit packing -------------------------------------------------------------------
+
+def pack_bits(cells) -> bytes:
+    """Bytes-like of cells (0 = free, anything else = blocked) -> packed bits, LSB first."""
+    n = len(cells)
+    if n == 0:
+        return b""
+    digits = bytes(cells).translate(_TO_BITS)[::-1]     # cell 0 becomes the lowest bit
+    return int(digits, 2).to_bytes((n + 7) // 8, "little")
+
+
+def unpack_bits(packed, n: int) -> bytearray:
+    """Inverse of pack_bits: n cells of 0 / 1."""
+    if n == 0:
+        return bytearray()
+    value = int.from_bytes(packed, "little")
+    digits = format(value, "0%db" % n).encode("ascii")
+    if len(digits) > n:
+        raise ValueError("packed grid has bits beyond its cell count")
+    return bytearray(digits[::-1].translate(_FROM_BITS))
+
+
+def changed_cells(old_packed: bytes, new_packed: bytes) -> List[int]:
+    """Ids of the cells whose bit differs between two packed grids of the same size."""
+    diff = (int.from_bytes(old_packed, "little") ^ int.from_bytes(new_packed, "little"))
+    if not diff:
+        return []
+    raw = diff.to_bytes(len(new_packed), "little")
+    out = []
+    for m in _NONZERO.finditer(raw):
+        i = m.start()
+        b = raw[i]
+        base = 8 * i
+        while b:
+            low = b & -b
+            out.append(base + low.bit_length() - 1)
+            b ^= low
+    return out
+
+
+# --- grid frames ----------------------------------------------------------------------
+
+class GridEncoder:
+    """Stateful sender side: encode(occupancy) -> one frame (full or delta)."""
+
+    def __init__(self, rows: int, cols: int, keyframe_every: int = 100):
+        self.rows = rows
+        self.cols = cols
+        self.n = rows * cols
+        self.keyframe_every = keyframe_every
+        self.seq = 0
+        self._last = None               # packed bits of the previous frame
+
+    def full(self, occupancy) -> bytes:
+        """Force a full frame (e.g. for a receiver that just connected)."""
+        packed = pack_bits(occupancy)
+        return self._frame(FULL, packed, packed)
+
+    def _frame(self, kind, packed, payload) -> bytes:
+        self.seq += 1
+        self._last = packed
+        return _GRID_HEADER.pack(GRID_MAGIC, FORMAT_VERSION, kind, self.rows, self.cols, self.seq) + payload
+
+    def encode(self, occupancy) -> bytes:
+        if len(occupancy) != self.n:
+            raise ValueError("occupancy must have rows * cols entries")
+        packed = pack_bits(occupancy)
+        if self._last is None or self.seq % self.keyframe_every == 0:
+            return self._frame(FULL, packed, packed)
+        return self._delta(changed_cells(self._last, packed), packed)
+
+    def encode_changes(self, cells) -> bytes:
+        """
+        Next frame from the ids of the cells that flipped since the last frame (e.g. collected
+        from block / unblock events): skips packing and diffing the whole grid. Every id is
+        one flip, so a cell listed an even number of times (blocked, then unblocked) is unchanged.
+        Needs a previous frame; keyframes and oversized deltas still come out as full frames.
+        """
+        if self._last is None:
+            raise ValueError("encode_changes needs a previous frame (call encode or full first)")
+        packed = bytearray(self._last)
+        odd = set()
+        for v in cells:
+            if v in odd:
+                odd.remove(v)
+            else:
+                odd.add(v)
+        changed = sorted(odd)
+        for v in changed:
+            packed[v >> 3] ^= 1 << (v & 7)
+        packed = bytes(packed)
+        if self.seq % self.keyframe_every == 0:
+            return self._frame(FULL, packed, packed)
+        return self._delta(changed, packed)
+
+    def _delta(self, changed, packed) -> bytes:
+        body = bytearray()
+        write_varint(body, len(changed))
+        prev = 0
+        for v in changed:
+            write_varint(body, v - prev)
+            prev = v
+        if len(body) >= len(packed):
+            return self._frame(FULL, packed, packed)
+        return self._frame(DELTA, packed, bytes(body))
+
+
+class GridDecoder:
+    """Receiver side: decode(frame) -> the current occupancy (a bytearray it keeps updating)."""
+
+    def __init__(self):
+        self.rows = self.cols = None
+        self.seq = None
+        self.occupancy = None
+
+    def decode(self, frame) -> bytearray:
+        if len(frame) < _GRID_HEADER.size:
+            raise ValueError("truncated grid frame")
+        magic, version, kind, rows, cols, seq = _GRID_HEADER.unpack_from(frame)
+        if magic != GRID_MAGIC:
+            raise ValueError("not a grid frame")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported grid frame version {version}")
+        body = memoryview(frame)[_GRID_HEADER.size:]
+        if kind == FULL:
+            n = rows * cols
+            if len(body) != (n + 7) // 8:
+                raise ValueError("grid frame size does not match its shape")
+            self.occupancy = unpack_bits(body, n)
+            self.rows, self.cols = rows, cols
+        elif kind == DELTA:
+            if self.occupancy is None or (rows, cols) != (self.rows, self.cols) or seq != self.seq + 1:
+                raise ValueError(f"delta frame {seq} does not follow frame {self.seq}: need a full frame")
+            occ = self.occupancy
+            count, pos = read_varint(body, 0)
+            v = 0
+            for _ in range(count):
+                gap, pos = read_varint(body, pos)
+                v += gap
+                occ[v] ^= 1
+        else:
+            raise ValueError(f"unknown grid frame kind {kind}")
+        self.seq = seq
+        return self.occupancy
+
+
+# --- paths -----------------------------------------------------------------------------
+
+def encode_path(path) -> bytes:
+    out = bytearray(_PATH_HEADER.pack(PATH_MAGIC, FORMAT_VERSION, 0, len(path)))
+    prev = None
+    for v in path:
+        if prev is None:
+            write_varint(out, v)
+        else:
+            write_varint(out, zigzag(v - prev))
+        prev = v
+    return bytes(out)
+
+
+def decode_path(data) -> List[int]:
+    if len(data) < _PATH_HEADER.size:
+        raise ValueError("truncated path")
+    magic, version, _, count = _PATH_HEADER.unpack_from(data)
+    if magic != PATH_MAGIC:
+        raise ValueError("not a path frame")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported path version {version}")
+    pos = _PATH_HEADER.size
+    path = []
+    prev: Optional[int] = None
+    for _ in range(count):
+        z, pos = read_varint(data, pos)
+        prev = z if prev is None else prev + unzigzag(z)
+        path.append(prev)
+    return path
@@ -1,8 +1,18 @@
 from core.graph import Graph
+from core.grid_graph import GridGraph, random_occupancy
 import random
 
-def generate_grid_graph(rows, cols, obstacle_prob=0.2):
+def generate_grid_graph(rows, cols, obstacle_prob=0.2, implicit=False, connectivity=4):
+    """
+    implicit=True returns a GridGraph (neighbours computed from the occupancy bitmap,
+    obstacles generated in bulk; blocked cells have no edges) instead of an explicit Graph.
+    """
+    if implicit:
+        graph = GridGraph.random(rows, cols, obstacle_prob, connectivity)
+        return graph, graph.occupancy
+
     graph = Graph(rows * cols)
+    graph.shape = (rows, cols)  # node id = r * cols + c (used by grid heuristics)
     obstacles = [0] * (rows * cols)
 
     def idx(r, c):
@@ -22,3 +32,39 @@ def generate_grid_graph(rows, cols, obstacle_prob=0.2):
                 graph.add_edge(i, idx(r+1, c))
 
     return graph, obstacles
+
+
+class GridWorld:
+    """
+    Square occupancy grid used by visualize.py: grid[r][c] == 1 means blocked.
+    Backed by one flat bytearray (`occupancy`, index r * size + c); grid rows are views into it.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._set_occupancy(bytearray(size * size))
+
+    def _set_occupancy(self, occ):
+        self.occupancy = occ
+        view = memoryview(occ)
+        self.grid = [view[r * self.size:(r + 1) * self.size] for r in range(self.size)]
+
+    def randomize_obstacles(self, prob=0.2, keep_free=((0, 0),)):
+        self._set_occupancy(random_occupancy(self.size * self.size, prob))
+        keep = list(keep_free) + [(self.size - 1, self.size - 1)]
+        for r, c in keep:
+            self.grid[r][c] = 0
+
+    def is_free(self, r, c):
+        return 0 <= r < self.size and 0 <= c < self.size and self.grid[r][c] == 0
+
+    def add_dynamic_obstacle(self, r, c):
+        """Block cell (r, c); returns True if it was free before."""
+        if not self.is_free(r, c):
+            return False
+        self.grid[r][c] = 1
+        return True
+
+    def to_graph(self, connectivity=4):
+        """Implicit GridGraph over a snapshot of the current obstacles (later world edits are not seen)."""
+        return GridGraph(self.size, self.size, bytearray(self.occupancy), connectivity)
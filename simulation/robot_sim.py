@@ -2,23 +2,105 @@
 
 from algorithms.bmssp import bmssp_main
 from algorithms.dijkstra import dijkstra
+from algorithms.astar import astar, grid_heuristic
+from algorithms.incremental import DStarLite
+from algorithms.hpa import HPAStar
 
 class Robot:
-    def __init__(self, world, start=(0, 0), goal=(49, 49), mode="bmssp"):
+    def __init__(self, world, start=(0, 0), goal=(49, 49), mode="bmssp", heuristic=None, astar_weight=1.0,
+                 cache=None, queue="auto", hierarchy=None, oracle=None):
         self.world = world
         self.start = start
         self.goal = goal
         self.mode = mode
+        self.heuristic = heuristic          # astar mode: h(v, target); None = grid default
+        self.astar_weight = astar_weight    # > 1: weighted A*
+        self.last_stats = {}                # {"engine", "expanded"} of the last query
+        self.planner = None                 # dstar mode: D* Lite state reused across ticks
+        self.cache = cache                  # SPTCache: bmssp / dijkstra reuse full trees per source
+        self.queue = queue                  # bmssp / dijkstra priority queue (unit-weight grids: bucket queues)
+        self.hierarchy = hierarchy          # hpa mode: HPAStar over the graph, built on first use if None
+        self.oracle = oracle                # preprocessed alt.Landmarks / ch.ContractionHierarchy
+
+    def _incremental_path(self, graph, source, target):
+        p = self.planner
+        if (p is None or p.graph is not graph or p.goal != target
+                or p.graph_version != getattr(graph, "version", 0)):
+            p = self.planner = DStarLite(graph, source, target, self.heuristic or grid_heuristic(graph))
+        else:
+            p.set_start(source)
+        path = p.plan()
+        return path, p.expanded
+
+    def block_cell(self, graph, node):
+        """
+        A cell became an obstacle: it is tombstoned in the graph, O(1). In dstar mode it is
+        also a delta for the planner, handed over first so the planner still sees the cell's
+        edges (and, on 8-connected grids, the diagonals past its corners that go with it);
+        hpa mode also marks the node's clusters for rebuilding.
+        """
+        if self.mode == "dstar":
+            p = self.planner
+            if p is not None and p.graph is graph:
+                p.block_node(node)
+                graph.block_node(node)
+                p.graph_version = getattr(graph, "version", 0)     # absorbed, not behind its back
+            else:
+                graph.block_node(node)
+        elif self.mode == "hpa" and self.hierarchy is not None and self.hierarchy.graph is graph:
+            self.hierarchy.block_cell(node)
+        else:
+            graph.block_node(node)
 
     def calculate_path(self, graph, source, target):
+        # point-to-point: every engine stops once `target` is settled;
+        # dstar repairs its previous search instead ([] if target is unreachable);
+        # an oracle answers instead of the mode's engine while it is valid for the graph
+        if self.oracle is not None and self.mode != "dstar" and self.oracle.valid_for(graph):
+            _, path = self.oracle.query(source, target)
+            self.last_stats = {"engine": self.oracle.engine, "expanded": self.oracle.last_stats["expanded"]}
+            return path
+        if self.mode == "dstar":
+            path, expanded = self._incremental_path(graph, source, target)
+            self.last_stats = {"engine": self.mode, "expanded": expanded}
+            return path
+        if self.mode == "hpa":
+            h = self.hierarchy
+            if h is None or h.graph is not graph:
+                h = self.hierarchy = HPAStar(graph)
+            path = h.find_path(source, target)
+            self.last_stats = {"engine": self.mode, "expanded": h.last_stats["expanded"]}
+            return path
+        if self.cache is not None and self.mode in ("bmssp", "dijkstra"):
+            misses = self.cache.misses
+            dist, pred = self.cache.get_or_compute(graph, source, self.mode)
+            hit = self.cache.misses == misses
+            expanded = 0 if hit else sum(1 for d in dist if d < float('inf'))
+            self.last_stats = {"engine": self.mode, "expanded": expanded, "cache_hit": hit}
+            return self._walk(pred, target)
         if self.mode == "bmssp":
-            dist, pred, _ = bmssp_main(graph, source, mode="fast")
+            dist, pred, info = bmssp_main(graph, source, mode="fast", target=target, queue=self.queue)
+            expanded = info["bmssp_explored"] + info["repair_settled"]
+        elif self.mode == "bidirectional":
+            dist, pred, info = bmssp_main(graph, source, mode="bidirectional", target=target)
+            expanded = info["settled"]
+        elif self.mode == "astar":
+            h = self.heuristic or grid_heuristic(graph)
+            dist, pred, info = astar(graph, source, target, h, self.astar_weight)
+            expanded = info["expanded"]
         else:
-            dist, pred = dijkstra(graph, source)
+            stats = {}
+            dist, pred = dijkstra(graph, source, target=target, stats=stats, queue=self.queue)
+            expanded = stats["settled"]
+        self.last_stats = {"engine": self.mode, "expanded": expanded}
+        return self._walk(pred, target)
 
+    @staticmethod
+    def _walk(pred, target):
+        # pred: dict (None = root) or cached array (-1 = root)
         path = []
         curr = target
-        while curr is not None:
+        while curr is not None and curr >= 0:
             path.append(curr)
             curr = pred[curr]
         return list(reversed(path))
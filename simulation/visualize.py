@@ -1,64 +1,168 @@
 # simulation/visualize.py
+"""
+Pygame view of the grid world with dynamic obstacles and a replanning robot.
 
-import pygame
+GridRenderer keeps the free / blocked cells on a cached background surface. Per tick it
+redraws only the cells that changed (new obstacles, cells entering or leaving the path)
+and hands just those rects to display.update, instead of 2,500 draw.rect calls per frame.
+The window loop runs on a fixed tick (--fps).
+
+--headless uses SDL's dummy video driver and no frame cap: the loop runs at full speed and
+reports planning vs rendering time per tick, so the planner's own cost is visible.
+
+    python -m simulation.visualize
+    python -m simulation.visualize --headless --ticks 5000 --mode bmssp
+"""
+
+import argparse
+import os
 import random
+import time
+
+import pygame
+
+from core.wire import changed_cells, pack_bits
 from simulation.grid_world import GridWorld
 from simulation.robot_sim import Robot
-from core.graph import Graph
 
-pygame.init()
-size = 15
-world_size = 50
+FREE = (255, 255, 255)
+BLOCKED = (0, 0, 0)
+PATH = (0, 0, 255)
+
+
+class GridRenderer:
+    """Incremental renderer of world.occupancy (row-major, size x size) plus a path."""
+
+    def __init__(self, surface, world: GridWorld, cell: int):
+        self.surface = surface
+        self.world = world
+        self.cell = cell
+        self.shown = bytes(world.occupancy)     # occupancy the background currently shows
+        self.path = set()                       # cells currently drawn as path
+        self.background = pygame.Surface(surface.get_size())
+        self.background.fill(BLOCKED)
+        for node, blocked in enumerate(self.shown):
+            self.background.fill(BLOCKED if blocked else FREE, self._rect(node))
+        surface.blit(self.background, (0, 0))
+        self._full = True                       # first present() flips the whole window
+
+    def _rect(self, node):
+        r, c = divmod(node, self.world.size)
+        return pygame.Rect(c * self.cell, r * self.cell, self.cell - 1, self.cell - 1)
+
+    def update(self, path):
+        """Bring the window surface up to date; returns the rects that changed."""
+        dirty = {}
+        occ = self.world.occupancy
+        if occ != self.shown:
+            # bit-packed diff, no Python loop over unchanged cells
+            for node in changed_cells(pack_bits(self.shown), pack_bits(occ)):
+                rect = self._rect(node)
+                self.background.fill(BLOCKED if occ[node] else FREE, rect)
+                dirty[node] = rect
+            self.shown = bytes(occ)
+        new_path = set(path)
+        for node in self.path ^ new_path:
+            dirty.setdefault(node, self._rect(node))
+        self.path = new_path
+        for node, rect in dirty.items():
+            if node in new_path:
+                self.surface.fill(PATH, rect)
+            else:
+                self.surface.blit(self.background, rect, rect)
+        return list(dirty.values())
+
+    def present(self, dirty):
+        if self._full:
+            pygame.display.flip()
+            self._full = False
+        elif dirty:
+            pygame.display.update(dirty)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BMSSP robotics simulation")
+    parser.add_argument("--size", type=int, default=50, help="cells per side")
+    parser.add_argument("--cell", type=int, default=15, help="pixels per cell")
+    parser.add_argument("--fps", type=int, default=30, help="tick rate of the window loop")
+    parser.add_argument("--mode", type=str, default="dstar",
+                        help="planner: dstar, bmssp, dijkstra, astar, bidirectional, hpa")
+    parser.add_argument("--obstacle-rate", type=float, default=0.01,
+                        help="chance per tick of a new dynamic obstacle")
+    parser.add_argument("--headless", action="store_true",
+                        help="SDL dummy video driver, no frame cap, print timings")
+    parser.add_argument("--ticks", type=int, default=None, help="stop after this many ticks")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
 
-win = pygame.display.set_mode((world_size * size, world_size * size))
-pygame.display.set_caption("BMSSP Robotics Simulation")
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        if args.ticks is None:
+            args.ticks = 2000
+    if args.seed is not None:
+        random.seed(args.seed)
 
-world = GridWorld(world_size)
-world.randomize_obstacles()
+    pygame.init()
+    world_size = args.size
+    win = pygame.display.set_mode((world_size * args.cell, world_size * args.cell))
+    pygame.display.set_caption("BMSSP Robotics Simulation")
 
-# build graph from grid
-total_nodes = world_size * world_size
-graph = Graph(total_nodes)
+    world = GridWorld(world_size)
+    world.randomize_obstacles()
 
-for i in range(world_size):
-    for j in range(world_size):
-        if world.is_free(i, j):
-            node = i * world_size + j
-            for dx, dy in [(1,0),(0,1),(-1,0),(0,-1)]:
-                nx, ny = i + dx, j + dy
-                if world.is_free(nx, ny):
-                    graph.add_edge(node, nx * world_size + ny, 1)
+    # implicit grid graph: neighbours come from the occupancy bitmap, no adjacency list
+    graph = world.to_graph()
 
-robot = Robot(world)
+    # D* Lite keeps its search between ticks: a new obstacle only repairs the affected subtree
+    robot = Robot(world, mode=args.mode)
 
-running = True
-path = robot.calculate_path(graph, 0, (world_size**2)-1)
+    goal = (world_size**2)-1
+    t0 = time.perf_counter()
+    path = robot.calculate_path(graph, 0, goal)
+    plan_time = time.perf_counter() - t0
+    render_time = 0.0
+    replans = 0
+    redrawn = 0
 
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+    renderer = GridRenderer(win, world, args.cell)
+    clock = pygame.time.Clock()
+    tick = 0
+    running = True
+    start = time.perf_counter()
+    while running and (args.ticks is None or tick < args.ticks):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
 
-    # introduce dynamic obstacles
-    if random.random() < 0.01:
-        x, y = random.randint(0,49), random.randint(0,49)
-        world.add_dynamic_obstacle(x, y)
+        # introduce dynamic obstacles
+        t0 = time.perf_counter()
+        if random.random() < args.obstacle_rate:
+            x, y = random.randint(0, world_size - 1), random.randint(0, world_size - 1)
+            if world.add_dynamic_obstacle(x, y):
+                robot.block_cell(graph, x * world_size + y)
+                path = robot.calculate_path(graph, 0, goal)
+                replans += 1
+        t1 = time.perf_counter()
 
-    win.fill((0,0,0))
+        dirty = renderer.update(path)
+        renderer.present(dirty)
+        t2 = time.perf_counter()
 
-    # draw grid + obstacles
-    for i in range(world_size):
-        for j in range(world_size):
-            color = (255,255,255)
-            if world.grid[i][j] == 1:
-                color = (0,0,0)
-            pygame.draw.rect(win, color, (j * size, i * size, size-1, size-1))
+        plan_time += t1 - t0
+        render_time += t2 - t1
+        redrawn += len(dirty)
+        tick += 1
+        if not args.headless:
+            clock.tick(args.fps)
+    elapsed = time.perf_counter() - start
 
-    # draw path
-    for node in path:
-        px, py = node // world_size, node % world_size
-        pygame.draw.rect(win, (0,0,255), (py * size, px * size, size-1, size-1))
+    pygame.quit()
+    if args.headless and tick:
+        print(f"{tick} ticks in {elapsed:.2f}s ({tick / elapsed:.0f} ticks/s), {replans} replans "
+              f"({args.mode})")
+        print(f"  per tick: planning {plan_time / tick * 1e3:.3f}ms, rendering "
+              f"{render_time / tick * 1e3:.3f}ms, {redrawn / tick:.2f} cells redrawn")
 
-    pygame.display.update()
 
-pygame.quit()
+if __name__ == "__main__":
+    main()
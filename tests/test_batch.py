@@ -0,0 +1,76 @@
+import random
+from core.graph import Graph
+from algorithms.dijkstra import dijkstra
+from algorithms.batch import batch_sssp, distance_matrix
+from algorithms.bmssp import run_bmssp
+from algorithms.delta_stepping import delta_stepping
+from algorithms.parallel import MIN_BATCH, WorkerPool
+
+
+def _random_graph(n=200, seed=11):
+    random.seed(seed)
+    edges = [(u, random.randrange(n), random.uniform(1.0, 10.0)) for u in range(n) for _ in range(3)]
+    return Graph.from_edge_list(n, edges)
+
+
+def test_batch_sssp_matches_dijkstra_across_workers():
+    g = _random_graph()
+    sources = [0, 5, 17, 42]
+    for workers in (1, 2):
+        seen = set()
+        for s, dist, pred in batch_sssp(g, sources, engine="bmssp", workers=workers):
+            ref, _ = dijkstra(g, s)
+            assert list(dist) == [ref[v] for v in g.nodes]
+            assert pred[s] == -1
+            seen.add(s)
+        assert seen == set(sources)
+
+
+def test_distance_matrix_rows_follow_sources():
+    g = _random_graph()
+    sources, targets = [3, 1], [0, 7, 99]
+    rows = distance_matrix(g, sources, targets, engine="dijkstra", workers=2)
+    for s, row in zip(sources, rows):
+        ref, _ = dijkstra(g, s)
+        assert list(row) == [ref[t] for t in targets]
+
+    # repeated sources: every row is filled, each with its own array
+    for workers in (1, 2):
+        rows = distance_matrix(g, [0, 5, 0], [2, 9], engine="dijkstra", workers=workers)
+        ref, _ = dijkstra(g, 0)
+        assert list(rows[0]) == list(rows[2]) == [ref[2], ref[9]] and rows[0] is not rows[2]
+        assert rows[1] is not None
+
+
+def test_delta_stepping_matches_dijkstra():
+    g = _random_graph()
+    ref, _ = dijkstra(g, 0)
+    for delta in (None, 0.5, 4.0, 100.0):
+        dist, pred = delta_stepping(g, 0, delta)
+        assert list(dist) == [ref[v] for v in g.nodes]
+        assert pred[0] == -1
+
+
+def test_worker_pool_delta_stepping_and_parallel_base_case():
+    g = _random_graph(n=400)
+    ref, _ = dijkstra(g, 0)
+    with WorkerPool(g, workers=2, min_batch=2) as pool:
+        dist, _ = delta_stepping(g, 0, pool=pool)
+        assert list(dist) == [ref[v] for v in g.nodes]
+        for mode in ("safe", "fast"):
+            state, info = run_bmssp(g, 0, mode=mode, pool=pool, k=2, t=2, L=6, profile=True)
+            assert info["profile"]["counters"]["parallel_base_cases"] > 0
+            assert list(state.dist) == [ref[v] for v in g.nodes]
+
+    # zero-weight edges: multi-seed base cases whose U reached past B' used to spin forever
+    for n, seed, min_batch, params in ((400, 3, 2, dict(k=2, t=2, L=6)), (3000, 1, MIN_BATCH, {})):
+        rng = random.Random(seed)
+        g = Graph.from_edge_list(n, [(u, rng.randrange(n), rng.randint(0, 5))
+                                     for u in range(n) for _ in range(3)])
+        ref, _ = dijkstra(g, 0)
+        with WorkerPool(g, workers=2, min_batch=min_batch) as pool:
+            for mode in ("safe", "fast"):
+                state, info = run_bmssp(g, 0, mode=mode, pool=pool, profile=True, **params)
+                assert list(state.dist) == [ref[v] for v in g.nodes]
+                if min_batch == 2:
+                    assert info["profile"]["counters"]["parallel_base_cases"] > 0
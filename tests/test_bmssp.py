@@ -24,3 +24,194 @@ def test_bmssp_matches_dijkstra():
         a = dist_dij[v]
         b = dist_bm[v]
         assert abs(a - b) < 1e-9
+
+def test_bmssp_fast_mode_repairs_from_seeds():
+    import random
+    random.seed(7)
+    n = 300
+    edges = [(u, random.randrange(n), random.uniform(1.0, 10.0)) for u in range(n) for _ in range(3)]
+    g = Graph.from_edge_list(n, edges)
+    dist_dij, _ = dijkstra(g, 0)
+    dist_bm, pred, info = bmssp_main(g, 0, mode="fast")
+    assert info["mode"] == "fast"
+    assert info["repair_settled"] <= n
+    for v in g.nodes:
+        assert dist_bm[v] == pytest.approx(dist_dij[v])
+        if v != 0 and dist_bm[v] < float('inf'):
+            u = pred[v]
+            assert any(x == v and dist_bm[u] + w == pytest.approx(dist_bm[v]) for x, w in g.get_neighbors(u))
+
+def test_verify_sssp_certificate():
+    from algorithms.verify import verify_sssp
+    g = make_small_graph()
+    dist, prev = dijkstra(g, 0)
+    assert verify_sssp(g, 0, dist, prev) == (True, set(), set())
+
+    # stale label: edge 1->2 can still improve node 2
+    bad = dict(dist)
+    bad[2] = 5.0
+    ok, unrelaxed, broken = verify_sssp(g, 0, bad, prev)
+    # 0 -> 2 and 1 -> 2 can lower 2; 2 -> 3 is loose below it: all repairable, none broken
+    assert not ok and unrelaxed == {0, 1, 2} and broken == set()
+
+    # parallel edges: the heavier copy of the tight predecessor edge is not a violation
+    gp = Graph.from_edge_list(3, [(0, 1, 1.0), (0, 1, 5.0), (1, 2, 1.0)])
+    dp, pp = dijkstra(gp, 0)
+    assert verify_sssp(gp, 0, dp, pp) == (True, set(), set())
+
+    # predecessor that is not an in-neighbour: broken
+    wrong = dict(prev)
+    wrong[3] = 0
+    ok, unrelaxed, broken = verify_sssp(g, 0, dist, wrong)
+    assert not ok and unrelaxed == set() and broken == {3}
+
+    # predecessor cycle between 2 and 3 (zero-weight edges keep it tight)
+    g0 = Graph.from_edge_list(4, [(0, 1, 1.0), (1, 2, 0.0), (2, 3, 0.0), (3, 2, 0.0)])
+    dist, prev = dijkstra(g0, 0)
+    prev[2], prev[3] = 3, 2
+    ok, unrelaxed, broken = verify_sssp(g0, 0, dist, prev)
+    assert not ok and broken == {2, 3}
+
+def test_run_bmssp_array_state():
+    from algorithms.bmssp import run_bmssp
+    from algorithms.verify import verify_sssp
+    g = make_small_graph()
+    state, info = run_bmssp(g, 0, mode="fast")
+    assert list(state.dist) == [0.0, 1.0, 3.0, 4.0]
+    assert list(state.pred) == [-1, 0, 1, 2]
+    assert verify_sssp(g, 0, state.dist, state.pred)[0]
+
+    marks, gen = state.stamp("test")
+    marks[2] = gen
+    marks2, gen2 = state.stamp("test")
+    assert marks2 is marks and marks[2] != gen2
+
+def test_point_to_point_queries():
+    from algorithms.dijkstra import bidirectional_dijkstra
+    g = Graph(400)
+    for r in range(20):
+        for c in range(20):
+            i = r * 20 + c
+            if c < 19:
+                g.add_edge(i, i + 1)
+            if r < 19:
+                g.add_edge(i, i + 20)
+    src, dst = 210, 214
+    full, _ = dijkstra(g, src)
+    stats = {}
+    dist, prev = dijkstra(g, src, target=dst, stats=stats)
+    assert dist[dst] == full[dst] == 4
+    assert stats["settled"] < 100
+
+    for mode in ("fast", "safe", "bidirectional"):
+        dist, pred, info = bmssp_main(g, src, mode=mode, target=dst)
+        assert dist[dst] == 4
+        path = [dst]
+        while pred[path[-1]] is not None:
+            path.append(pred[path[-1]])
+        assert path[-1] == src and len(path) == 5
+
+    # the driver completes a near target itself: no repair after it
+    from algorithms.bmssp import run_bmssp
+    chain = Graph.from_edge_list(30, [(i, i + 1, 1.0 + i % 3) for i in range(29)])
+    state, info = run_bmssp(chain, 0, mode="safe", target=3)
+    assert state.dist[3] == 6.0 and info["repair_settled"] == 0
+
+    dist, pred, info = bidirectional_dijkstra(g, src, dst)
+    assert info["distance"] == 4 and info["settled"] < stats["settled"]
+
+def test_bmssp_profile_counters():
+    from algorithms.instrument import Profiler
+    g = make_small_graph()
+    seen = []
+    prof = Profiler(callback=lambda phase, seconds: seen.append(phase))
+    dist_bm, _, info = bmssp_main(g, 0, mode="safe", profile=prof)
+    assert dist_bm[3] == pytest.approx(4.0)
+    counters = info["profile"]["counters"]
+    assert counters["relaxations"] >= 3
+    assert counters["recursion_calls"] >= 1 and counters["recursion_depth"] >= 1
+    assert {"recursion", "verify", "repair"} <= set(info["profile"]["phases"])
+    assert "repair" in seen
+    assert "profile" not in bmssp_main(g, 0)[2]
+
+def test_bmssp_numpy_backend_matches_scalar(monkeypatch):
+    pytest.importorskip("numpy")
+    import random
+    from algorithms import vectorized
+    from algorithms.bmssp import run_bmssp
+    monkeypatch.setattr(vectorized, "MIN_FRONTIER", 1)  # force the batched path on a small graph
+    random.seed(11)
+    n = 400
+    edges = [(u, random.randrange(n), random.uniform(1.0, 10.0)) for u in range(n) for _ in range(3)]
+    g = Graph.from_edge_list(n, edges)
+    for mode in ("safe", "fast"):
+        vec, info = run_bmssp(g, 0, mode, backend="numpy")
+        ref, _ = run_bmssp(g, 0, mode, backend="python")
+        assert info["backend"] == "numpy"
+        assert list(vec.dist) == list(ref.dist)
+
+def test_iterative_driver_deep_levels_and_zero_weights():
+    import random
+    from algorithms.bmssp import run_bmssp
+    rng = random.Random(11)
+    n = 400
+    edges = [(u, rng.randrange(n), rng.choice([0.0, 1.0, 2.0, rng.uniform(0, 5)]))
+             for u in range(n) for _ in range(3)]
+    g = Graph.from_edge_list(n, edges)
+    dist_dij, _ = dijkstra(g, 0)
+    for mode in ("safe", "fast"):
+        for k, t, L in ((1, 1, 40), (8, 4, 6), (2, 1, 12)):
+            state, info = run_bmssp(g, 0, mode=mode, k=k, t=t, L=L)
+            assert (info["k"], info["t"], info["Bmssp_level"]) == (k, t, L)
+            for v in g.nodes:
+                assert state.dist[v] == pytest.approx(dist_dij[v])
+
+def test_autotune_persists_profile(tmp_path):
+    import random
+    from algorithms.autotune import autotune, bmssp_tuned, load_profiles
+    rng = random.Random(5)
+    n = 200
+    edges = [(u, rng.randrange(n), rng.uniform(1.0, 10.0)) for u in range(n) for _ in range(3)]
+    g = Graph.from_edge_list(n, edges)
+    path = tmp_path / "profiles.json"
+    best = autotune(g, family="test", sources=2, params=[(1, 1, 3), (2, 2, 2)], path=str(path))
+    assert (best["k"], best["t"], best["L"]) in ((1, 1, 3), (2, 2, 2))
+    assert load_profiles(str(path))[best["signature"]]["mode"] == best["mode"]
+    state, info = bmssp_tuned(g, 0, family="test", path=str(path))
+    assert (info["k"], info["mode"]) == (best["k"], best["mode"])
+    dist_dij, _ = dijkstra(g, 0)
+    for v in g.nodes:
+        assert state.dist[v] == pytest.approx(dist_dij[v])
+
+    # CSR graphs hand out lazy neighbour iterables: dead ends must still be skipped
+    from algorithms.autotune import _pick_sources
+    star = Graph.from_edge_list(50, [(7, v, 1.0) for v in range(50) if v != 7])
+    assert _pick_sources(star, 3, random.Random(1)) == [7]
+
+    # the mutable Graph: no num_edges, undirected
+    from algorithms.autotune import graph_signature
+    mg = Graph(40)
+    for u in range(40):
+        mg.add_edge(u, (u + 1) % 40, 2)
+        mg.add_edge(u, (u * 7) % 40, 3)
+    assert graph_signature(mg, "ring") == "ring/u/int/deg4/n2^5"
+    best = autotune(mg, family="ring", sources=2, params=[(1, 1, 3)], path=str(path))
+    state, info = bmssp_tuned(mg, 0, family="ring", path=str(path))
+    assert info["k"] == best["k"] == 1
+    dist_dij, _ = dijkstra(mg, 0)
+    assert all(state.dist[v] == dist_dij[v] for v in mg.nodes)
+
+def test_safe_mode_rechecks_its_repair(monkeypatch):
+    import random
+    import algorithms.bmssp as bm
+    rng = random.Random(11)
+    n = 400
+    edges = [(u, rng.randrange(n), rng.choice([0.0, 1.0, 2.0])) for u in range(n) for _ in range(3)]
+    g = Graph.from_edge_list(n, edges)
+    dist_dij, _ = dijkstra(g, 0)
+    # a repair that fixes nothing: only the second certificate check can catch it
+    monkeypatch.setattr(bm, "_seeded_multi_source_dijkstra", lambda *a, **kw: 0)
+    state, info = bm.run_bmssp(g, 0, mode="safe", k=1, t=1, L=40)
+    assert info["violations"] > 0
+    for v in g.nodes:
+        assert state.dist[v] == pytest.approx(dist_dij[v])
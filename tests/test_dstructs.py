@@ -0,0 +1,33 @@
+import random
+from algorithms.dstructs import PartialSortingDS
+
+
+def test_pull_returns_smallest_and_separator():
+    random.seed(3)
+    D = PartialSortingDS(4, 100.0)
+    model = {}
+    for key in range(50):
+        v = float(random.randint(10, 90))
+        D.insert((key, v))
+        model[key] = v
+    D.insert((7, 1.0))          # improvement supersedes the old entry lazily
+    model[7] = 1.0
+    D.batch_prepend([(60, 0.5), (61, 2.0), (7, 5.0)])
+    model[60], model[61] = 0.5, 2.0
+
+    while not D.is_empty():
+        keys, sep = D.pull()
+        expected = sorted(model.values())[:len(keys)]
+        assert len(keys) == min(4, len(model))
+        assert sorted(model.pop(k) for k in keys) == expected
+        assert sep == (min(model.values()) if model else 100.0)
+    assert D.pull() == ([], 100.0)
+
+
+def test_blocks_split_at_M():
+    D = PartialSortingDS(3, 100.0)
+    for key in range(30):
+        D.insert((key, float(30 - key)))
+    assert len(D.D1) > 1
+    assert D.D1_bounds == sorted(D.D1_bounds)
+    assert all(len(blk.items) <= 3 for blk in D.D1)
@@ -0,0 +1,124 @@
+from core.graph import Graph, CSRGraph
+from algorithms.dijkstra import dijkstra
+
+
+def test_from_edge_list_builds_csr():
+    edges = [(0, 1, 1.0), (0, 2, 4.0), (1, 2, 2.0), (2, 3, 1.0)]
+    g = Graph.from_edge_list(4, edges)
+    assert isinstance(g, CSRGraph)
+    assert g.num_edges == 4
+    assert sorted(g.get_neighbors(0)) == [(1, 1.0), (2, 4.0)]
+    start, end = g.edge_range(2)
+    assert list(g.targets[start:end]) == [3]
+    assert list(g.get_neighbors(3)) == []
+
+
+def test_csr_matches_adjacency_graph():
+    g = Graph(5)
+    for u, v, w in [(0, 1, 2), (1, 2, 1), (0, 3, 5), (3, 4, 1), (4, 2, 1)]:
+        g.add_edge(u, v, w)
+    csr = g.to_csr()
+    assert csr.num_edges == 10
+    assert dijkstra(g, 0)[0] == dijkstra(csr, 0)[0]
+    assert sorted(csr.reversed().get_neighbors(2)) == sorted(csr.get_neighbors(2))
+
+
+def test_remove_and_block_bump_version():
+    g = Graph(4)
+    g.add_edge(0, 1)
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    g.add_edge(0, 3, 5)
+    v0 = g.version
+
+    g.block_node(1)
+    assert g.get_neighbors(0) == [(3, 5)]
+    assert g.get_neighbors(1) == []
+    assert dijkstra(g, 0)[0][2] == 6
+    g.unblock_node(1)
+    g.block_edge(2, 3)
+    assert g.get_neighbors(3) == [(0, 5)]
+    g.unblock_edge(3, 2)
+    assert dijkstra(g, 0)[0][2] == 2
+
+    g.remove_node(2)
+    assert 2 not in g.nodes
+    assert g.get_neighbors(1) == [(0, 1)] and g.get_neighbors(3) == [(0, 5)]
+    g.remove_edge(0, 3)
+    assert g.get_neighbors(3) == []
+    assert g.version == v0 + 6
+
+
+def test_grid_graph_implicit_neighbors():
+    from core.grid_graph import GridGraph, random_occupancy
+    # 3x3, centre blocked
+    occ = bytearray(9)
+    occ[4] = 1
+    g4 = GridGraph(3, 3, occ)
+    assert sorted(g4.get_neighbors(1)) == [(0, 1.0), (2, 1.0)]
+    assert g4.get_neighbors(4) == []
+    assert dijkstra(g4, 0)[0][8] == 4.0
+
+    g8 = GridGraph(3, 3, bytearray(9), connectivity=8)
+    assert len(g8.get_neighbors(4)) == 8
+    assert abs(dijkstra(g8, 0)[0][8] - 2 * 2 ** 0.5) < 1e-9
+    g8.block_node(1)     # diagonal 0 -> 4 would cut the corner of blocked cell 1
+    assert [v for v, _ in g8.get_neighbors(0)] == [3]
+    assert g8.version == 1
+
+    csr = GridGraph(3, 3, occ).to_csr()
+    assert dijkstra(csr, 0)[0] == dijkstra(g4, 0)[0]
+
+    import random
+    occ = random_occupancy(10000, 0.25, random.Random(1))
+    assert len(occ) == 10000 and set(occ) <= {0, 1}
+    assert 0.2 < sum(occ) / 10000 < 0.3
+
+
+def test_graph_io_roundtrip(tmp_path):
+    from core.graph_io import save_csr, load_csr, read_dimacs, read_edge_list
+    g = Graph.from_edge_list(4, [(0, 1, 1.0), (0, 2, 4.0), (1, 2, 2.0), (2, 3, 1.5)])
+    save_csr(g, tmp_path / "g.csr")
+    for use_mmap in (True, False):
+        h = load_csr(tmp_path / "g.csr", use_mmap=use_mmap)
+        assert h.directed and h.num_edges == 4
+        assert dijkstra(h, 0)[0] == dijkstra(g, 0)[0]
+
+    gr = tmp_path / "g.gr"
+    gr.write_text("c tiny\np sp 4 4\na 1 2 1\na 1 3 4\na 2 3 2\na 3 4 1.5\n")
+    assert dijkstra(read_dimacs(gr), 0)[0] == dijkstra(g, 0)[0]
+
+    el = tmp_path / "g.txt"
+    el.write_text("# u v w\n0 1\n1 2 3.0\n")
+    u = read_edge_list(el, directed=False)
+    assert u.num_nodes == 3 and sorted(u.get_neighbors(1)) == [(0, 1.0), (2, 3.0)]
+
+def test_wire_grid_frames_and_path_roundtrip():
+    import random
+    import pytest
+    from core.wire import GridDecoder, GridEncoder, decode_path, encode_path, pack_bits, unpack_bits
+    rng = random.Random(9)
+    rows, cols = 13, 11
+    occ = bytearray(1 if rng.random() < 0.3 else 0 for _ in range(rows * cols))
+    assert unpack_bits(pack_bits(occ), len(occ)) == occ
+    assert len(pack_bits(occ)) == (rows * cols + 7) // 8
+
+    enc, dec = GridEncoder(rows, cols), GridDecoder()
+    first = enc.encode(occ)
+    assert dec.decode(first) == occ
+    for _ in range(3):
+        flips = [rng.randrange(rows * cols) for _ in range(2)]
+        for v in flips:
+            occ[v] ^= 1
+        frame = enc.encode_changes(flips) if flips[0] % 2 else enc.encode(occ)
+        assert len(frame) < len(first)              # deltas, not full frames
+        assert dec.decode(frame) == occ
+    # block then unblock of the same cell cancels out; a third event flips it again
+    for v in (5, 5, 7, 9, 7, 7):
+        occ[v] ^= 1
+    assert dec.decode(enc.encode_changes([5, 5, 7, 9, 7, 7])) == occ
+    with pytest.raises(ValueError):
+        GridDecoder().decode(frame)                 # a delta needs the previous frame
+
+    path = [0, 1, 12, 23, 22, 33, 44, 45]
+    assert decode_path(encode_path(path)) == path
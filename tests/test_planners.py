@@ -0,0 +1,253 @@
+import random
+from simulation.grid_world import generate_grid_graph
+from simulation.robot_sim import Robot
+from algorithms.dijkstra import dijkstra
+from algorithms.astar import astar, grid_heuristic, octile
+
+
+def test_astar_matches_dijkstra_on_grid():
+    random.seed(5)
+    graph, _ = generate_grid_graph(30, 30, obstacle_prob=0.2)
+    goal = 30 * 30 - 1
+    ref, _ = dijkstra(graph, 0)
+    dist, pred, info = astar(graph, 0, goal, grid_heuristic(graph))
+    assert dist[goal] == ref[goal]
+    stats = {}
+    dijkstra(graph, 0, target=goal, stats=stats)
+    assert info["expanded"] <= stats["settled"]
+
+    # weighted A* stays within its bound
+    dist_w, _, _ = astar(graph, 0, goal, grid_heuristic(graph), weight=2.0)
+    assert ref[goal] <= dist_w[goal] <= 2.0 * ref[goal]
+
+
+def test_robot_astar_mode_reports_expansions():
+    graph, _ = generate_grid_graph(20, 20, obstacle_prob=0.0)
+    robot = Robot(None, mode="astar")
+    path = robot.calculate_path(graph, 0, 399)
+    assert path[0] == 0 and path[-1] == 399 and len(path) == 39
+    assert robot.last_stats == {"engine": "astar", "expanded": 39}
+    assert octile(20)(0, 21) < 2
+
+
+def test_dstar_lite_replans_incrementally():
+    graph, _ = generate_grid_graph(30, 30, obstacle_prob=0.0)
+    goal = 30 * 30 - 1
+    robot = Robot(None, mode="dstar")
+    path = robot.calculate_path(graph, 0, goal)
+    assert len(path) == 59
+    first = robot.last_stats["expanded"]
+
+    # wall across column 15 with a single gap at the bottom row
+    for r in range(29):
+        robot.block_cell(graph, r * 30 + 15)
+    path = robot.calculate_path(graph, 0, goal)
+    assert len(path) == 59 and all(p % 30 != 15 or p // 30 == 29 for p in path)
+
+    # a small change far from the path is cheap to absorb
+    robot.block_cell(graph, 5 * 30 + 2)
+    path2 = robot.calculate_path(graph, 0, goal)
+    assert len(path2) == 59
+    assert robot.last_stats["expanded"] < first
+
+
+def test_spt_cache_hits_and_invalidates_on_mutation():
+    from algorithms.cache import SPTCache
+    graph, _ = generate_grid_graph(10, 10, obstacle_prob=0.0)
+    cache = SPTCache(maxsize=2)
+    robot = Robot(None, mode="dijkstra", cache=cache)
+    assert len(robot.calculate_path(graph, 0, 99)) == 19
+    assert len(robot.calculate_path(graph, 0, 55)) == 11      # same source: reuses the tree
+    assert robot.last_stats["cache_hit"] and cache.hits == 1 and cache.misses == 1
+
+    graph.block_node(1)
+    graph.block_node(10)
+    assert robot.calculate_path(graph, 0, 99) == [99]         # cut off: tree recomputed
+    assert cache.invalidations == 1 and cache.misses == 2
+
+    robot.calculate_path(graph, 5, 99)
+    robot.calculate_path(graph, 6, 99)
+    assert len(cache) == 2 and cache.evictions == 1
+
+
+def test_async_bridge_follows_path_on_mock_sim():
+    import asyncio
+    import json
+    from coppeliasim_integration.async_bridge import AsyncPioneer
+    from coppeliasim_integration.mock_sim import MockSim
+    graph, obstacles = generate_grid_graph(8, 8, obstacle_prob=0.0)
+    goal = 8 * 8 - 1
+    sim = MockSim(latency=0.002)
+    bridge = AsyncPioneer(sim, graph, list(obstacles), 8, step_time=0.001)
+
+    async def run():
+        task = asyncio.ensure_future(bridge.follow(0, goal))
+        while sim.calls["setObjectPosition"] < 2:
+            await asyncio.sleep(0.001)
+        bridge.block_cell(goal - 1)     # replanned while moving
+        return await task
+
+    stats = asyncio.run(run())
+    bridge.close()
+    assert stats["reached"] and stats["replans"] >= 1
+    assert sim.positions[1][:2] == bridge.position(goal)[:2]
+    assert goal - 1 not in json.loads(sim.signals["path"])
+    # positions faster than the link are coalesced, never queued
+    assert stats["positions_sent"] < stats["positions_submitted"]
+
+
+def test_async_bridge_surfaces_sim_failures():
+    import asyncio
+    import pytest
+    from coppeliasim_integration.async_bridge import AsyncPioneer
+    from coppeliasim_integration.mock_sim import MockSim
+
+    class DroppingSim(MockSim):
+        def setObjectPosition(self, handle, relative_to, position):
+            if self.calls["setObjectPosition"] >= 2:
+                raise RuntimeError("link dropped")
+            super().setObjectPosition(handle, relative_to, position)
+
+    graph, obstacles = generate_grid_graph(8, 8, obstacle_prob=0.0)
+    sim = DroppingSim(latency=0.001)
+    bridge = AsyncPioneer(sim, graph, list(obstacles), 8, step_time=0.001)
+    with pytest.raises(RuntimeError, match="link dropped"):
+        asyncio.run(asyncio.wait_for(bridge.follow(0, 63), timeout=10))
+    bridge.close()
+    assert sim.calls["setObjectPosition"] == 2
+
+def test_hpa_paths_and_local_rebuild():
+    from algorithms.hpa import HPAStar
+    from core.grid_graph import GridGraph
+    graph = GridGraph.random(40, 40, 0.2, keep_free=(0, 1599), rng=random.Random(3))
+    ref, _ = dijkstra(graph, 0)
+    hpa = HPAStar(graph, cluster_size=8)
+    assert hpa.clusters_built == 25
+    for t in (1599, 819, 45, 7):
+        path = hpa.find_path(0, t)
+        if ref[t] == float('inf'):
+            assert path == []
+            continue
+        assert path[0] == 0 and path[-1] == t
+        assert all(any(v == b for v, _ in graph.get_neighbors(a)) for a, b in zip(path, path[1:]))
+        assert ref[t] <= len(path) - 1 <= 1.25 * ref[t]
+
+    # an obstacle inside one cluster rebuilds that cluster only
+    robot = Robot(None, mode="hpa", hierarchy=hpa)
+    path = robot.calculate_path(graph, 0, 1599)
+    cell = next(v for v in path if v // 40 % 8 not in (0, 7) and v % 40 % 8 not in (0, 7))
+    built = hpa.clusters_built
+    robot.block_cell(graph, cell)
+    path = robot.calculate_path(graph, 0, 1599)
+    assert cell not in path and path[-1] == 1599
+    assert hpa.clusters_built == built + 1
+
+
+def test_alt_and_contraction_hierarchy_exact_and_serializable(tmp_path):
+    from algorithms.alt import Landmarks
+    from algorithms.ch import ContractionHierarchy
+    from benchmarks.generators import road_like, uniform_random
+    for graph in (road_like(400, 3, rng=random.Random(1)), uniform_random(150, 2, rng=random.Random(2))):
+        alt = Landmarks.build(graph, k=4, rng=random.Random(3))
+        ch = ContractionHierarchy.build(graph)
+        alt.save(tmp_path / "g.alt")
+        ch.save(tmp_path / "g.ch")
+        loaded = (Landmarks.load(tmp_path / "g.alt", graph), ContractionHierarchy.load(tmp_path / "g.ch", graph))
+        rng = random.Random(4)
+        for _ in range(15):
+            s, t = rng.randrange(graph.num_nodes), rng.randrange(graph.num_nodes)
+            ref, _ = dijkstra(graph, s)
+            for oracle in (alt, ch) + loaded:
+                d, path = oracle.query(s, t)
+                if ref[t] == float('inf'):
+                    assert (d, path) == (float('inf'), [])
+                    continue
+                assert abs(d - ref[t]) < 1e-9 and path[0] == s and path[-1] == t
+                cost = sum(min(w for v, w in graph.get_neighbors(a) if v == b) for a, b in zip(path, path[1:]))
+                assert abs(cost - d) < 1e-9
+
+
+def test_robot_oracle_falls_back_when_graph_changes():
+    from algorithms.ch import ContractionHierarchy
+    graph, _ = generate_grid_graph(12, 12, obstacle_prob=0.0)
+    robot = Robot(None, mode="dijkstra", oracle=ContractionHierarchy.build(graph))
+    assert len(robot.calculate_path(graph, 0, 143)) == 23
+    assert robot.last_stats["engine"] == "ch"
+    robot.block_cell(graph, 13)
+    assert len(robot.calculate_path(graph, 0, 143)) == 23
+    assert robot.last_stats["engine"] == "dijkstra"
+
+    # landmarks built around a blocked cell: unblocking it shortens paths, bounds go stale
+    from algorithms.alt import Landmarks
+    graph, _ = generate_grid_graph(12, 12, obstacle_prob=0.0)
+    for r in range(11):
+        graph.block_node(r * 12 + 6)
+    robot = Robot(None, mode="dijkstra", oracle=Landmarks.build(graph, k=4, rng=random.Random(1)))
+    assert len(robot.calculate_path(graph, 0, 5)) == 6
+    assert robot.last_stats["engine"] == "alt"
+    graph.unblock_node(6)
+    assert not robot.oracle.valid_for(graph)
+    assert len(robot.calculate_path(graph, 0, 11)) == 12
+    assert robot.last_stats["engine"] == "dijkstra"
+
+
+def test_dstar_lite_respects_corner_cutting_on_8_connected_grids():
+    import pytest
+    from core.grid_graph import GridGraph
+    from algorithms.incremental import DStarLite
+    rng = random.Random(2)
+    for trial in range(40):
+        graph = GridGraph.random(12, 12, 0.15, connectivity=8, keep_free=(0, 143), rng=rng)
+        planner = DStarLite(graph, 0, 143, grid_heuristic(graph))
+        planner.plan()
+        cells = [v for v in range(1, 143) if not graph.is_blocked(v)]
+        for v in rng.sample(cells, 4):
+            planner.block_node(v)       # before the graph, which drops v's corner diagonals
+            graph.block_node(v)
+        ref, _ = dijkstra(graph, 0)
+        path = planner.plan()
+        assert planner.distance() == pytest.approx(ref[143])
+        assert all(v in dict(graph.get_neighbors(u)) for u, v in zip(path, path[1:]))
+
+        v = rng.choice(sorted(planner.blocked))
+        graph.unblock_node(v)
+        planner.unblock_node(v)
+        ref, _ = dijkstra(graph, 0)
+        planner.plan()
+        assert planner.distance() == pytest.approx(ref[143])
+
+
+def test_grid_renderer_redraws_only_changed_cells(monkeypatch, capsys):
+    import pytest
+    pygame = pytest.importorskip("pygame")
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    from simulation.grid_world import GridWorld
+    from simulation.visualize import BLOCKED, FREE, PATH, GridRenderer, main
+
+    pygame.init()
+    try:
+        world = GridWorld(10)
+        surface = pygame.display.set_mode((10 * 4, 10 * 4))
+        renderer = GridRenderer(surface, world, 4)
+        renderer.present([])
+        assert renderer.update([]) == []                    # nothing changed, nothing redrawn
+
+        path = [0, 1, 2, 12, 22]
+        assert len(renderer.update(path)) == 5
+        assert surface.get_at((1, 1))[:3] == PATH
+        assert renderer.update(path) == []
+
+        world.add_dynamic_obstacle(5, 5)                    # off the path: one cell
+        dirty = renderer.update(path)
+        assert dirty == [renderer._rect(55)]
+        assert surface.get_at((5 * 4 + 1, 5 * 4 + 1))[:3] == BLOCKED
+
+        dirty = renderer.update([0, 10, 20, 21, 22])        # 1, 2, 12 leave, 10, 20, 21 join
+        assert len(dirty) == 6
+        assert surface.get_at((2 * 4 + 1, 1))[:3] == FREE
+        renderer.present(dirty)
+    finally:
+        pygame.quit()
+
+    main(["--headless", "--ticks", "30", "--size", "12", "--seed", "3", "--mode", "dijkstra"])
+    assert "30 ticks" in capsys.readouterr().out
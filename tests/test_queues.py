@@ -0,0 +1,79 @@
+# tests/test_queues.py
+import random
+import pytest
+from core.graph import Graph
+from core.grid_graph import GridGraph
+from algorithms.dijkstra import dijkstra
+from algorithms.bmssp import run_bmssp
+from algorithms.queues import select_queue
+
+def test_queue_kinds_match_heap():
+    rng = random.Random(3)
+    n = 300
+    g = Graph.from_edge_list(n, [(u, rng.randrange(n), rng.randint(1, 20)) for u in range(n) for _ in range(3)])
+    assert select_queue(g) == "dial" and select_queue(g, multi_source=True) == "radix"
+    ref, _ = dijkstra(g, 0)
+    for kind in ("dial", "radix", "auto"):
+        assert dijkstra(g, 0, queue=kind)[0] == ref
+    for kind in ("radix", "auto"):     # seeded repair: many sources, Dial / BFS not valid
+        state, _ = run_bmssp(g, 0, "fast", queue=kind)
+        assert list(state.dist) == [ref[v] for v in range(n)]
+
+    grid = GridGraph(20, 20)
+    assert select_queue(grid) == "bfs"
+    assert dijkstra(grid, 0, queue="auto")[0] == dijkstra(grid, 0)[0]
+
+    floats = Graph.from_edge_list(3, [(0, 1, 0.5), (1, 2, 1.5)])
+    assert select_queue(floats) == "heap"
+    with pytest.raises(ValueError):
+        dijkstra(floats, 0, queue="fibonacci")
+
+def test_dary_heap_decrease_key():
+    from algorithms.queues import DaryHeap
+    from algorithms.dijkstra import bidirectional_dijkstra
+    h = DaryHeap(6, arity=3)
+    for d, v in [(5.0, 0), (3.0, 1), (9.0, 2), (4.0, 3)]:
+        h.push((d, v))
+    h.push((1.0, 2))        # decrease-key in place
+    h.push((8.0, 1))        # larger key: ignored
+    assert len(h) == 4
+    assert [h.pop() for _ in range(4)] == [(1.0, 2), (3.0, 1), (4.0, 3), (5.0, 0)]
+    with pytest.raises(IndexError):
+        h.pop()
+
+    rng = random.Random(5)
+    n = 200
+    g = Graph.from_edge_list(n, [(u, rng.randrange(n), rng.uniform(1, 5)) for u in range(n) for _ in range(4)])
+    ref, _ = dijkstra(g, 0)
+    assert dijkstra(g, 0, queue="dary")[0] == ref
+    assert bidirectional_dijkstra(g, 0, 7, queue="dary")[2]["distance"] == pytest.approx(ref[7])
+
+def test_queues_pop_in_key_order_and_stop_at_target():
+    from algorithms.queues import make_queue
+    from algorithms.dijkstra import bidirectional_dijkstra
+    rng = random.Random(9)
+    n = 60
+    g = Graph.from_edge_list(n, [(u, rng.randrange(n), rng.randint(1, 6)) for u in range(n) for _ in range(3)])
+    for kind in ("heap", "dial", "radix", "dary"):
+        q = make_queue(kind, g)
+        q.push((0, 0))
+        assert q.pop() == (0, 0)
+        q.push((3, 3))      # queue was empty: a later, smaller key must still come first
+        q.push((2, 1))
+        q.push((5, 2))
+        assert [q.pop() for _ in range(3)] == [(2, 1), (3, 3), (5, 2)]
+
+    small = Graph.from_edge_list(4, [(0, 3, 3), (0, 2, 1), (2, 3, 1)])
+    for kind in (None, "dial", "radix", "dary", "auto"):
+        assert dijkstra(small, 0, target=3, queue=kind)[0][3] == 2
+        assert bidirectional_dijkstra(small, 0, 3, queue=kind)[2]["distance"] == 2
+
+    for seed in range(20):
+        rng = random.Random(seed)
+        g = Graph.from_edge_list(n, [(u, rng.randrange(n), rng.randint(1, 6))
+                                     for u in range(n) for _ in range(3)])
+        ref, _ = dijkstra(g, 0)
+        t = rng.randrange(n)
+        for kind in ("dial", "radix", "dary", "auto"):
+            assert dijkstra(g, 0, target=t, queue=kind)[0][t] == ref[t]
+            assert bidirectional_dijkstra(g, 0, t, queue=kind)[2]["distance"] == ref[t]